@@ -31,18 +31,20 @@
 from PyQt5 import QtCore, QtGui, QtWidgets
 from datetime import datetime, date
 from functools import partial
-from copy import deepcopy
 from convert import ConvertDialog
 from about import AboutDialog
 from analyze import AnalyzeDialog
 from generate import GenerateDialog
 from settings import SettingsDialog
+import multiprocessing
 import sys
 import meta
 import json
 import parse
-import random
+import generator
+import presets
 import widget_helpers
+import zeds
 
 #import threading
 #import cgitb 
@@ -61,59 +63,6 @@ _WINDOWSIZE_MAIN_W = 1000 # Width of the main window
 _WINDOWSIZE_MAIN_H = 1050 # Height of the main window
 
 
-# IDs for all the zeds
-zed_ids = {'Cyst': 'CY',
-           'Alpha Clot': 'AL',
-           'Slasher': 'SL',
-           'Rioter': 'AL*',
-           'Gorefast': 'GF',
-           'Gorefiend': 'GF*',
-           'Crawler': 'CR',
-           'Elite Crawler': 'CR*',
-           'Stalker': 'ST',
-           'Bloat': 'BL',
-           'Husk': 'HU',
-           'Siren': 'SI',
-           'E.D.A.R Trapper': 'DE',
-           'E.D.A.R Blaster': 'DL',
-           'E.D.A.R Bomber': 'DR',
-           'Quarter Pound': 'MF',
-           'Quarter Pound (Enraged)': 'MF!',
-           'Fleshpound': 'FP',
-           'Fleshpound (Enraged)': 'FP!',
-           'Scrake': 'SC',
-           'Alpha Scrake': 'SC*',
-           'Alpha Fleshpound': 'FP*',
-           'Alpha Fleshpound (Enraged)': 'FP*!',
-           'Abomination Spawn': 'AS',
-           'King Fleshpound': 'KF',
-           'Dr. Hans Volter': 'HV',
-           'Patriarch': 'PT',
-           'Abomination': 'AB',
-           'Matriarch': 'MT',
-           'Slasher Omega': 'OSL',
-           'Gorefast Omega': 'OGF',
-           'Stalker Omega': 'OST',
-           'Tiny Crawler': 'CRM',
-           'Medium Crawler': 'MCR',
-           'Big Crawler': 'BCR',
-           'Huge Crawler': 'HCR',
-           'Ultra Crawler': 'UCR',
-           'Siren Omega': 'OS',
-           'Husk Omega': 'OHS',
-           'Tiny Husk': 'MHS',
-           'Scrake Omega': 'OSC',
-           'Scrake Emperor': 'ESC',
-           'Tiny Scrake': 'TSC',
-           'Fleshpound Omega': 'OFP'}
-
-custom_zeds = ['E.D.A.R Trapper', 'E.D.A.R Blaster', 'E.D.A.R Bomber', 'Alpha Scrake', 'Alpha Fleshpound',
-               'Alpha Fleshpound (Enraged)', 'Dr. Hans Volter', 'Patriarch', 'Abomination', 'Matriarch']
-omega_zeds = ['Slasher Omega', 'Gorefast Omega', 'Stalker Omega', 'Tiny Crawler', 'Medium Crawler',
-                  'Big Crawler', 'Huge Crawler', 'Ultra Crawler', 'Siren Omega', 'Husk Omega', 'Tiny Husk',
-                  'Tiny Scrake', 'Scrake Omega', 'Scrake Emperor', 'Fleshpound Omega', 'Stalker Omega']
-
-
 class Ui_MainWindow(object):
     def __init__(self, app):
         # Meta vars
@@ -132,8 +81,9 @@ class Ui_MainWindow(object):
         self.generate_dialog = None
         self.loaded_json = None
         self.json_autosave_target = None # The place the autosave goes to for JSON files
+        self.generated = None # Seed and Generator settings of the generated SpawnCycle that's loaded, as long as it hasn't been edited since
         self.last_generate_preset = None # Last preset used in the Generate dialog
-        self.last_generate_mode = None # Last used zed mode in the Generate dialog
+        self.last_generate_quotas = '' # Last quota rules used in the Quotas dialog
         self.last_analyze_preset = None # Last preset used in the Analyze dialog
 
         # Start checking if we can autosave
@@ -374,6 +324,7 @@ class Ui_MainWindow(object):
         
         # The file is now 'dirty'
         self.dirty = True
+        self.generated = None # Edited, so it can't be regenerated from its seed anymore
         if self.filename != 'Untitled': # Change filename to reflect
             self.set_window_title(f'SpawnCycler ({self.truncate_filename(self.filename)}*)') # Only if file is named though
 
@@ -551,7 +502,7 @@ class Ui_MainWindow(object):
         if raged:
             zed_frame_children['Label'].setStyleSheet("QLineEdit {color: rgb(255, 55, 55); background-color: rgb(50, 50, 50); border: 2px solid red;}")
             zed_frame_children['Button'].setStyleSheet("QToolTip {color: rgb(0, 0, 0);}\nQSquadButton {border: 2px solid red;}")
-        elif zed_id in omega_zeds:
+        elif zeds.is_omega(zed_id):
             zed_frame_children['Label'].setStyleSheet("QLineEdit {color: rgb(173, 98, 252); background-color: rgb(50, 50, 50); border: 2px solid purple;}")
             zed_frame_children['Button'].setStyleSheet("QToolTip {color: rgb(0, 0, 0);}\nQSquadButton {border: 2px solid purple;}")
         else:
@@ -593,6 +544,7 @@ class Ui_MainWindow(object):
 
         # The file is now 'dirty'
         self.dirty = True
+        self.generated = None # Edited, so it can't be regenerated from its seed anymore
         if self.filename != 'Untitled': # Change filename to reflect
             self.set_window_title(f'SpawnCycler ({self.truncate_filename(self.filename)}*)') # Only if file is named though
 
@@ -639,7 +591,7 @@ class Ui_MainWindow(object):
             if raged:
                 zed_frame_children['Label'].setStyleSheet("QLineEdit {color: rgb(255, 55, 55); background-color: rgb(50, 50, 50); border: 2px solid red;}")
                 zed_frame_children['Button'].setStyleSheet("QToolTip {color: rgb(0, 0, 0);}\nQSquadButton {border: 2px solid red;}")
-            elif zed_id in omega_zeds:
+            elif zeds.is_omega(zed_id):
                 zed_frame_children['Label'].setStyleSheet("QLineEdit {color: rgb(173, 98, 252); background-color: rgb(50, 50, 50); border: 2px solid purple;}")
                 zed_frame_children['Button'].setStyleSheet("QToolTip {color: rgb(0, 0, 0);}\nQSquadButton {border: 2px solid purple;}")
             else:
@@ -681,6 +633,7 @@ class Ui_MainWindow(object):
 
         # The file is now 'dirty'
         self.dirty = True
+        self.generated = None # Edited, so it can't be regenerated from its seed anymore
         if self.filename != 'Untitled': # Change filename to reflect
             self.set_window_title(f'SpawnCycler ({self.truncate_filename(self.filename)}*)') # Only if file is named though
 
@@ -775,6 +728,7 @@ class Ui_MainWindow(object):
         t = self.wavedefs[first]
         self.wavedefs[first] = self.wavedefs[second]
         self.wavedefs[second] = t
+        self.generated = None # Edited, so it can't be regenerated from its seed anymore
             
         self.refresh_wavedefs(squads=True) # Refresh wavedefs state (update buttons, etc)
 
@@ -813,6 +767,8 @@ class Ui_MainWindow(object):
         if len(self.wavedefs) < 10:
             self.buttons['Add Wave'].setVisible(True) # We can show the add button again 
                 
+        self.generated = None # Edited, so it can't be regenerated from its seed anymore
+
         # File has been modified
         if self.filename == 'Untitled':
             self.dirty = True if len(self.wavedefs) > 0 else False
@@ -922,6 +878,7 @@ class Ui_MainWindow(object):
         vbar.rangeChanged.connect(lambda: vbar.setValue(vbar.maximum()))
 
         self.wavedefs.append({'ID': len(self.wavedefs), 'Labels': {'WaveNumber': wavedef_label, 'ZEDCount': zedcount_label}, 'Layouts': {'SquadFrame': squads_frame_layout, 'InfoFrame': info_frame_layout}, 'Frames': {'WaveFrame': wavedef_frame, 'SquadFrame': squads_frame, 'InfoFrame': info_frame}, 'OptionsButtons': options_buttons, 'Squads': []})
+        self.generated = None # Edited, so it can't be regenerated from its seed anymore
 
         # Final wave: hide 'Add Wave' button
         if len(self.wavedefs) == _WAVE_MAX:
@@ -1054,9 +1011,8 @@ class Ui_MainWindow(object):
         replace_menu = QtWidgets.QMenu('Replace ZEDs ..', batch_menu)
 
         # Init replace menu
-        for zed in zed_ids.keys():
-            local_zeds = deepcopy(list(zed_ids.keys()))
-            local_zeds.remove(zed) # Remove this ZED so it doesn't appear in the menu
+        for zed in zeds.zed_names:
+            local_zeds = [z for z in zeds.zed_names if z != zed] # Remove this ZED so it doesn't appear in the menu
             local_menu = QtWidgets.QMenu(zed, replace_menu)
             local_menu.setStyleSheet("color: rgb(255, 255, 255); background-color: rgb(50, 50, 50)")
 
@@ -1064,7 +1020,7 @@ class Ui_MainWindow(object):
             for z in local_zeds:
                 action = QtWidgets.QAction(z, local_menu)
                 local_menu.addAction(action)
-                should_warn = z in custom_zeds or z in omega_zeds
+                should_warn = zeds.is_nonstandard(z)
                 action.triggered.connect(partial(self.replace_zeds, 'all', 'all', [zed], [z], should_warn))
             replace_menu.addMenu(local_menu)
 
@@ -1667,6 +1623,8 @@ class Ui_MainWindow(object):
         self.wavedefs[id]['Labels']['ZEDCount'].setText('Total ZEDs: 0')
         self.wavedefs[id]['Squads'] = [] # Reset the internal implementation
 
+        self.generated = None # Edited, so it can't be regenerated from its seed anymore
+
         # File has been modified
         if self.filename == 'Untitled':
             num_squads = sum([len(wd['Squads']) for wd in self.wavedefs])
@@ -1693,8 +1651,9 @@ class Ui_MainWindow(object):
         dialog.accepted = False
         dialog.close()
 
-    # Generates wavedefs from the given slider data
-    def generate_wavedefs(self, slider_data):
+    # Generates wavedefs from the given slider data and seed (or a random one if there isn't one)
+    # If quotas are given (one {ZED or class: count} dict per wave), every wave is built to meet its quota exactly
+    def generate_wavedefs(self, slider_data, seed=None, quotas=None):
         # The current file is 'dirty', needs saving before we populate with the new stuff
         if self.dirty:
             x = self.central_widget.mapToGlobal(self.central_widget.rect().center()).x() - 150 # Anchor dialog to center of window
@@ -1718,35 +1677,6 @@ class Ui_MainWindow(object):
         # First reset the entire window (delete all squads, etc)
         self.reset_state()
 
-        # Generation stats
-        num_squads_generated = 0
-        num_zeds_generated = 0
-        num_trash_generated = 0
-        num_medium_generated = 0
-        num_larges_generated = 0
-        num_bosses_generated = 0
-        num_albino_generated = 0
-        num_spawnrage_generated = 0
-        num_omega_generated = 0
-
-        # Setup weights and zed arrays
-        sd = slider_data
-        types = ['Trash', 'Medium', 'Large', 'Boss']
-        type_weights = [sd['Trash Density'], sd['Medium Density'], sd['Large Density'], sd['Boss Density']]
-        trash_zeds = ['Cyst', 'Slasher', 'Alpha Clot', 'Gorefast', 'Crawler', 'Stalker',
-                      'Slasher Omega', 'Gorefast Omega', 'Tiny Crawler', 'Medium Crawler',
-                      'Big Crawler', 'Huge Crawler', 'Ultra Crawler', 'Stalker Omega']
-        trash_weights = [sd['Cyst Density'], sd['Slasher Density'], sd['Alpha Clot Density'], sd['Gorefast Density'], sd['Crawler Density'], sd['Stalker Density'],
-                         sd['Slasher Omega Density'], sd['Gorefast Omega Density'], sd['Tiny Crawler Density'], sd['Medium Crawler Density'], sd['Big Crawler Density'],
-                         sd['Huge Crawler Density'], sd['Ultra Crawler Density'], sd['Stalker Omega Density']]
-        medium_zeds = ['Bloat', 'Husk', 'Siren', 'E.D.A.R Trapper', 'E.D.A.R Blaster', 'E.D.A.R Bomber', 'Husk Omega', 'Tiny Husk', 'Siren Omega']
-        medium_weights = [sd['Bloat Density'], sd['Husk Density'], sd['Siren Density'], sd['E.D.A.R Trapper Density'], sd['E.D.A.R Blaster Density'], sd['E.D.A.R Bomber Density'],
-                          sd['Husk Omega Density'], sd['Tiny Husk Density'], sd['Siren Omega Density']]
-        large_zeds = ['Scrake', 'Quarter Pound', 'Fleshpound', 'Scrake Omega', 'Scrake Emperor', 'Tiny Scrake', 'Fleshpound Omega']
-        large_weights = [sd['Scrake Density'], sd['Quarter Pound Density'], sd['Fleshpound Density'], sd['Scrake Omega Density'], sd['Scrake Emperor Density'], sd['Tiny Scrake Density'], sd['Fleshpound Omega Density']]
-        bosses = ['Dr. Hans Volter', 'Patriarch', 'King Fleshpound', 'Abomination', 'Matriarch', 'Abomination Spawn'] 
-        boss_weights = [sd['Hans Density'], sd['Patriarch Density'], sd['King Fleshpound Density'], sd['Abomination Density'], sd['Matriarch Density'], sd['Abomination Spawn Density']]
-
         # Show "Loading" dialog
         diag_title = 'Generating..'
         x = self.central_widget.mapToGlobal(self.central_widget.rect().center()).x() - 90 # Anchor dialog to center of window
@@ -1757,102 +1687,20 @@ class Ui_MainWindow(object):
         loading_diag.show() # Show a dialog to tell user to check messages
 
         # Now we can generate
-        waves = []
-        for i in range(sd['Game Length']):
-            # Booleans describing what can exist on this wave
-            albino_allowed = ((i + 1) >= sd['Albino Min Wave'])
-            spawnrage_allowed = ((i + 1) >= sd['SpawnRage Min Wave'])
-            larges_min_wave_reached = ((i + 1) >= sd['Large Min Wave'])
-            bosses_min_wave_reached = ((i + 1) >= sd['Boss Min Wave'])
-
-            wave_squads = []
-
-            # Generate squads
-            num_squads_to_generate = random.randint(sd['Min Squads'], sd['Max Squads'])
-            for j in range(num_squads_to_generate):
-                num_squads_generated += 1
-                num_zeds_to_generate = random.randint(sd['Squad Min Length'], sd['Squad Max Length'])
-                new_squad = {}
-
-                # Generate ZEDs and add them to the squads
-                for k in range(num_zeds_to_generate):
-                    # Determine what class of ZED to use (Trash, Large, etc)
-                    zed_type = random.choices(types, weights=type_weights, k=1)[0]
-                    larges_allowed = larges_min_wave_reached
-                    bosses_allowed = bosses_min_wave_reached
-                    num_zeds_generated += 1
-                    spawnrage = False
-
-                    # Special case for larges and boss minimum wave
-                    while (zed_type == 'Large' and not larges_allowed) or (zed_type == 'Boss' and not bosses_allowed):
-                        zed_type = random.choices(types, weights=type_weights, k=1)[0] # Keep re-rerolling until it's correct
-
-                    # Add a Trash ZED
-                    if zed_type == 'Trash':
-                        zed_id = random.choices(trash_zeds, weights=trash_weights, k=1)[0] # Choose a ZED
-                        num_trash_generated += 1
-
-                        # Account for albinos
-                        if albino_allowed:
-                            if zed_id == 'Alpha Clot' and (random.randint(1, 100) <= sd['Alpha Clot Albino Density']):
-                                zed_id = 'Rioter' # Make ZED an albino zed
-                                num_albino_generated += 1
-                            elif zed_id == 'Gorefast' and (random.randint(1, 100) <= sd['Gorefast Albino Density']):
-                                zed_id = 'Gorefiend' # Make ZED an albino zed
-                                num_albino_generated += 1
-                            elif zed_id == 'Crawler' and (random.randint(1, 100) <= sd['Crawler Albino Density']):
-                                zed_id = 'Elite Crawler' # Make ZED an albino zed
-                                num_albino_generated += 1
-
-                    # Add a Medium ZED
-                    elif zed_type == 'Medium':
-                        zed_id = random.choices(medium_zeds, weights=medium_weights, k=1)[0] # Choose a ZED
-                        num_medium_generated += 1
-
-                    # Add a Large ZED
-                    elif zed_type == 'Large':
-                        zed_id = random.choices(large_zeds, weights=large_weights, k=1)[0] # Choose a ZED
-                        num_larges_generated += 1
-
-                        # Account for albinos
-                        if albino_allowed:
-                            if zed_id == 'Scrake' and (random.randint(1, 100) <= sd['Scrake Albino Density']):
-                                zed_id = 'Alpha Scrake' # Make ZED an albino zed
-                                num_albino_generated += 1
-                            elif zed_id == 'Fleshpound' and (random.randint(1, 100) <= sd['Fleshpound Albino Density']):
-                                zed_id = 'Alpha Fleshpound' # Make ZED an albino zed
-                                num_albino_generated += 1
-
-                        # Account for spawnrage
-                        if spawnrage_allowed:
-                            if zed_id == 'Quarter Pound' and (random.randint(1, 100) <= sd['Quarter Pound Rage Density']):
-                                zed_id += ' (Enraged)'
-                                spawnrage = True
-                                num_spawnrage_generated += 1
-                            elif zed_id in ['Fleshpound', 'Alpha Fleshpound'] and random.randint(1, 100) <= sd['Fleshpound Rage Density']:
-                                zed_id += ' (Enraged)'
-                                spawnrage = True
-                                num_spawnrage_generated += 1
-
-                    # Add a Boss
-                    else:
-                        zed_id = random.choices(bosses, weights=boss_weights, k=1)[0] # Choose a ZED
-                        num_bosses_generated += 1
-
-                    # Check for omega
-                    if zed_id in omega_zeds:
-                        num_omega_generated += 1
-
-                    if zed_id in new_squad and new_squad[zed_id]['Raged'] == spawnrage: # Already in the squad and same spawnrage status
-                        new_squad.update({zed_id: {'Count': new_squad[zed_id]['Count'] + 1, 'Raged': spawnrage}})
-                    else:
-                        new_squad.update({zed_id: {'Count': 1, 'Raged': spawnrage}})
-
-                wave_squads.append(new_squad)
-            waves.append(wave_squads)
+        if quotas is not None:
+            engine = generator.QuotaGenerationEngine(slider_data, quotas)
+        else:
+            engine = generator.GenerationEngine(slider_data)
+        (waves, stats) = engine.generate(seed)
 
         # Populate the wavedefs using all this data
         self.populate_waves(waves)
+        self.generated = {'Seed': stats['Seed'], 'Sliders': dict(slider_data)} # Everything needed to Generate the same SpawnCycle again
+        preset_name = presets.find_preset(slider_data)
+        if preset_name is not None:
+            self.generated.update({'Preset': preset_name})
+        if quotas is not None:
+            self.generated.update({'Quotas': quotas})
 
         loading_diag.close()
 
@@ -1872,14 +1720,7 @@ class Ui_MainWindow(object):
         diag.exec_() # Show a dialog to tell user to check messages
 
         # Post messages
-        gen_str = (f"Generation complete!\n\n" +
-                   f"Summary\n----------------------\n" +
-                   f"{sd['Game Length']} Waves generated\n" +
-                   f"{num_squads_generated} Squads generated\n" +
-                   f"{num_zeds_generated} ZEDs generated ({num_trash_generated} Trash, {num_medium_generated} Mediums, {num_larges_generated} Larges, {num_bosses_generated} Bosses)\n" +
-                   f"{num_albino_generated} Albino ZEDs generated\n" +
-                   f"{num_omega_generated} Omega ZEDs generated\n" +
-                   f"{num_spawnrage_generated} SpawnRaged ZEDs generated")
+        gen_str = f"Generation complete!\n\n{generator.format_summary(stats)}"
         self.add_message(gen_str)
 
     # Initializes the wavedefs table from a list of lines
@@ -1904,7 +1745,7 @@ class Ui_MainWindow(object):
                 squad_items = list(squad.items())
                 for k in range(len(squad_items)):
                     (zed_id, zed_data) = squad_items[k]
-                    if zed_id in custom_zeds or zed_id in omega_zeds:
+                    if zeds.is_nonstandard(zed_id):
                         custom_zeds_found = True
                     zed_count = zed_data['Count'] # Unpack ZED data
                     num_zeds += zed_count
@@ -2113,13 +1954,15 @@ class Ui_MainWindow(object):
         self.active_dialog = None
 
         self.add_message(f"Attempting to parse file '{filename}'..") # Post a message
-        # Parse the file to check for errors
-        errors = parse.parse_syntax_import(filename, lines)
+        # Parse the file, checking for errors as it goes
+        (waves, diagnostics) = parse.parse_spawncycle(lines, max_errors=parse.DEFAULT_MAX_ERRORS) # Stops early on badly broken files
+        errors = parse.format_diagnostics(filename, diagnostics)
         if len(errors) > 0:
             self.add_message(errors[0])
             if len(errors) > 1:
                 self.add_message('\n\n'.join([e.replace(f"Parse errors ('{filename}'):\n\n", '') for e in errors[1:]]), prefix=False)
-            diag_text = f'{len(errors)} syntax error(s) were encountered during the import.\nFile could not be loaded.\nSee the Messages box below for more details.'
+            num_errors = f"{len(diagnostics)}{'+' if diagnostics.truncated else ''}"
+            diag_text = f'{num_errors} syntax error(s) were encountered during the import.\nFile could not be loaded.\nSee the Messages box below for more details.'
             diag = widget_helpers.create_simple_dialog(self.central_widget, diag_title, diag_text, x, y, button=True)
             diag.setWindowIcon(QtGui.QIcon('img/icon_warning.png'))
             diag.exec_() # Show a dialog to tell user to check messages
@@ -2142,18 +1985,12 @@ class Ui_MainWindow(object):
         loading_diag.setWindowIcon(QtGui.QIcon('img/icon_warning.png'))
         loading_diag.show() # Show a dialog to tell user to check messages
 
-        # Convert lines into iterable waves
-        waves = []
-        for line in lines:
-            line = line.replace(' ', '').replace('SpawnCycleDefs=', '').replace('\n', '')
-            if len(line) > 0:
-                squads = [parse.format_squad(squad) for squad in line.split(',')] # Convert squads to dict format
-            else:
-                squads = []
-            waves.append(squads)
-
         num_waves, num_squads, num_zeds = self.populate_waves(waves) # Load up the waves!
         self.dirty = False # Not dirty after freshly loading a file
+        if self.loaded_json is not None and 'Seed' in self.loaded_json: # Keep the seed it was generated from until it's edited
+            self.generated = {'Seed': self.loaded_json['Seed']}
+            if isinstance(self.loaded_json.get('Generator'), dict):
+                self.generated.update(self.loaded_json['Generator'])
         self.add_message(f"Successfully loaded {len(self.wavedefs)} waves, {num_squads:,d} squads, {num_zeds:,d} zeds from file '{filename}'.") # Post a message
 
         loading_diag.close()
@@ -2360,7 +2197,7 @@ class Ui_MainWindow(object):
                 for wavedef in self.wavedefs:
                     wave_squads = []
                     for squad in wavedef['Squads']:
-                        squad_zeds = [f"{zed_data['Count']}{zed_ids[zed_id]}" for (zed_id, zed_data) in squad['ZEDs'].items()]
+                        squad_zeds = [f"{zed_data['Count']}{zeds.zed_info[zed_id]['Token']}" for (zed_id, zed_data) in squad['ZEDs'].items()]
                         wave_squads.append('_'.join(squad_zeds))
                     waves.append(f"{line_pfx}{','.join(wave_squads)}")
                 f.write('\n'.join(waves))
@@ -2371,7 +2208,7 @@ class Ui_MainWindow(object):
             for wavedef in self.wavedefs:
                 wave_squads = []
                 for squad in wavedef['Squads']:
-                    squad_zeds = [f"{zed_data['Count']}{zed_ids[zed_id]}" for (zed_id, zed_data) in squad['ZEDs'].items()]
+                    squad_zeds = [f"{zed_data['Count']}{zeds.zed_info[zed_id]['Token']}" for (zed_id, zed_data) in squad['ZEDs'].items()]
                     wave_squads.append('_'.join(squad_zeds))
                 cycle_list.append(f"{','.join(wave_squads)}")
 
@@ -2522,6 +2359,11 @@ class Ui_MainWindow(object):
                 self.loaded_json.update({target: cycle_list})
                 self.loaded_json.update({'Date': str(date.today())})
                 self.loaded_json.update({'Name': json_filename.lower().replace('.json', '')})
+                if self.generated is not None: # Record the seed and settings so the SpawnCycle can be regenerated
+                    self.loaded_json.update({'Seed': self.generated['Seed'], 'Generator': {key: value for (key, value) in self.generated.items() if key != 'Seed'}})
+                else: # Edited since it was generated, so any seed it came with doesn't give this SpawnCycle anymore
+                    self.loaded_json.pop('Seed', None)
+                    self.loaded_json.pop('Generator', None)
 
                 f.write(json.dumps(self.loaded_json))
 
@@ -2551,6 +2393,7 @@ class Ui_MainWindow(object):
     # Resets everything back to normal
     def reset_state(self):
         self.dirty = False # Reset dirty status
+        self.generated = None
         self.clear_wavedefs() # Delete all waves
         #self.clear_messages() # Delete all messages
 
@@ -2736,6 +2579,7 @@ class CustomMainWindow(QtWidgets.QMainWindow):
 
 
 if __name__ == '__main__':
+    multiprocessing.freeze_support() # Needed for the Generate Search worker processes in frozen builds
     app = QtWidgets.QApplication(sys.argv)
     MainWindow = CustomMainWindow()
     ui = Ui_MainWindow(app)
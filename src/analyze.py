@@ -30,63 +30,23 @@
 
 from PyQt5 import QtCore, QtGui, QtWidgets
 from functools import partial
+from simulate import AnalysisEngine, AnalysisCache, export_sweep
 import widget_helpers
 import meta
+import zeds
 
 _DEF_FONT_FAMILY = 'Consolas'
 _WAVESIZE_MIN = 1
 _WAVESIZE_MAX = 255
-_WAVESIZE_DELTA = 0.2115384615384615 # The percentage each wave increases by for every +1 WSF
 _MAXMONSTERS_MIN = 1
 _MAXMONSTERS_MAX = 512
+_SWEEP_MAXMONSTERS = [16, 32, 48, 64, 96, 128] # MaxMonsters values used by the Sweep (along with the current one)
 _WINDOWSIZE_ANALYZE_W = 750
 _WINDOWSIZE_ANALYZE_H = 1000
 
+# Per-wave results cache. Kept at module level so it survives the dialog being closed and reopened
+analysis_cache = AnalysisCache()
 
-zed_weights = {'Cyst': 300,
-               'Alpha Clot': 335,
-               'Rioter': 450,
-               'Slasher': 320,
-               'Slasher Omega': 335,
-               'Gorefast': 350,
-               'Gorefast Omega': 375,
-               'Gorefiend': 400,
-               'Crawler': 350,
-               'Tiny Crawler': 325,
-               'Medium Crawler': 350,
-               'Big Crawler': 375,
-               'Huge Crawler': 400,
-               'Ultra Crawler': 450,
-               'Elite Crawler': 400,
-               'Stalker': 375,
-               'Stalker Omega': 425,
-               'Bloat': 700,
-               'Husk': 1000,
-               'Husk Omega': 1100,
-               'Tiny Husk': 700,
-               'E.D.A.R Trapper': 1100,
-               'E.D.A.R Blaster': 1200,
-               'E.D.A.R Bomber': 1100,
-               'Siren': 900,
-               'Siren Omega': 1000,
-               'Quarter Pound': 3000,
-               'Quarter Pound (Enraged)': 4000,
-               'Scrake': 3000,
-               'Scrake Omega': 3500,
-               'Scrake Emperor': 4000,
-               'Tiny Scrake': 2500,
-               'Alpha Scrake': 4000,
-               'Fleshpound': 4000,
-               'Fleshpound (Enraged)': 5000,
-               'Fleshpound Omega': 5000,
-               'Alpha Fleshpound': 3000,
-               'Alpha Fleshpound (Enraged)': 4000,
-               'Dr. Hans Volter': 8000,
-               'Patriarch': 7000,
-               'King Fleshpound': 8000,
-               'Abomination': 8000,
-               'Abomination Spawn': 200,
-               'Matriarch': 10000}
 
 # Colors
 dark_colors = {'Trash': QtGui.QColor(85, 107, 43),
@@ -122,182 +82,54 @@ light_colors = {'Header': QtGui.QColor(100, 100, 100),
                 'Total': QtGui.QColor(184, 214, 224)}
 
 
+# Runs an AnalysisEngine on its own thread so the UI doesn't lock up during long simulations
+class AnalysisWorker(QtCore.QThread):
+    progress = QtCore.pyqtSignal(int, int) # Waves done, total waves
+    results_ready = QtCore.pyqtSignal(object) # Not emitted if the analysis was cancelled
+
+    def __init__(self, engine):
+        super().__init__()
+        self.engine = engine
+
+    def run(self):
+        results = self.engine.run(progress=self.progress.emit)
+        if results is not None:
+            self.results_ready.emit(results)
+
+    def cancel(self):
+        self.engine.cancel()
+
+
+# Runs a Sweep on a separate thread so the UI stays responsive
+class SweepWorker(QtCore.QThread):
+    progress = QtCore.pyqtSignal(int, int) # Grid cells done, total grid cells
+    results_ready = QtCore.pyqtSignal(object) # Not emitted if the sweep was cancelled
+
+    def __init__(self, engine, difficulties, wave_size_fakes, max_monsters):
+        super().__init__()
+        self.engine = engine
+        self.grid = (difficulties, wave_size_fakes, max_monsters)
+
+    def run(self):
+        results = self.engine.sweep(*self.grid, progress=self.progress.emit)
+        if results is not None:
+            self.results_ready.emit(results)
+
+    def cancel(self):
+        self.engine.cancel()
+
+
 class AnalyzeDialog(object):
     def __init__(self, parent):
         self.parent = parent
         self.buttons = {'WaveButtons': {}}
         self.active_wave = 'merged'
         self.params = {} # All of the current analysis params are stored here
-
-    # Returns the WaveSizeMultiplier based on the current WSF
-    def get_wavesize_multiplier(self, wsf):
-        if wsf <= 6:
-            multis = [1.00, 1.00, 2.00, 2.75, 3.50, 4.00, 4.50]
-            return multis[wsf]
-        return 4.50 + ((wsf-6) * _WAVESIZE_DELTA) # WSF > 6
-
-    # Returns the BaseNumZEDs based on the current wave and gamelength
-    def get_base_num_zeds(self, wave_id, gamelength):
-        base_num_zeds = [[25, 32, 35, 42], # Short (4 Wave)
-                         [25, 28, 32, 32, 35, 40, 42], # Medium (7 Wave)
-                         [25, 28, 32, 32, 35, 35, 35, 40, 42, 42]] # Long (10 Wave)
-        return base_num_zeds[gamelength][wave_id]
-
-    # Returns the DifficultyMod
-    def get_difficulty_mod(self, difficulty):
-        multis = [0.85, 1.00, 1.30, 1.70]
-        return multis[difficulty]
-
-    # Returns analysis data for the given wave
-    def sample_wave(self, wave_id):
-        # Wave is empty!
-        if len(self.parent.wavedefs[wave_id]['Squads']) == 0:
-            return None, [(0.0, 0.0)]
-
-        # Params
-        base_num_zeds = self.get_base_num_zeds(wave_id, self.params['GameLength'])
-        diffmod = self.get_difficulty_mod(self.params['Difficulty'])
-        wavesize_multi = self.get_wavesize_multiplier(self.params['WaveSizeFakes'])
-
-        # The number of ZEDs that will be in this wave
-        wave_num_zeds = int((base_num_zeds * diffmod * wavesize_multi) // 1)
-
-        # Expand this wave's squads
-        expanded_squads = self.expand_squads(self.parent.wavedefs[wave_id])
-        
-        # Simulate the wave!
-        wave_stats = {'Total': wave_num_zeds,
-                      'Category': {'Trash': 0, 'Medium': 0, 'Large': 0, 'Boss': 0, 'Total': 0}, 
-                      'Name': {'Cyst': 0, 'Alpha Clot': 0, 'Slasher': 0, 'Slasher Omega': 0,  'Rioter': 0, 'Gorefast': 0, 'Gorefast Omega': 0, 'Gorefiend': 0, 'Crawler': 0, 'Elite Crawler': 0, 'Tiny Crawler': 0, 'Medium Crawler': 0, 'Big Crawler': 0,
-                               'Huge Crawler': 0, 'Ultra Crawler': 0, 'Stalker': 0, 'Stalker Omega': 0, 'Abomination Spawn': 0, 'Bloat': 0, 'Husk': 0, 'Husk Omega': 0, 'Tiny Husk': 0, 'Siren': 0,
-                               'Siren Omega': 0, 'E.D.A.R Trapper': 0, 'E.D.A.R Blaster': 0, 'E.D.A.R Bomber': 0, 'Quarter Pound': 0, 'Scrake': 0, 'Scrake Omega': 0, 'Tiny Scrake': 0,
-                               'Scrake Emperor': 0, 'Alpha Scrake': 0, 'Fleshpound': 0, 'Fleshpound Omega': 0, 'Alpha Fleshpound': 0, 'King Fleshpound': 0, 'Dr. Hans Volter': 0,
-                               'Patriarch': 0, 'Abomination': 0, 'Matriarch': 0, 'Total': 0},
-                      'Group': {'Clots': 0, 'Gorefasts': 0, 'Crawlers / Stalkers': 0, 'Robots': 0, 'Scrakes': 0, 'Fleshpounds': 0, 'Albino': 0, 'Omega': 0, 'SpawnRage': 0, 'Total': 0},
-                      'SpawnRage': {'Quarter Pound': 0, 'Fleshpound': 0, 'Alpha Fleshpound': 0, 'Total': 0}}
-
-        trash_zeds = ['Cyst', 'Alpha Clot', 'Slasher', 'Rioter', 'Gorefast', 'Gorefiend',
-                      'Crawler', 'Elite Crawler', 'Stalker', 'Slasher Omega', 'Gorefast Omega', 'Abomination Spawn',
-                      'Stalker Omega', 'Tiny Crawler', 'Medium Crawler', 'Big Crawler', 'Huge Crawler', 'Ultra Crawler']
-        medium_zeds = ['Bloat', 'Husk', 'Siren', 'E.D.A.R Trapper', 'E.D.A.R Blaster', 'E.D.A.R Bomber', 'Siren Omega', 'Husk Omega', 'Tiny Husk']
-        large_zeds = ['Quarter Pound', 'Fleshpound', 'Scrake', 'Alpha Scrake', 'Alpha Fleshpound', 'Tiny Scrake',
-                      'Scrake Omega', 'Scrake Emperor', 'Fleshpound Omega', 'Stalker Omega']
-        albino = ['Rioter', 'Gorefiend', 'Elite Crawler', 'Alpha Scrake', 'Alpha Fleshpound']
-        bosses = ['King Fleshpound', 'Abomination', 'Dr. Hans Volter', 'Patriarch', 'Matriarch']
-        omega = ['Slasher Omega', 'Gorefast Omega', 'Stalker Omega', 'Tiny Crawler', 'Medium Crawler',
-                 'Big Crawler', 'Huge Crawler', 'Ultra Crawler', 'Siren Omega', 'Husk Omega', 'Tiny Husk',
-                 'Tiny Scrake', 'Scrake Omega', 'Scrake Emperor', 'Fleshpound Omega', 'Stalker Omega']
-        j = 0
-
-        for i in range(wave_num_zeds):
-            next_zed = expanded_squads[j] # Get the next ZED to be spawned
-            j = (j+1) % len(expanded_squads) # Roll back to the start of the array
-
-            # Add to category stats
-            if isinstance(next_zed, dict): # Special case for enraged Fleshpounds
-                next_zed = next_zed['Raged'] # This is messy but I honestly can't be bothered anymore
-                wave_stats['Group']['Fleshpounds'] += 1
-                wave_stats['Group']['SpawnRage'] += 1
-                wave_stats['SpawnRage'][next_zed] += 1
-                wave_stats['SpawnRage']['Total'] += 1
-                wave_stats['Category']['Large'] += 1
-                if next_zed == 'Alpha Fleshpound':
-                    wave_stats['Group']['Albino'] += 1
-            else:
-                # Trash ZEDs
-                if next_zed in trash_zeds:
-                    # Add to group stats
-                    if next_zed in ['Cyst', 'Alpha Clot', 'Slasher', 'Rioter', 'Slasher Omega']:
-                        wave_stats['Group']['Clots'] += 1
-                    elif next_zed in ['Gorefast', 'Gorefiend', 'Gorefast Omega']:
-                        wave_stats['Group']['Gorefasts'] += 1
-                    elif next_zed in ['Crawler', 'Elite Crawler', 'Stalker', 'Tiny Crawler', 'Medium Crawler', 'Big Crawler', 'Huge Crawler', 'Ultra Crawler', 'Stalker Omega']:
-                        wave_stats['Group']['Crawlers / Stalkers'] += 1
-                    wave_stats['Category']['Trash'] += 1
-
-                # Medium ZEDs
-                elif next_zed in medium_zeds:
-                    if next_zed in ['E.D.A.R Trapper', 'E.D.A.R Blaster', 'E.D.A.R Bomber']:
-                        wave_stats['Group']['Robots'] += 1
-                    wave_stats['Category']['Medium'] += 1
-
-                # Large ZEDs
-                elif next_zed in large_zeds:
-                    if next_zed in ['Scrake', 'Alpha Scrake', 'Scrake Omega', 'Scrake Emperor', 'Tiny Scrake']:
-                        wave_stats['Group']['Scrakes'] += 1
-                    elif next_zed in ['Fleshpound', 'Alpha Fleshpound', 'Quarter Pound', 'Fleshpound Omega']:
-                        wave_stats['Group']['Fleshpounds'] += 1
-                    wave_stats['Category']['Large'] += 1
-
-                # Bosses
-                else:
-                    wave_stats['Category']['Boss'] += 1
-
-                if next_zed in albino: # Check for albinos
-                    wave_stats['Group']['Albino'] += 1
-                if next_zed in omega: # Check for omegas
-                    wave_stats['Group']['Omega'] += 1
-
-            # Add to totals
-            wave_stats['Category']['Total'] += 1
-            wave_stats['Group']['Total'] += 1
-            wave_stats['Name']['Total'] += 1
-            wave_stats['Name'][next_zed] += 1
-
-        j = 0
-        difficulty_data = [(0.0, 0.0)]
-        currently_spawned_zeds = []
-        expanded_wave = []
-        while len(expanded_wave) < wave_num_zeds:
-            expanded_wave += expanded_squads
-        expanded_wave = expanded_wave[:wave_num_zeds]
-            
-        # Now calculate the difficulty
-        # +MM is to account for the "wind down" (killing remaining ZEDs after ZED spawning stops)
-        # In reality we never make it that far though in most cases
-        for i in range(wave_num_zeds + self.params['MaxMonsters']):
-            next_zed = None
-            if j < len(expanded_wave):
-                next_zed = expanded_wave[j] # Get the next ZED to be spawned
-                j += 1
-
-            if next_zed is not None: # Still ZEDs left to spawn
-                if len(currently_spawned_zeds) == self.params['MaxMonsters']: # We've reached MaxMonsters
-                    currently_spawned_zeds.pop(0) # Remove the first ZED and add the new one at the end
-                currently_spawned_zeds.append(next_zed)
-            else:
-                if len(currently_spawned_zeds) == 0: # We ran out of zeds to pop (because MM is high)
-                    break # Leave early. We had less ZEDs remaining than there were MaxMonsters
-                currently_spawned_zeds.pop(0) # Remove the first ZED
-
-            # Get the difficulty score at this point
-            # ZED composition modifier: ZEDs have varying weights
-            transcribe = {'Fleshpound': 'Fleshpound (Enraged)',
-                          'Quarter Pound': 'Quarter Pound (Enraged)',
-                          'Alpha Fleshpound': 'Alpha Fleshpound (Enraged)'}
-            zed_count = sum([zed_weights[(z if not isinstance(z, dict) else transcribe[z['Raged']])] for z in currently_spawned_zeds])
-            zed_diff_mod = 1.00 + (0.50 * self.params['Difficulty']) # ZED difficulty modifier: (harder difficulty = stronger attacks / more damage dealt)
-            zed_comp_mod = zed_diff_mod * zed_count
-
-            # Wave modifier, based on how far into the game this is.
-            # Earlier waves tend to be harder due to less money/economy
-            # Difficulty also affects this since it changes how much dosh you earn per kill
-            max_wave = {0: 10, 1: 7, 2: 4}
-            doshmod = {0: 1.00, 1: 1.25, 2: 1.50, 3: 1.75}
-            wave_score_mod = doshmod[self.params['Difficulty']] + (float(wave_id+1) / float(max_wave[self.params['GameLength']]))
-            
-            # Longer waves tend to be harder due to resources (ammo, etc) having to be further spread out 
-            wsf_mod = 1.50 + (float(self.params['WaveSizeFakes']) / 128.0)
-
-            # Calculate the final score
-            difficulty_score = wsf_mod * wave_score_mod * zed_comp_mod
-            if difficulty_score > 750000.0: # Cap Difficulty Score at 750K
-                difficulty_score = 750000.0
-            percent_thru_wave = (float(i+1) / float(wave_num_zeds)) * 100 # How far into the wave this is
-            
-            difficulty_data.append((percent_thru_wave, float(difficulty_score)))
-
-        return wave_stats, difficulty_data
+        self.worker = None # Worker for the analysis currently in progress
+        self.workers = [] # All workers that haven't finished yet, including cancelled ones
+        self.loading_diag = None
+        self.sweep_worker = None # Worker for the Sweep currently in progress
+        self.sweep_diag = None
 
     # Creates and returns a Table object representing the wave's data
     def create_waveframe(self, wave_data, merged=False, difficulty_data=None, axis_data=None):
@@ -505,19 +337,6 @@ class AnalyzeDialog(object):
         font.setWeight(75)
         font.setBold(True)
 
-        # ZED lists
-        trash_zeds = ['Cyst', 'Alpha Clot', 'Slasher', 'Rioter', 'Gorefast', 'Gorefiend',
-                      'Crawler', 'Elite Crawler', 'Stalker', 'Slasher Omega', 'Gorefast Omega', 'Abomination Spawn',
-                      'Stalker Omega', 'Tiny Crawler', 'Medium Crawler', 'Big Crawler', 'Huge Crawler', 'Ultra Crawler']
-        medium_zeds = ['Bloat', 'Husk', 'Siren', 'E.D.A.R Trapper', 'E.D.A.R Blaster', 'E.D.A.R Bomber', 'Siren Omega', 'Husk Omega', 'Tiny Husk']
-        large_zeds = ['Quarter Pound', 'Fleshpound', 'Scrake', 'Alpha Scrake', 'Alpha Fleshpound', 'Tiny Scrake',
-                      'Scrake Omega', 'Scrake Emperor', 'Fleshpound Omega', 'Stalker Omega']
-        albino_zeds = ['Rioter', 'Gorefiend', 'Elite Crawler', 'Alpha Scrake', 'Alpha Fleshpound']
-        bosses = ['King Fleshpound', 'Abomination', 'Dr. Hans Volter', 'Patriarch', 'Matriarch']
-        omega_zeds = ['Slasher Omega', 'Gorefast Omega', 'Stalker Omega', 'Tiny Crawler', 'Medium Crawler',
-                 'Big Crawler', 'Huge Crawler', 'Ultra Crawler', 'Siren Omega', 'Husk Omega', 'Tiny Husk',
-                 'Tiny Scrake', 'Scrake Omega', 'Scrake Emperor', 'Fleshpound Omega', 'Stalker Omega']
-
         if table_type == 'categorical': # Category table
             # Colorify header row
             header_cells = [(0, 0), (0, 1), (0, 2)]
@@ -546,24 +365,15 @@ class AnalyzeDialog(object):
                 zed_type = table.item(row, 0).text()
 
                 # Figure out what color this row should be
-                if zed_type in albino_zeds:
+                if zeds.is_albino(zed_type):
                     bg_color = light_colors['Albino']
                     fg_color = dark_colors['Albino']
-                elif zed_type in omega_zeds:
+                elif zeds.is_omega(zed_type):
                     bg_color = light_colors['Omega']
                     fg_color = dark_colors['Omega']
-                elif zed_type in trash_zeds:
-                    bg_color = light_colors['Trash']
-                    fg_color = dark_colors['Trash']
-                elif zed_type in medium_zeds:
-                    bg_color = light_colors['Medium']
-                    fg_color = dark_colors['Medium']
-                elif zed_type in large_zeds:
-                    bg_color = light_colors['Large']
-                    fg_color = dark_colors['Large']
-                elif zed_type in bosses:
-                    bg_color = light_colors['Boss']
-                    fg_color = dark_colors['Boss']
+                elif zed_type in zeds.zed_info:
+                    bg_color = light_colors[zeds.zed_info[zed_type]['Category']]
+                    fg_color = dark_colors[zeds.zed_info[zed_type]['Category']]
                 else:
                     bg_color = light_colors['Total']
                     fg_color = dark_colors['Total']
@@ -594,7 +404,8 @@ class AnalyzeDialog(object):
 
         return errors
 
-    # Publishes analysis data for the SpawnCycle
+    # Starts analyzing the SpawnCycle. The simulation itself happens on a worker thread,
+    # and the results are published by publish_results once it's finished
     def analyze_wavedefs(self):
         # Check for errors first
         errors = self.check_state()
@@ -609,6 +420,7 @@ class AnalyzeDialog(object):
             diag.exec_() # Show a dialog to tell user to check messages
             return
 
+        self.cancel_analysis() # Stop any analysis that's already running, since we're starting over
         self.clear_scrollarea() # First clear out any prev data
 
         # Show "Loading" dialog
@@ -616,48 +428,53 @@ class AnalyzeDialog(object):
         x = self.scrollarea.mapToGlobal(self.scrollarea.rect().center()).x() - 50 # Anchor dialog to center of window
         y = self.scrollarea.mapToGlobal(self.scrollarea.rect().center()).y() + 100
         diag_text = f"Analyzing.."
-        loading_diag = widget_helpers.create_simple_dialog(self.scrollarea, diag_title, diag_text, x, y, button=False)
-        loading_diag.setWindowIcon(QtGui.QIcon('img/icon_warning.png'))
-        loading_diag.show() # Show a dialog to tell user to check messages
-
-        # Get analysis data for each wave
-        wave_stats = []
-        difficulty_data = []
-        for i in range(len(self.parent.wavedefs)):
-            wave_sample, diff_sample = self.sample_wave(i)
-            wave_stats.append(wave_sample)
-            difficulty_data.append(diff_sample)
-
-        # Add missing data for missing waves
-        if len(self.parent.wavedefs) not in [4, 7, 10]:
-            if len(self.parent.wavedefs) < 4:
-                next_interval = 4
-            elif len(self.parent.wavedefs) < 7:
-                next_interval = 7
-            else:
-                next_interval = 10
+        self.loading_diag = widget_helpers.create_simple_dialog(self.scrollarea, diag_title, diag_text, x, y, button=True, button_target=self.cancel_analysis, button_text='Cancel')
+        self.loading_diag.setWindowIcon(QtGui.QIcon('img/icon_warning.png'))
+        self.loading_diag.show() # Show a dialog to tell user to check messages
+
+        # Take a snapshot of the wavedefs so any edits made while the worker is running don't affect it
+        cycle = [[{zed_id: {'Count': zed_data['Count'], 'Raged': zed_data['Raged']} for (zed_id, zed_data) in squad['ZEDs'].items()} for squad in wave['Squads']] for wave in self.parent.wavedefs]
+        engine = AnalysisEngine(cycle, self.params['GameLength'], self.params['Difficulty'], self.params['WaveSizeFakes'], self.params['MaxMonsters'], vectorized=meta.get_keyvalue('analyze_vectorized'), cache=analysis_cache)
+
+        # Start the worker
+        worker = AnalysisWorker(engine)
+        worker.progress.connect(self.update_progress)
+        worker.results_ready.connect(partial(self.publish_results, worker))
+        worker.finished.connect(partial(self.remove_worker, worker))
+        self.worker = worker
+        self.workers.append(worker)
+        worker.start()
+
+    # Stops the analysis in progress, if there is one
+    def cancel_analysis(self):
+        if self.worker is not None:
+            self.worker.cancel()
+            self.worker = None
+
+        if self.loading_diag is not None:
+            self.loading_diag.close()
+            self.loading_diag = None
+
+    # Called when a worker thread is completely done
+    def remove_worker(self, worker):
+        if worker in self.workers:
+            self.workers.remove(worker)
+
+    # Updates the "Loading" dialog with the analysis progress
+    def update_progress(self, num_done, num_waves):
+        if self.loading_diag is not None:
+            self.loading_diag.label.setText(f"Analyzing.. (Wave {num_done} / {num_waves})")
+
+    # Publishes analysis data for the SpawnCycle once the worker is done
+    def publish_results(self, worker, results):
+        if worker is not self.worker: # This analysis was cancelled or restarted. Throw the results out
+            return
+        self.worker = None
+        num_waves = len(worker.engine.cycle)
 
-            num_to_add = next_interval - len(self.parent.wavedefs)
-            wave_stats += [None for j in range(num_to_add)]
-            difficulty_data += [[(0.0, 0.0)] for k in range(num_to_add)]
-        
-        # Combine wave stats
-        merged = {'Total': 0,
-                  'Category': {'Trash': 0, 'Medium': 0, 'Large': 0, 'Boss': 0, 'Total': 0}, 
-                  'Name': {'Cyst': 0, 'Alpha Clot': 0, 'Slasher': 0, 'Rioter': 0, 'Gorefast': 0, 'Gorefiend': 0, 'Crawler': 0, 'Elite Crawler': 0,
-                           'Stalker': 0, 'Bloat': 0, 'Husk': 0, 'Siren': 0, 'E.D.A.R Trapper': 0, 'E.D.A.R Blaster': 0, 'E.D.A.R Bomber': 0,
-                           'Quarter Pound': 0, 'Fleshpound': 0, 'Scrake': 0, 'Alpha Scrake': 0, 'Alpha Fleshpound': 0, 'Abomination Spawn': 0, 'King Fleshpound': 0,
-                           'Dr. Hans Volter': 0, 'Patriarch': 0, 'Abomination': 0, 'Matriarch': 0, 'Total': 0},
-                  'Group': {'Clots': 0, 'Gorefasts': 0, 'Crawlers / Stalkers': 0, 'Albino': 0, 'Robots': 0, 'Scrakes': 0, 'Fleshpounds': 0, 'SpawnRage': 0, 'Total': 0},
-                  'SpawnRage': {'Quarter Pound': 0, 'Fleshpound': 0, 'Alpha Fleshpound': 0, 'Total': 0}}
-        
-        for ws in wave_stats:
-            if ws is not None:
-                merged['Total'] += ws['Total']
-                merged['Category'] = self.merge_dicts(merged['Category'], ws['Category'])
-                merged['Name'] = self.merge_dicts(merged['Name'], ws['Name'])
-                merged['Group'] = self.merge_dicts(merged['Group'], ws['Group'])
-                merged['SpawnRage'] = self.merge_dicts(merged['SpawnRage'], ws['SpawnRage'])
+        wave_stats = results['Waves']
+        difficulty_data = results['Difficulty']
+        merged = results['Merged']
 
         # Fonts, stylesheets
         ss_label = 'color: rgb(255, 255, 255); background-color: rgb(40, 40, 40);' # Stylesheet
@@ -712,29 +529,27 @@ class AnalyzeDialog(object):
         self.analysis_widgets.update({'ParamsLabel': params_label, 'ParamsFrame': params_frame}) # Saving these so we can get to them later
 
         # Display combined stats
-        avg_difficulty_data = [(0, 0.0)] + [(i+1, float(sum([y for _, y in difficulty_data[i]])) / float(len(difficulty_data[i]))) for i in range(0, len(difficulty_data))]
-        axis_data = {'X': {'Title': '\nWave', 'Labels': [str(i) for i in range(1, len(difficulty_data)+1)], 'Min': 0, 'Max': len(self.parent.wavedefs)}, 'Y': {'Title': 'Average Difficulty\n', 'Tick': 10, 'Min': 0, 'Max': 755000}}
+        avg_difficulty_data = results['Average Difficulty']
+        axis_data = {'X': {'Title': '\nWave', 'Labels': [str(i) for i in range(1, len(difficulty_data)+1)], 'Min': 0, 'Max': num_waves}, 'Y': {'Title': 'Average Difficulty\n', 'Tick': 10, 'Min': 0, 'Max': 755000}}
         merged_label = widget_helpers.create_label(None, text=f"\n\nALL WAVES", tooltip=None, style=ss_label, font=font_label, size_policy=sp_fixed, alignment=QtCore.Qt.AlignCenter)
         merged_frame, merged_frame_children = self.create_waveframe(merged, merged=True, difficulty_data=avg_difficulty_data, axis_data=axis_data) # Create table
 
         # Create dict of compiled data
         self.compiled_data = {'merged': (merged_label, merged_frame)}
+        self.wave_results = {}
 
-        # Display stats per-wave
+        # Store stats per-wave. Their frames are built the first time each wave is viewed (see get_compiled_wave)
         if not self.params['Overview Only']:
             for i in range(len(wave_stats)):
                 if wave_stats[i] is not None:
-                    x_max = difficulty_data[i][-1][0]
-                    axis_data = {'X': {'Title': '\nWave Progress (%)', 'Labels': ['10%', '20%', '30%', '40%', '50%', '60%', '70%', '80%', '90%', '100%'], 'Min': 0, 'Max': x_max}, 'Y': {'Title': 'Difficulty\n', 'Tick': 10, 'Min': 0, 'Max': 755000}}
-                    wave_label = widget_helpers.create_label(None, text=f"\n\nWAVE {i+1}", tooltip=None, style=ss_label, font=font_label, size_policy=sp_fixed, alignment=QtCore.Qt.AlignCenter)
-                    wave_frame, wave_frame_children = self.create_waveframe(wave_stats[i], merged=False, difficulty_data=difficulty_data[i], axis_data=axis_data) # Create table
-                    self.compiled_data.update({str(i): (wave_label, wave_frame)})
+                    self.wave_results.update({str(i): (wave_stats[i], difficulty_data[i])})
+                    self.compiled_data.update({str(i): None})
 
         # Set the first wave shown. This will either be the summary or the most recently viewed wave
         if not self.params['Overview Only']:
             if self.active_wave not in self.compiled_data: # This wave might not be available anymore!
                 self.active_wave = 'merged' # Set it back to 'All' because that one's always available
-            (wave_label, wave_frame) = self.compiled_data[self.active_wave]
+            (wave_label, wave_frame) = self.get_compiled_wave(self.active_wave)
         else: # Was on a numbered wave before and we might have turned the overview only flag on. Need to update accordingly
             (wave_label, wave_frame) = self.compiled_data['merged'] # Show only summary data
             self.active_wave = 'merged'
@@ -747,17 +562,18 @@ class AnalyzeDialog(object):
             button.setVisible(False)
 
         # Unhide the wave tab buttons we need
-        for (wnum, data) in self.compiled_data.items():
-            if data is not None:
-                border_color = 'orange' if wnum == self.active_wave else 'white'
-                wbutton = self.buttons['WaveButtons'][wnum]
-                wbutton.setStyleSheet(f"color: rgb(255, 255, 255);\nbackground-color: rgb(40, 40, 40);\nborder: 2px solid {border_color};") # Set initial border
-                wbutton.setVisible(True) # Unhide the button
+        for wnum in self.compiled_data.keys():
+            border_color = 'orange' if wnum == self.active_wave else 'white'
+            wbutton = self.buttons['WaveButtons'][wnum]
+            wbutton.setStyleSheet(f"color: rgb(255, 255, 255);\nbackground-color: rgb(40, 40, 40);\nborder: 2px solid {border_color};") # Set initial border
+            wbutton.setVisible(True) # Unhide the button
 
         # Reset scrollbar to top
         #self.scrollarea.verticalScrollBar().setValue(0);
 
-        loading_diag.close()
+        if self.loading_diag is not None:
+            self.loading_diag.close()
+            self.loading_diag = None
         self.parent.last_analyze_preset = self.params
 
         # Show a dialog indicating completion
@@ -769,6 +585,95 @@ class AnalyzeDialog(object):
         diag.setWindowIcon(QtGui.QIcon('img/icon_check.png'))
         diag.exec_() # Show a dialog to tell user to check messages
 
+    # Starts analyzing the SpawnCycle over a grid of Difficulties, WaveSizeFakes and MaxMonsters. The Sweep itself happens
+    # on a worker thread, and the results are exported by export_sweep_results once it's finished
+    def sweep_wavedefs(self):
+        # Check for errors first
+        errors = self.check_state()
+        if len(errors) > 0: # Print errors
+            diag_title = 'WARNING'
+            diag_text = 'The following error(s) were encountered while attempting to Sweep:\n\n'
+            diag_text += '\n'.join(errors)
+            x = self.scrollarea.mapToGlobal(self.scrollarea.rect().center()).x() - 200 # Anchor dialog to center of window
+            y = self.scrollarea.mapToGlobal(self.scrollarea.rect().center()).y()
+            diag = widget_helpers.create_simple_dialog(self.scrollarea, diag_title, diag_text, x, y, button=True)
+            diag.setWindowIcon(QtGui.QIcon('img/icon_warning.png'))
+            diag.exec_() # Show a dialog to tell user to check messages
+            return
+
+        # Ask the user where to save the results
+        filename, _ = QtWidgets.QFileDialog.getSaveFileName(None, 'Export Sweep', '', 'CSV Files (*.csv)')
+        if filename == '': # Leave if the user cancelled
+            return
+
+        self.cancel_sweep() # Only one Sweep at a time
+
+        # Show "Loading" dialog
+        diag_title = 'Sweeping..'
+        x = self.scrollarea.mapToGlobal(self.scrollarea.rect().center()).x() - 50 # Anchor dialog to center of window
+        y = self.scrollarea.mapToGlobal(self.scrollarea.rect().center()).y() + 100
+        diag_text = f"Sweeping.."
+        self.sweep_diag = widget_helpers.create_simple_dialog(self.scrollarea, diag_title, diag_text, x, y, button=True, button_target=self.cancel_sweep, button_text='Cancel')
+        self.sweep_diag.setWindowIcon(QtGui.QIcon('img/icon_warning.png'))
+        self.sweep_diag.show()
+
+        # Sweep every Difficulty and WSF, with the set MaxMonsters values
+        # Take a snapshot of the wavedefs so any edits made while the worker is running don't affect it
+        cycle = [[{zed_id: {'Count': zed_data['Count'], 'Raged': zed_data['Raged']} for (zed_id, zed_data) in squad['ZEDs'].items()} for squad in wave['Squads']] for wave in self.parent.wavedefs]
+        engine = AnalysisEngine(cycle, self.params['GameLength'], self.params['Difficulty'], self.params['WaveSizeFakes'], self.params['MaxMonsters'], vectorized=meta.get_keyvalue('analyze_vectorized'))
+        max_monsters = sorted(set(_SWEEP_MAXMONSTERS + [self.params['MaxMonsters']]))
+
+        # Start the worker
+        worker = SweepWorker(engine, range(4), range(_WAVESIZE_MIN, _WAVESIZE_MAX+1), max_monsters)
+        worker.progress.connect(self.update_sweep_progress)
+        worker.results_ready.connect(partial(self.export_sweep_results, worker, filename))
+        worker.finished.connect(partial(self.remove_worker, worker))
+        self.sweep_worker = worker
+        self.workers.append(worker)
+        worker.start()
+
+    # Stops the Sweep in progress, if there is one
+    def cancel_sweep(self):
+        if self.sweep_worker is not None:
+            self.sweep_worker.cancel()
+            self.sweep_worker = None
+
+        if self.sweep_diag is not None:
+            self.sweep_diag.close()
+            self.sweep_diag = None
+
+    # Updates the "Sweeping" dialog with the Sweep progress
+    def update_sweep_progress(self, num_done, num_total):
+        if self.sweep_diag is not None:
+            self.sweep_diag.label.setText(f"Sweeping.. ({100 * num_done // num_total}%)")
+
+    # Writes the Sweep results once the worker is done
+    def export_sweep_results(self, worker, filename, results):
+        if worker is not self.sweep_worker: # This Sweep was cancelled. Throw the results out
+            return
+        self.sweep_worker = None
+
+        # Write the results
+        diag_title = 'SpawnCycler'
+        x = self.scrollarea.mapToGlobal(self.scrollarea.rect().center()).x() - 100 # Anchor dialog to center of window
+        y = self.scrollarea.mapToGlobal(self.scrollarea.rect().center()).y() + 100
+        try:
+            export_sweep(results, filename)
+            diag_text = f"Sweep completed successfully!\nResults written to '{filename}'."
+            diag_icon = 'img/icon_check.png'
+        except:
+            diag_text = f"File '{filename}' could not be written!\nEither the file is locked or the destination doesn't exist."
+            diag_icon = 'img/icon_warning.png'
+
+        if self.sweep_diag is not None:
+            self.sweep_diag.close()
+            self.sweep_diag = None
+
+        # Show a dialog indicating completion
+        diag = widget_helpers.create_simple_dialog(self.scrollarea, diag_title, diag_text, x, y, button=True)
+        diag.setWindowIcon(QtGui.QIcon(diag_icon))
+        diag.exec_()
+
     # Sets up the per wave tabs
     def setup_wave_buttons(self):
         # Fonts and stuff
@@ -801,7 +706,7 @@ class AnalyzeDialog(object):
         self.buttons['WaveButtons'][wave].setStyleSheet(f"color: rgb(255, 255, 255);\nbackground-color: rgb(40, 40, 40);\nborder: 2px solid orange;") # Set the button for this wave
 
         # Load up the new wave
-        (wave_label, wave_frame) = self.compiled_data[wave]
+        (wave_label, wave_frame) = self.get_compiled_wave(wave)
         self.scrollarea_contents_layout.addWidget(self.analysis_widgets['ParamsLabel'])
         self.scrollarea_contents_layout.addWidget(self.analysis_widgets['ParamsFrame'])
         self.scrollarea_contents_layout.addWidget(wave_label)
@@ -810,31 +715,26 @@ class AnalyzeDialog(object):
         # Set the active wave in case we re-analyze without closing the window
         self.active_wave = wave
 
-    # Merges dict B into A and returns a new dict C
-    # Assumes all integer values
-    def merge_dicts(self, a, b):
-        merged = {}
-        for key in b:
-            if key in a:
-                merged[key] = a[key] + b[key]
-            else:
-                merged[key] = b[key]
-        return merged
-
-    # Expands a wave's Squads into a 1-dimensional list
-    def expand_squads(self, wavedef):
-        expanded = []
-        for squad in wavedef['Squads']:
-            for (zed, data) in squad['ZEDs'].items():
-                # Turn {'Clot': 4} into [Clot, Clot, Clot, Clot], etc
-                if 'Enraged' in zed:
-                    zed_name = zed.replace(' (Enraged)', '') # Kinda hacky. A dict entry means an enraged ZED
-                    zeds = [{'Raged': zed_name} for i in range(data['Count'])]
-                else:
-                    zeds = [zed for i in range(data['Count'])]
-                expanded += zeds
-
-        return expanded
+    # Returns the label and frame for the given wave, building them the first time the wave is viewed
+    def get_compiled_wave(self, wave):
+        if self.compiled_data[wave] is None:
+            ss_label = 'color: rgb(255, 255, 255); background-color: rgb(40, 40, 40);' # Stylesheet
+            sp_fixed = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
+            sp_fixed.setHorizontalStretch(0)
+            sp_fixed.setVerticalStretch(0)
+            font_label = QtGui.QFont()
+            font_label.setFamily(_DEF_FONT_FAMILY)
+            font_label.setPointSize(10)
+            font_label.setWeight(75)
+
+            (wave_stats, difficulty_data) = self.wave_results[wave]
+            x_max = difficulty_data[-1][0]
+            axis_data = {'X': {'Title': '\nWave Progress (%)', 'Labels': ['10%', '20%', '30%', '40%', '50%', '60%', '70%', '80%', '90%', '100%'], 'Min': 0, 'Max': x_max}, 'Y': {'Title': 'Difficulty\n', 'Tick': 10, 'Min': 0, 'Max': 755000}}
+            wave_label = widget_helpers.create_label(None, text=f"\n\nWAVE {int(wave)+1}", tooltip=None, style=ss_label, font=font_label, size_policy=sp_fixed, alignment=QtCore.Qt.AlignCenter)
+            wave_frame, wave_frame_children = self.create_waveframe(wave_stats, merged=False, difficulty_data=difficulty_data, axis_data=axis_data) # Create table
+            self.compiled_data[wave] = (wave_label, wave_frame)
+
+        return self.compiled_data[wave]
 
     # Clears out the entire scrollarea of all widgets
     def clear_scrollarea(self):
@@ -883,6 +783,10 @@ class AnalyzeDialog(object):
         simulate_frame_layout = QtWidgets.QHBoxLayout(simulate_frame)
         simulate_frame_layout.setAlignment(QtCore.Qt.AlignCenter)
         simulate_frame_layout.addWidget(simulate_button)
+        sweep_button = widget_helpers.create_button(None, None, None, text=' Sweep.. ', icon_path='img/icon_saveas.png', icon_w=24, icon_h=24, style="QToolTip {color: rgb(0, 0, 0);} QPushButton {color: rgb(255, 255, 255); background-color: rgb(50, 50, 50);}", size_policy=sp, font=font_button, options=False, squad=False, draggable=False)
+        sweep_button.setToolTip(f"Analyze the SpawnCycle for every Difficulty, every Wave Size Fakes value ({_WAVESIZE_MIN}-{_WAVESIZE_MAX}),\nand Max Monsters values of {', '.join([str(mm) for mm in _SWEEP_MAXMONSTERS])} (plus the current value).\nThe per-wave ZED totals and average difficulties are exported to a CSV file.")
+        sweep_button.clicked.connect(self.sweep_wavedefs)
+        simulate_frame_layout.addWidget(sweep_button)
 
         # Set up GameLength area
         gamelength_label = widget_helpers.create_label(None, text='Game Length       ', tooltip="The Length of the game.\nDifferent Game Lengths affect the way the waves are sampled.", style=ss, font=font, size_policy=sp, alignment=QtCore.Qt.AlignLeft)
@@ -1072,7 +976,7 @@ class AnalyzeDialog(object):
         self.options_pane.setFrameShadow(QtWidgets.QFrame.Plain)
         self.options_pane.setLineWidth(2)
 
-        self.buttons.update({'Analyze': simulate_button})
+        self.buttons.update({'Analyze': simulate_button, 'Sweep': sweep_button})
         self.analysis_widgets = {'GameLength': gamelength_cbox, 'Difficulty': difficulty_cbox, 'WaveSizeFakes': wavesize_textarea,
                                  'Ignore Zeroes': iz_checkbox, 'Analyze Difficulty': analyze_difficulty_checkbox, 'MaxMonsters': maxmonsters_textarea,
                                  'Overview Only': overview_only_checkbox, 'Display Charts': display_charts_checkbox}
@@ -1119,6 +1023,10 @@ class AnalyzeDialog(object):
         elif isinstance(widget, QtWidgets.QLineEdit):
             self.params.update({key: int(widget.text())})
 
+        # Restart the analysis if one of the simulation params was changed while it was running
+        if self.worker is not None and key in ['GameLength', 'Difficulty', 'WaveSizeFakes', 'MaxMonsters']:
+            self.analyze_wavedefs()
+
     # Called when the Analyze Difficulty field is changed
     def update_analyze_difficulty(self):
         self.update_param('Analyze Difficulty', self.analysis_widgets['Analyze Difficulty'])
@@ -1133,6 +1041,12 @@ class AnalyzeDialog(object):
 
     # Called when this dialog is closed
     def teardown(self):
+        # Stop any analysis or Sweep still in progress. The threads have to finish before they can be cleaned up
+        self.cancel_analysis()
+        self.cancel_sweep()
+        for worker in list(self.workers):
+            worker.wait()
+
         self.parent.analyze_dialog = None
         self.parent.last_analyze_preset = self.params
 
@@ -1160,6 +1074,7 @@ class AnalyzeDialog(object):
         for wave_button in self.buttons['WaveButtons'].values():
             wave_button.setVisible(False)
         self.compiled_data = {}
+        self.wave_results = {}
         
     def setupUi(self, Dialog):
         Dialog.setFixedSize(_WINDOWSIZE_ANALYZE_W, _WINDOWSIZE_ANALYZE_H)
@@ -0,0 +1,245 @@
+#
+#  bulk.py
+#
+#  Author: Tamari
+#  Date of creation: 10/18/2026
+#
+#  Headless bulk SpawnCycle generation.
+#  Streams generated SpawnCycles to a JSON Lines file or a directory of TXT files as they're made.
+#  Does not depend on PyQt5, so it can be run from the command line on servers
+#
+
+
+##  LICENSE INFORMATION
+##  =======================================================================
+##  This program is free software: you can redistribute it and/or modify
+##  it under the terms of the GNU General Public License as published by
+##  the Free Software Foundation, either version 3 of the License, or
+##  (at your option) any later version.
+##
+##  This program is distributed in the hope that it will be useful,
+##  but WITHOUT ANY WARRANTY; without even the implied warranty of
+##  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+##  GNU General Public License for more details.
+##
+##  You should have received a copy of the GNU General Public License
+##  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+##  =======================================================================
+##
+##  © Tamari 2020-2022
+##  All rights reserved.
+
+
+from datetime import date
+import multiprocessing
+import argparse
+import random
+import json
+import time
+import os
+import re
+import generator
+import presets
+import zeds
+
+_CHUNK_SIZE = 32 # Number of cycles handed to a worker process at once
+_BATCH_CHUNKS = 4 # Number of chunks per worker in flight at once. Keeps memory bounded no matter how many cycles are asked for
+_worker_state = {} # Per-process settings, set up once by init_worker
+
+
+# Returns the given wave as a SpawnCycleDefs string ('4CY_2AL,1FP!,..'), same as what 'Save' writes
+def format_wave(wave):
+    return ','.join(['_'.join([f"{zed_data['Count']}{zeds.zed_info[zed_id]['Token']}" for (zed_id, zed_data) in squad.items()]) for squad in wave])
+
+
+# Returns the FMX SpawnCycle slot a cycle with the given number of waves is saved to (same as the 'Adaptive' save setting)
+def get_json_target(num_waves):
+    if num_waves in [8, 9, 10]:
+        return 'LongSpawnCycle'
+    elif num_waves in [5, 6, 7]:
+        return 'NormalSpawnCycle'
+    return 'ShortSpawnCycle'
+
+
+# Returns the name of the cycle with the given seed. Also used as the filename for TXT output
+def get_cycle_name(name, seed):
+    return f"{name}_{seed}"
+
+
+# Returns the given cycle as a standard SpawnCycle (TXT) file's contents
+def to_txt(waves):
+    return '\n'.join([f"SpawnCycleDefs={format_wave(wave)}" for wave in waves])
+
+
+# Returns the given cycle as an FMX SpawnCycle (JSON) object, in the same shape 'Save' writes
+def to_json(waves, name, author, seed):
+    fmx = {'Name': name, 'Author': author, 'Date': str(date.today()), 'ShortSpawnCycle': [], 'NormalSpawnCycle': [], 'LongSpawnCycle': []}
+    fmx.update({get_json_target(len(waves)): [format_wave(wave) for wave in waves]})
+    fmx.update({'Seed': seed})
+    return fmx
+
+
+# Sets up the engine used by generate_seed. Called once in each worker process
+def init_worker(slider_data, output_format, name, author):
+    _worker_state.update({'Engine': generator.GenerationEngine(slider_data), 'Format': output_format, 'Name': name, 'Author': author})
+
+
+# Generates the SpawnCycle with the given seed and returns it already formatted, so the main process only has to write it
+def generate_seed(seed):
+    (waves, stats) = _worker_state['Engine'].generate(seed)
+    cycle_name = get_cycle_name(_worker_state['Name'], seed)
+    if _worker_state['Format'] == 'jsonl':
+        return seed, json.dumps(to_json(waves, cycle_name, _worker_state['Author'], seed)), stats['ZEDs']
+    return seed, to_txt(waves), stats['ZEDs']
+
+
+# Generates lots of SpawnCycles from the slider data (or preset name) and streams them to disk as they're made
+# Output is either a JSON Lines file ('jsonl', one FMX SpawnCycle per line) or a directory of TXT files ('txt', one file per cycle)
+# The cycle seeds are drawn from the bulk seed, so the same bulk seed always gives the same pool of cycles.
+# Cycles whose seed is already in the output are skipped, so an interrupted run picks up where it left off
+class BulkGenerator(object):
+    def __init__(self, slider_data, num_cycles, output, output_format='jsonl', seed=None, processes=None, name='spawncycle', author='SpawnCycler'):
+        if isinstance(slider_data, str): # Preset name
+            slider_data = presets.get_slider_values(slider_data)
+        if output_format not in ['jsonl', 'txt']:
+            raise ValueError(f"Unknown output format '{output_format}'")
+        self.slider_data = slider_data
+        self.num_cycles = num_cycles
+        self.output = output
+        self.output_format = output_format
+        self.seed = seed if seed is not None else generator.new_seed()
+        self.processes = processes if processes is not None else multiprocessing.cpu_count()
+        self.name = name
+        self.author = author
+        self.cancelled = False
+
+    # Stops a run that's in progress (ie: from another thread). Everything written so far is kept
+    def cancel(self):
+        self.cancelled = True
+
+    # Returns the seeds of every cycle in the pool, in order
+    def iter_seeds(self):
+        seed_random = random.Random(self.seed)
+        for i in range(self.num_cycles):
+            yield seed_random.randint(0, generator.SEED_MAX)
+
+    # Returns the seeds of the cycles that are already in the output
+    # Also cuts off a partly written last line of a JSON Lines file (ie: from a run that was killed mid-write)
+    def get_written_seeds(self):
+        written = set()
+        if self.output_format == 'txt':
+            if os.path.isdir(self.output):
+                pattern = re.compile(re.escape(self.name) + r'_(\d+)\.txt$')
+                for filename in os.listdir(self.output):
+                    match = pattern.match(filename)
+                    if match is not None:
+                        written.add(int(match.group(1)))
+            return written
+
+        if not os.path.isfile(self.output):
+            return written
+        with open(self.output, 'rb+') as f:
+            valid_size = 0
+            for line in f:
+                if not line.endswith(b'\n'): # Unfinished line
+                    break
+                try:
+                    written.add(json.loads(line)['Seed'])
+                except (ValueError, KeyError, TypeError): # Not one of ours, leave it alone
+                    pass
+                valid_size += len(line)
+            f.truncate(valid_size)
+        return written
+
+    # Writes one generated cycle to the output
+    def write_cycle(self, f_out, seed, data):
+        if self.output_format == 'jsonl':
+            f_out.write(data + '\n')
+            return
+
+        # Write to a temp file first so a run that's killed mid-write never leaves a partial cycle behind
+        filename = os.path.join(self.output, f"{get_cycle_name(self.name, seed)}.txt")
+        with open(filename + '.tmp', 'w') as f_cycle:
+            f_cycle.write(data)
+        os.replace(filename + '.tmp', filename)
+
+    # Runs the generation, returning the stats of the run
+    # If given, progress is called with (cycles done, total cycles) after each batch of cycles is written
+    def run(self, progress=None):
+        start_time = time.perf_counter()
+        written = self.get_written_seeds()
+        stats = {'Seed': self.seed, 'Written': 0, 'Skipped': 0, 'ZEDs': 0}
+
+        if self.output_format == 'txt':
+            os.makedirs(self.output, exist_ok=True)
+            f_out = None
+        else:
+            f_out = open(self.output, 'a', newline='\n')
+
+        initargs = (self.slider_data, self.output_format, self.name, self.author)
+        batch_size = max(self.processes, 1) * _CHUNK_SIZE * _BATCH_CHUNKS
+        pool = multiprocessing.Pool(self.processes, initializer=init_worker, initargs=initargs) if self.processes > 1 else None
+        if pool is None:
+            init_worker(*initargs)
+
+        try:
+            # Only one batch of seeds is in flight at a time, so memory stays flat however many cycles are asked for
+            batch = []
+            for seed in self.iter_seeds():
+                if seed in written: # Already done on a previous run
+                    stats['Skipped'] += 1
+                    continue
+                written.add(seed) # Seeds can repeat within a pool. Only write each one once
+                batch.append(seed)
+                if len(batch) == batch_size:
+                    self.write_batch(batch, pool, f_out, stats, progress)
+                    batch = []
+                if self.cancelled:
+                    break
+            if len(batch) > 0 and not self.cancelled:
+                self.write_batch(batch, pool, f_out, stats, progress)
+        finally:
+            if pool is not None:
+                pool.terminate()
+            if f_out is not None:
+                f_out.close()
+
+        elapsed = time.perf_counter() - start_time
+        stats.update({'Elapsed': elapsed, 'Cycles/sec': stats['Written'] / elapsed if elapsed > 0.0 else 0.0})
+        return stats
+
+    # Generates the given seeds and writes them as they come in
+    def write_batch(self, seeds, pool, f_out, stats, progress):
+        results = pool.imap_unordered(generate_seed, seeds, chunksize=_CHUNK_SIZE) if pool is not None else map(generate_seed, seeds)
+        for (seed, data, num_zeds) in results:
+            if self.cancelled:
+                break
+            self.write_cycle(f_out, seed, data)
+            stats['Written'] += 1
+            stats['ZEDs'] += num_zeds
+
+        if f_out is not None:
+            f_out.flush() # Everything in the batch is on disk before the next one starts
+        if progress is not None:
+            progress(stats['Written'] + stats['Skipped'], self.num_cycles)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Generates lots of SpawnCycles and streams them to disk.')
+    parser.add_argument('preset', help='Generator preset to use (ie: Moderate)')
+    parser.add_argument('num_cycles', type=int, help='Number of SpawnCycles to generate')
+    parser.add_argument('output', help='JSON Lines file (jsonl format) or directory (txt format) to write to')
+    parser.add_argument('--format', dest='output_format', choices=['jsonl', 'txt'], default='jsonl', help='Output format (default: jsonl)')
+    parser.add_argument('--seed', type=int, default=None, help='Bulk seed. Use the same seed to resume an interrupted run')
+    parser.add_argument('--processes', type=int, default=None, help='Number of worker processes (default: one per CPU)')
+    parser.add_argument('--name', default='spawncycle', help="Name of each SpawnCycle. The seed is added on the end (default: 'spawncycle')")
+    parser.add_argument('--author', default='SpawnCycler', help="Author of each FMX SpawnCycle (default: 'SpawnCycler')")
+    args = parser.parse_args()
+
+    if args.preset not in presets.presets:
+        parser.error(f"Unknown preset '{args.preset}'. Choose from: {', '.join(presets.presets.keys())}")
+
+    bulk = BulkGenerator(args.preset, args.num_cycles, args.output, output_format=args.output_format, seed=args.seed, processes=args.processes, name=args.name, author=args.author)
+    print(f"Generating {args.num_cycles} SpawnCycles (seed {bulk.seed})..")
+    stats = bulk.run(progress=lambda done, total: print(f"{done} / {total}", end='\r'))
+    print(f"\nWrote {stats['Written']} SpawnCycles ({stats['Skipped']} already written) in {stats['Elapsed']:.1f}s ({stats['Cycles/sec']:.0f} cycles/sec)")
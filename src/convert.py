@@ -302,6 +302,40 @@ class ConvertDialog(object):
     def spawncycle_to_list(self, lines):
         return [line.replace('SpawnCycleDefs=', '').replace('\n', '') for line in lines]
 
+    # Opens the given SpawnCycle file, which must have exactly the given number of waves, and checks it for errors
+    # Returns the lines of the file, or None if it couldn't be opened or had errors (which are reported)
+    def parse_spawncycle_file(self, filename, num_waves, length_name):
+        lines = self.load_from_file(filename)
+        if lines is None: # File unopenable
+            self.add_message(f"Error: File '{filename}' could not be opened!\nEither the file doesn't exist, or it is inaccessible somehow.")
+            return None
+
+        if len(lines) != num_waves: # Must be exactly this many lines (waves)
+            self.add_message(f"Error: '{length_name}' SpawnCycle must be exactly {num_waves} lines ({len(lines)} lines found in file)!")
+            return None
+
+        # Parse the SpawnCycle and check for any errors
+        (_, diagnostics) = parse.parse_spawncycle(lines, max_errors=parse.DEFAULT_MAX_ERRORS) # Stops early on badly broken files
+        errors = parse.format_diagnostics(filename, diagnostics)
+        if len(errors) > 0:
+            self.add_message(errors[0])
+            if len(errors) > 1:
+                self.add_message('\n\n'.join([e.replace(f"Parse errors ('{filename}'):\n\n", '') for e in errors[1:]]), prefix=False)
+
+            # Show a dialog stating that errors occurred
+            x = self.scrollarea.mapToGlobal(self.scrollarea.rect().center()).x() - 150 # Anchor dialog to center of window
+            y = self.scrollarea.mapToGlobal(self.scrollarea.rect().center()).y()
+            diag_title = 'WARNING'
+            num_errors = f"{len(diagnostics)}{'+' if diagnostics.truncated else ''}"
+            diag_text = f'{num_errors} syntax error(s) were encountered during the import.\nFile could not be loaded.\nSee the Messages box below for more details.'
+            diag = widget_helpers.create_simple_dialog(self.scrollarea, diag_title, diag_text, x, y, button=True)
+            diag.setWindowIcon(QtGui.QIcon('img/icon_warning.png'))
+            diag.exec_() # Show a dialog to tell user to check messages
+            return None
+
+        self.add_message(f"Parse of file '{filename}' successful!") # Post a message
+        return lines
+
     # Checks over each field and makes sure it's set appropriately. Reports an error if not
     def parse_fields(self):
         # Check Name field
@@ -326,97 +360,20 @@ class ConvertDialog(object):
             self.add_message(f"Error: No SpawnCycles specified to convert!")
             return None
 
-        # Attempt to open the files
-        # Short SpawnCycle
-        if len(file1_name) > 0: # Only if a file was specified, though
-            file1_lines = self.load_from_file(file1_name)
-            if file1_lines is None: # File unopenable
-                self.add_message(f"Error: File '{file1_name}' could not be opened!\nEither the file doesn't exist, or it is inaccessible somehow.")
-                return None
-
-            if len(file1_lines) != 4: # Must be 4 lines (waves)
-                self.add_message(f"Error: 'Short' SpawnCycle must be exactly 4 lines ({len(file1_lines)} lines found in file)!")
+        # Attempt to open and parse the files (only the ones that were specified, though)
+        if len(file1_name) > 0: # Short SpawnCycle
+            file1_lines = self.parse_spawncycle_file(file1_name, 4, 'Short')
+            if file1_lines is None:
                 return None
-
-            # Parse the SpawnCycle and check for any errors
-            errors = parse.parse_syntax_import(file1_name, file1_lines)
-            if len(errors) > 0:
-                self.add_message(errors[0])
-                if len(errors) > 1:
-                    self.add_message('\n\n'.join([e.replace(f"Parse errors ('{file1_name}'):\n\n", '') for e in errors[1:]]), prefix=False)
-
-                # Show a dialog stating that errors occurred
-                x = self.scrollarea.mapToGlobal(self.scrollarea.rect().center()).x() - 150 # Anchor dialog to center of window
-                y = self.scrollarea.mapToGlobal(self.scrollarea.rect().center()).y()
-                diag_title = 'WARNING'
-                diag_text = f'{len(errors)} syntax error(s) were encountered during the import.\nFile could not be loaded.\nSee the Messages box below for more details.'
-                diag = widget_helpers.create_simple_dialog(self.scrollarea, diag_title, diag_text, x, y, button=True)
-                diag.setWindowIcon(QtGui.QIcon('img/icon_warning.png'))
-                diag.exec_() # Show a dialog to tell user to check messages
+        if len(file2_name) > 0: # Medium SpawnCycle
+            file2_lines = self.parse_spawncycle_file(file2_name, 7, 'Medium')
+            if file2_lines is None:
                 return None
-
-            self.add_message(f"Parse of file '{file1_name}' successful!") # Post a message
-
-        # Medium SpawnCycle
-        if len(file2_name) > 0: # Only if a file was specified, though
-            file2_lines = self.load_from_file(file2_name)
-            if file2_lines is None: # File unopenable
-                self.add_message(f"Error: File '{file2_name}' could not be opened!\nEither the file doesn't exist, or it is inaccessible somehow.")
+        if len(file3_name) > 0: # Long SpawnCycle
+            file3_lines = self.parse_spawncycle_file(file3_name, 10, 'Long')
+            if file3_lines is None:
                 return None
 
-            if len(file2_lines) != 7: # Must be 7 lines (waves)
-                self.add_message(f"Error: 'Medium' SpawnCycle must be exactly 7 lines ({len(file2_lines)} lines found in file)!")
-                return None
-
-            # Parse the SpawnCycle and check for any errors
-            errors = parse.parse_syntax_import(file2_name, file2_lines)
-            if len(errors) > 0:
-                self.add_message(errors[0])
-                if len(errors) > 1:
-                    self.add_message('\n\n'.join([e.replace(f"Parse errors ('{file2_name}'):\n\n", '') for e in errors[1:]]), prefix=False)
-
-                # Show a dialog stating that errors occurred
-                x = self.scrollarea.mapToGlobal(self.scrollarea.rect().center()).x() - 150 # Anchor dialog to center of window
-                y = self.scrollarea.mapToGlobal(self.scrollarea.rect().center()).y()
-                diag_title = 'WARNING'
-                diag_text = f'{len(errors)} syntax error(s) were encountered during the import.\nFile could not be loaded.\nSee the Messages box below for more details.'
-                diag = widget_helpers.create_simple_dialog(self.scrollarea, diag_title, diag_text, x, y, button=True)
-                diag.setWindowIcon(QtGui.QIcon('img/icon_warning.png'))
-                diag.exec_() # Show a dialog to tell user to check messages
-                return None
-
-            self.add_message(f"Parse of file '{file2_name}' successful!") # Post a message
-
-        # Long SpawnCycle
-        if len(file3_name) > 0: # Only if a file was specified, though
-            file3_lines = self.load_from_file(file3_name)
-            if file3_lines is None: # File unopenable
-                self.add_message(f"Error: File '{file3_name}' could not be opened!\nEither the file doesn't exist, or it is inaccessible somehow.")
-                return None
-
-            if len(file3_lines) != 10: # Must be 7 lines (waves)
-                self.add_message(f"Error: 'Long' SpawnCycle must be exactly 10 lines ({len(file3_lines)} lines found in file)!")
-                return None
-
-            # Parse the SpawnCycle and check for any errors
-            errors = parse.parse_syntax_import(file3_name, file3_lines)
-            if len(errors) > 0:
-                self.add_message(errors[0])
-                if len(errors) > 1:
-                    self.add_message('\n\n'.join([e.replace(f"Parse errors ('{file3_name}'):\n\n", '') for e in errors[1:]]), prefix=False)
-
-                # Show a dialog stating that errors occurred
-                x = self.scrollarea.mapToGlobal(self.scrollarea.rect().center()).x() - 150 # Anchor dialog to center of window
-                y = self.scrollarea.mapToGlobal(self.scrollarea.rect().center()).y()
-                diag_title = 'WARNING'
-                diag_text = f'{len(errors)} syntax error(s) were encountered during the import.\nFile could not be loaded.\nSee the Messages box below for more details.'
-                diag = widget_helpers.create_simple_dialog(self.scrollarea, diag_title, diag_text, x, y, button=True)
-                diag.setWindowIcon(QtGui.QIcon('img/icon_warning.png'))
-                diag.exec_() # Show a dialog to tell user to check messages
-                return None
-
-            self.add_message(f"Parse of file '{file3_name}' successful!") # Post a message
-
         # If we reach this point, it's safe to create the JSON
         sdate = self.date_widget.selectedDate()
         sdate_str = f"{sdate.year()}-{sdate.month():02d}-{sdate.day():02d}"
@@ -31,17 +31,23 @@
 from PyQt5 import QtCore, QtGui, QtWidgets
 from functools import partial
 import widget_helpers
+import generator
+import analyze
+import presets
+import search
 import meta
+import zeds
 
 _DEF_FONT_FAMILY = 'Consolas'
 has_swapped_modes_generate = False
+has_shown_preset_errors = False
 
 _WINDOWSIZE_GENERATE_W = 800
 _WINDOWSIZE_GENERATE_H = 1000
-
-omega_zeds = ['Slasher Omega', 'Gorefast Omega', 'Stalker Omega', 'Tiny Crawler', 'Medium Crawler',
-              'Big Crawler', 'Huge Crawler', 'Ultra Crawler', 'Siren Omega', 'Husk Omega', 'Tiny Husk',
-              'Tiny Scrake', 'Scrake Omega', 'Scrake Emperor', 'Fleshpound Omega', 'Stalker Omega']
+_WINDOWSIZE_SEARCH_W = 800
+_WINDOWSIZE_SEARCH_H = 600
+_WINDOWSIZE_QUOTAS_W = 600
+_WINDOWSIZE_QUOTAS_H = 500
 
 class GenerateDialog(object):
     def __init__(self, parent, Dialog):
@@ -58,7 +64,7 @@ class GenerateDialog(object):
     def create_zed_button(self, zed_id):
         icon_path = widget_helpers.get_icon_path(zed_id)
         icon_w = icon_h = 40
-        if zed_id in omega_zeds:
+        if zeds.is_omega(zed_id):
             ss = "QToolTip {color: rgb(0, 0, 0);\nbackground-color: rgb(40, 40, 40);}\nQPushButton {border: 2px solid purple;}"
         else:
             ss = 'QToolTip {color: rgb(0, 0, 0);\nbackground-color: rgb(40, 40, 40);}' # Stylesheet
@@ -197,6 +203,39 @@ class GenerateDialog(object):
 
         return {'Frame': frame, 'Children': children}
 
+    # Creates the pane with the Seed textbox
+    def create_seed_pane(self):
+        # Style stuff
+        font = QtGui.QFont()
+        font.setFamily(_DEF_FONT_FAMILY)
+        font.setPointSize(10)
+        font.setWeight(75)
+        sp = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
+        sp.setHorizontalStretch(0)
+        sp.setVerticalStretch(0)
+        ss_label = 'QLabel {color: rgb(255, 255, 255); background-color: rgb(40, 40, 40);}\nQToolTip {color: rgb(0, 0, 0);}' # Stylesheet
+        ss_le = 'QLineEdit {color: rgb(255, 255, 255); background-color: rgb(40, 40, 40); border: 2px solid white;}\nQToolTip {color: rgb(0, 0, 0);}' # Stylesheet
+        tooltip = 'Sets the seed used to Generate the SpawnCycle.\nThe same seed and settings will always Generate the same SpawnCycle.\n\nLeave empty to use a random seed.'
+
+        # Create components
+        seed_label = widget_helpers.create_label(None, text='Seed                         ', style=ss_label, font=font, size_policy=sp, alignment=QtCore.Qt.AlignCenter)
+        seed_label.setToolTip(tooltip)
+        seed_field = widget_helpers.create_textfield('', font, sp, ss_le, 200, 28)
+        seed_field.setPlaceholderText('Random')
+        seed_field.setValidator(QtGui.QRegExpValidator(QtCore.QRegExp('[0-9]{0,10}'))) # Seeds are between 0 and 2^32 - 1
+        seed_field.setToolTip(tooltip)
+
+        # Create an hbox to put these in
+        frame = QtWidgets.QFrame()
+        hbox = QtWidgets.QHBoxLayout(frame)
+        hbox.setAlignment(QtCore.Qt.AlignLeft)
+        hbox.addWidget(seed_label)
+        hbox.addWidget(seed_field)
+        frame.setSizePolicy(sp)
+        frame.setStyleSheet("background-color: rgb(40, 40, 40);")
+
+        return {'Frame': frame, 'Children': {'Layout': hbox, 'Label': seed_label, 'TextBox': seed_field}}
+
     def swap_modes(self, first_time=False):
         if self.zed_mode == 'Default': # Swap to Custom
             if not first_time:
@@ -365,57 +404,20 @@ class GenerateDialog(object):
         generate_button = widget_helpers.create_button(None, None, None, text=' Generate! ', tooltip='Generate the SpawnCycle using the selected settings.', icon_path='img/icon_go.png', icon_w=24, icon_h=24, style=ss, size_policy=sp, font=font, options=False, squad=False, draggable=False)
         generate_button.clicked.connect(self.accept_preset)
         presets_button = widget_helpers.create_button(None, None, None, text=' Presets ', tooltip='Load a preset Generator configuration.', icon_path='img/icon_presets.png', icon_w=24, icon_h=24, style=ss, size_policy=sp, font=font, options=True, squad=False, draggable=False)
-        targets =   {'Light': partial(self.load_preset, 'Light'),
-                     'Moderate': partial(self.load_preset, 'Moderate'),
-                     'Heavy': partial(self.load_preset, 'Heavy'),
-                     'Albino': partial(self.load_preset, 'Albino'),
-                     'Poundemonium': partial(self.load_preset, 'Poundemonium'),
-                     'GSO': partial(self.load_preset, 'GSO'),
-                     'Min Settings': partial(self.load_preset, 'Min Settings'),
-                     'Max Settings': partial(self.load_preset, 'Max Settings'),
-                     'Putrid Pollution': partial(self.load_preset, 'Putrid Pollution'),
-                     'Sonic Subversion': partial(self.load_preset, 'Sonic Subversion'),
-                     'Android Annihilation': partial(self.load_preset, 'Android Annihilation'),
-                     'Arachnophobia': partial(self.load_preset, 'Arachnophobia'),
-                     'Cloaked Carnage': partial(self.load_preset, 'Cloaked Carnage'),
-                     'Hellish Inferno': partial(self.load_preset, 'Hellish Inferno'),
-                     'Trash Only': partial(self.load_preset, 'Trash Only'),
-                     'Medium Only': partial(self.load_preset, 'Medium Only'),
-                     'Large Only': partial(self.load_preset, 'Large Only'),
-                     'Boss Only': partial(self.load_preset, 'Boss Only'),
-                     'Large-less': partial(self.load_preset, 'Large-less'),
-                     'Custom Craziness': partial(self.load_preset, 'Custom Craziness'),
-                     'Boss Rush': partial(self.load_preset, 'Boss Rush'),
-                     'Omega Onslaught': partial(self.load_preset, 'Omega Onslaught')}
-        tooltips = {'Light': 'Predominantly Trash ZEDs',
-                    'Moderate': 'Decent mixture of Trash and Large ZEDs',
-                    'Heavy': 'Predominantly Large ZEDs',
-                    'Albino': 'Predominantly Albino ZEDs',
-                    'Poundemonium': 'Predominantly Larges, spawning earlier in the cycle',
-                    'GSO': 'Almost all Fleshpounds, spawning very early in the cycle',
-                    'Min Settings': 'All settings are at their minimum values',
-                    'Max Settings': 'All settings are at their maximum values',
-                    'Putrid Pollution': 'Predominantly Bloats',
-                    'Sonic Subversion': 'Predominantly Sirens',
-                    'Android Annihilation': 'Predominantly E.D.A.Rs',
-                    'Arachnophobia': 'Predominantly Crawlers',
-                    'Cloaked Carnage': 'Predominantly Stalkers',
-                    'Hellish Inferno': 'Predominantly Husks',
-                    'Trash Only': 'Only Trash ZEDs spawn',
-                    'Medium Only': 'Only Medium ZEDs spawn',
-                    'Large Only': 'Only Large ZEDs spawn',
-                    'Boss Only': 'Only Bosses spawn',
-                    'Large-less': 'No Large ZEDs or Bosses at all',
-                    'Custom Craziness': 'Predominantly Custom ZEDs',
-                    'Boss Rush': 'Predominantly Bosses',
-                    'Omega Onslaught': 'Predominantly Omega ZEDs'}
+        menu_presets = [name for name in presets.presets.keys() if name != 'Default'] # Default has its own button
+        targets = {name: partial(self.load_preset, name) for name in menu_presets}
+        tooltips = {name: presets.presets[name].description for name in menu_presets}
         presets_button.init_menu(targets, tooltips)
 
         # Setup mode button
         mode_button = widget_helpers.create_button(None, None, None, text=' Default ', tooltip='Swap the current ZED set/settings.', icon_path='img/icon_switch.png', icon_w=24, icon_h=24, style=ss, size_policy=sp, font=font, options=False, squad=False, draggable=False)
         mode_button.clicked.connect(self.swap_modes)
         reset_button = widget_helpers.create_button(None, None, None, text=' Restore Defaults ', tooltip='Reset all settings back to their defaults.', icon_path='img/icon_clear.png', icon_w=24, icon_h=24, style=ss, size_policy=sp, font=font, options=False, squad=False, draggable=False)
-        reset_button.clicked.connect(partial(self.load_preset, 'Default', None))
+        reset_button.clicked.connect(partial(self.load_preset, 'Default'))
+        search_button = widget_helpers.create_button(None, None, None, text=' Search.. ', tooltip='Generate lots of SpawnCycles using the selected settings and keep the ones that best meet the given targets.', icon_path='img/icon_analyze.png', icon_w=24, icon_h=24, style=ss, size_policy=sp, font=font, options=False, squad=False, draggable=False)
+        search_button.clicked.connect(self.open_search)
+        quotas_button = widget_helpers.create_button(None, None, None, text=' Quotas.. ', tooltip='Generate a SpawnCycle with an exact number of certain ZEDs or categories on each wave.', icon_path='img/icon_batch.png', icon_w=24, icon_h=24, style=ss, size_policy=sp, font=font, options=False, squad=False, draggable=False)
+        quotas_button.clicked.connect(self.open_quotas)
         self.button_pane = QtWidgets.QFrame()
 
         # Insert everything into the layout
@@ -424,11 +426,15 @@ class GenerateDialog(object):
         button_pane_layout.addWidget(presets_button, 0, 1, 1, 1)
         button_pane_layout.addWidget(reset_button, 0, 2, 1, 1)
         button_pane_layout.addWidget(mode_button, 0, 3, 1, 1)
+        button_pane_layout.addWidget(search_button, 0, 4, 1, 1)
+        button_pane_layout.addWidget(quotas_button, 0, 5, 1, 1)
         
         self.buttons.update({'Generate': generate_button})
         self.buttons.update({'Reset': reset_button})
         self.buttons.update({'Presets': presets_button})
         self.buttons.update({'Swap Modes': mode_button})
+        self.buttons.update({'Search': search_button})
+        self.buttons.update({'Quotas': quotas_button})
 
     # Sets up the scrollarea where all of the main options are
     def setup_scrollarea(self, Dialog):
@@ -477,6 +483,7 @@ class GenerateDialog(object):
         self.slider_panes.update({'Large Min Wave': large_minwave_pane})
         self.slider_panes.update({'SpawnRage Min Wave': spawnrage_minwave_pane})
         self.slider_panes.update({'Boss Min Wave': boss_minwave_pane})
+        self.seed_pane = self.create_seed_pane() # Not a slider, so it's kept out of the presets
 
         density_tooltip_pfx = 'Sets the relative Density for'
         density_tooltip_sfx = 'to appear in the SpawnCycle.'
@@ -649,6 +656,7 @@ class GenerateDialog(object):
         self.scrollarea_contents_layout.addWidget(large_minwave_pane['Frame'])
         self.scrollarea_contents_layout.addWidget(spawnrage_minwave_pane['Frame'])
         self.scrollarea_contents_layout.addWidget(boss_minwave_pane['Frame'])
+        self.scrollarea_contents_layout.addWidget(self.seed_pane['Frame'])
 
         self.scrollarea_contents_layout.addWidget(spacer_label1)
         self.scrollarea_contents_layout.addWidget(self.density_settings_label)
@@ -711,132 +719,121 @@ class GenerateDialog(object):
         self.scrollarea_contents_layout.addWidget(abominationspawn_pane['Frame'])
 
     # Called when this dialog is closed
+    # The current settings are kept as a compiled preset, so reopening the dialog and generating again doesn't recompile them
+    # They're kept even if they can't be generated with (ie: Min Squads > Max Squads), so nothing is lost. check_state reports them when the dialog is reopened
     def teardown(self):
-        last_preset = list(self.get_slider_values().values())
-        last_preset[0] = (1 if last_preset[0] == 4 else (2 if last_preset[0] == 7 else 3))
-        self.parent.last_generate_mode = self.zed_mode
-        self.parent.last_generate_preset = last_preset
+        self.parent.last_generate_preset = presets.Preset('Last Used', self.get_slider_positions(), zed_set=self.zed_mode, validate=False)
 
-    # Loads a preset into the generator
+    # Loads a preset into the generator. Takes either the name of a preset or a Preset (ie: the one from last generation)
     def load_preset(self, preset):
-        presets = {'Light': [3, 15, 20, 3, 5, 5, 7, 10, 10,                        100, 50, 15, 0,               100, 100, 0, 100, 5, 100, 5, 0, 100, 5, 0, 0, 0, 0, 0, 100, 0,                      100, 100, 0, 0, 100, 0, 0, 0, 0,                   100, 0, 0, 0, 0, 100, 0, 100, 0, 0, 0,                   0, 0, 0, 0, 0, 0],
-                   'Moderate': [3, 20, 25, 4, 7, 4, 4, 8, 10,                      75, 60, 35, 0,                100, 100, 0, 100, 10, 100, 10, 0, 100, 10, 0, 0, 0, 0, 0, 100, 0,                   100, 100, 0, 0, 100, 0, 0, 0, 0,                   100, 0, 0, 0, 0, 100, 5, 100, 0, 5, 0,                   0, 0, 0, 0, 0, 0],
-                   'Heavy': [3, 30, 35, 5, 10, 2, 2, 7, 10,                        60, 50, 40, 0,                100, 100, 0, 100, 15, 100, 15, 0, 100, 15, 0, 0, 0, 0, 0, 100, 0,                   100, 100, 0, 0, 100, 0, 0, 0, 0,                   100, 0, 0, 0, 0, 100, 10, 100, 0, 10, 0,                 0, 0, 0, 0, 0, 0],
-                   'Albino': [3, 25, 30, 4, 8, 1, 4, 8, 10,                        100, 30, 30, 0,               50, 50, 0, 100, 80, 100, 80, 0, 100, 80, 0, 0, 0, 0, 0, 50, 0,                      100, 100, 0, 0, 100, 0, 0, 0, 0,                   100, 0, 0, 0, 0, 100, 5, 100, 0, 5, 0,                   0, 0, 0, 0, 0, 0],
-                   'Poundemonium': [3, 25, 35, 5, 10, 4, 3, 8, 10,                 30, 30, 65, 0,                100, 100, 0, 100, 15, 100, 15, 0, 100, 15, 0, 0, 0, 0, 0, 100, 0,                   100, 100, 0, 0, 100, 0, 0, 0, 0,                   50, 0, 0, 0, 0, 100, 7, 100, 0, 7, 0,                    0, 0, 0, 0, 0, 0],
-                   'GSO': [3, 25, 40, 8, 10, 4, 3, 5, 10,                          15, 15, 100, 0,               100, 100, 0, 100, 15, 100, 15, 0, 100, 15, 0, 0, 0, 0, 0, 100, 0,                   100, 100, 0, 0, 100, 0, 0, 0, 0,                   10, 0, 0, 0, 0, 100, 12, 100, 0, 12, 0,                  0, 0, 0, 0, 0, 0],
-                   'Min Settings': [1, 1, 50, 1, 8, 1, 1, 1, 4,                    100, 100, 100, 0,             100, 100, 0, 100, 0, 100, 0, 0, 100, 0, 0, 0, 0, 0, 0, 100, 0,                      100, 100, 0, 0, 100, 0, 0, 0, 0,                   100, 0, 0, 0, 0, 100, 0, 100, 0, 0, 0,                   0, 0, 100, 0, 0, 100],
-                   'Max Settings': [3, 100, 100, 10, 10, 1, 1, 1, 10,              100, 100, 100, 0,             100, 100, 0, 100, 100, 100, 100, 0, 100, 100, 0, 0, 0, 0, 0, 100, 0,                100, 100, 0, 0, 100, 0, 0, 0, 0,                   100, 0, 0, 0, 0, 100, 100, 100, 0, 100, 0,               0, 0, 100, 0, 0, 100],
-                   'Putrid Pollution': [3, 15, 25, 5, 8, 3, 5, 10, 10,             60, 75, 10, 0,                100, 100, 0, 100, 5, 100, 5, 0, 100, 5, 0, 0, 0, 0, 0, 100, 0,                      100, 30, 0, 0, 30, 0, 0, 0, 0,                     100, 0, 0, 0, 0, 100, 5, 100, 0, 5, 0,                   0, 0, 0, 0, 0, 0],
-                   'Sonic Subversion': [3, 15, 25, 5, 8, 3, 5, 10, 10,             60, 75, 10, 0,                100, 100, 0, 100, 5, 100, 5, 0, 100, 5, 0, 0, 0, 0, 0, 100, 0,                      30, 30, 0, 0, 100, 0, 0, 0, 0,                     100, 0, 0, 0, 0, 100, 5, 100, 0, 5, 0,                   0, 0, 0, 0, 0, 0],
-                   'Android Annihilation': [3, 15, 25, 5, 8, 3, 5, 10, 10,         60, 75, 10, 0,                100, 100, 0, 100, 5, 100, 5, 0, 100, 5, 0, 0, 0, 0, 0, 100, 0,                      30, 30, 0, 0, 30, 0, 10, 100, 100,                 100, 0, 0, 0, 0, 100, 5, 100, 0, 5, 0,                   0, 0, 0, 0, 0, 0],
-                   'Arachnophobia': [3, 15, 25, 5, 8, 3, 5, 10, 10,                100, 10, 10, 0,               10, 10, 0, 10, 5, 10, 5, 0, 100, 15, 0, 0, 0, 0, 0, 10,  0,                         100, 100, 0, 0, 100, 0, 0, 0, 0,                   100, 0, 0, 0, 0, 100, 5, 100, 0, 5, 0,                   0, 0, 0, 0, 0, 0],
-                   'Cloaked Carnage': [3, 15, 25, 5, 8, 3, 5, 10, 10,              100, 10, 10, 0,               10, 10, 0, 10, 5, 10, 5, 0, 10, 5, 0, 0, 0, 0, 0, 100, 0,                           100, 100, 0, 0, 100, 0, 0, 0, 0,                   100, 0, 0, 0, 0, 100, 5, 100, 0, 5, 0,                   0, 0, 0, 0, 0, 0],
-                   'Hellish Inferno': [2, 15, 25, 5, 10, 2, 4, 7, 7,               10, 100, 10, 0,               100, 100, 0, 100, 10, 100, 10, 0, 100, 10, 0, 0, 0, 0, 0, 100, 0,                   0, 100, 0, 0, 0, 0, 0, 0, 0,                       100, 0, 0, 0, 0, 100, 5, 100, 0, 5, 0,                   0, 0, 0, 0, 0, 0],
-                   'Trash Only': [3, 15, 20, 1, 4, 3, 4, 8, 10,                    100, 0, 0, 0,                 100, 100, 0, 100, 10, 100, 10, 0, 100, 10, 0, 0, 0, 0, 0, 100, 0,                   100, 100, 0, 0, 100, 0, 0, 0, 0,                   100, 0, 0, 0, 0, 100, 5, 100, 0, 5, 0,                   0, 0, 0, 0, 0, 0],
-                   'Medium Only': [3, 15, 20, 1, 4, 3, 4, 8, 10,                   0, 100, 0, 0,                 100, 100, 0, 100, 10, 100, 10, 0, 100, 10, 0, 0, 0, 0, 0, 100, 0,                   100, 100, 0, 0, 100, 0, 0, 0, 0,                   100, 0, 0, 0, 0, 100, 5, 100, 0, 5, 0,                   0, 0, 0, 0, 0, 0],
-                   'Large Only': [3, 15, 20, 1, 4, 3, 1, 8, 10,                    0, 0, 100, 0,                 100, 100, 0, 100, 10, 100, 10, 0, 100, 10, 0, 0, 0, 0, 0, 100, 0,                   100, 100, 0, 0, 100, 0, 0, 0, 0,                   100, 0, 0, 0, 0, 100, 5, 100, 0, 5, 0,                   0, 0, 0, 0, 0, 0],
-                   'Boss Only': [3, 15, 20, 1, 4, 3, 4, 8, 1,                      0, 0, 0, 100,                 100, 100, 0, 100, 10, 100, 10, 0, 100, 10, 0, 0, 0, 0, 0, 100, 0,                   100, 100, 0, 0, 100, 0, 0, 0, 0,                   100, 0, 0, 0, 0, 100, 5, 100, 0, 5, 0,                   100, 100, 100, 100, 100, 100],
-                   'Large-less': [2, 15, 25, 5, 10, 3, 7, 7, 7,                    100, 100, 0, 0,               100, 100, 0, 100, 30, 100, 30, 0, 100, 30, 0, 0, 0, 0, 0, 100, 0,                   100, 100, 0, 0, 100, 0, 0, 0, 0,                   100, 0, 0, 0, 0, 100, 10, 100, 0, 10, 0,                 0, 0, 0, 0, 0, 0],
-                   'Custom Craziness': [3, 20, 30, 3, 6, 2, 4, 7, 7,               100, 100, 100, 50,            100, 100, 0, 100, 10, 100, 10, 0, 100, 10, 0, 0, 0, 0, 0, 100, 0,                   100, 100, 0, 0, 100, 0, 100, 100, 100,             100, 35, 0, 0, 0, 75, 8, 100, 35, 8, 0,                  100, 100, 100, 100, 100, 0],
-                   'Boss Rush': [1, 15, 20, 3, 6, 2, 3, 4, 2,                      10, 10, 10, 100,              100, 100, 0, 10, 100, 100, 100, 0, 10, 10, 0, 0, 0, 0, 0, 100, 0,                   100, 100, 0, 0, 100, 0, 100, 100, 100,             100, 15, 0, 0, 0, 100, 5, 100, 15, 5, 0,                 100, 100, 100, 100, 100, 0],
-                   'Omega Onslaught': [3, 8, 15, 3, 7, 3, 4, 10, 10,               100, 100, 100, 0,             100, 100, 75, 100, 10, 100, 10, 75, 100, 10, 20, 20, 20, 5, 5, 100, 75,             100, 100, 75, 15, 100, 75, 0, 0, 0,                100, 0, 15, 5, 15, 100, 0, 100, 0, 0, 60,                0, 0, 0, 0, 0, 0],
-                   'Default': [3, 8, 15, 3, 7, 3, 4, 7, 7,                         100, 100, 100, 0,             100, 100, 0, 100, 30, 100, 30, 0, 100, 30, 0, 0, 0, 0, 0, 100, 0,                   100, 100, 0, 0, 100, 0, 0, 0, 0,                   100, 0, 0, 0, 0, 100, 10, 100, 0, 10, 0,                 0, 0, 100, 0, 0, 100]}
-
-        if isinstance(preset, list): # This an old preset from last generation
-            preset_data = preset
-            if self.parent.last_generate_mode is not None and self.parent.last_generate_mode == 'Custom':
-                self.swap_modes()
-                self.swap_modes()
-            elif self.parent.last_generate_mode is not None and self.parent.last_generate_mode == 'Default':
-                self.swap_modes()
-        else: # User selected a preset from the menu
-            preset_data = presets[preset]
+        if isinstance(preset, str): # User selected a preset from the menu
+            preset = presets.presets[preset]
 
-            # Swap to the appropriate ZED set for these presets for the first time
-            if preset == 'Default' and self.zed_mode == 'Custom':
+            # Swap to the appropriate ZED set for this preset
+            if preset.zed_set != self.zed_mode:
                 self.swap_modes()
-            elif preset in ['Boss Rush', 'Custom Craziness', 'Boss Only', 'Android Annihilation', 'Omega Onslaught'] and self.zed_mode == 'Default':
+        else: # This is the preset from last generation
+            if preset.zed_set == 'Custom':
                 self.swap_modes()
-            elif preset not in ['Boss Rush', 'Custom Craziness', 'Boss Only', 'Android Annihilation', 'Omega Onslaught'] and self.zed_mode == 'Custom':
+                self.swap_modes()
+            else:
                 self.swap_modes()
 
-        # Activate the preset
-        sliders = [x['Children']['Slider'] for x in self.slider_panes.values()]
-        for i in range(len(preset_data)):
-            sliders[i].setValue(preset_data[i])
-
-    # Returns true if the entire list has the given value for each cell
-    def all_value(self, lst, value):
-        for val in lst:
-            if val != value:
-                return False
-        return True
+        # Activate the preset. Sliders are matched up by name, and the SpawnCycle Length always comes first so the Min Wave sliders have the right range
+        for (key, value) in preset.sliders.items():
+            self.slider_panes[key]['Children']['Slider'].setValue(value)
 
     # Checks if its possible to generate
     def check_state(self):
         errors = []
         sv = self.get_slider_values() 
-        trash_vals = [sv['Cyst Density'], sv['Alpha Clot Density'], sv['Slasher Density'], sv['Gorefast Density'], sv['Crawler Density'], sv['Stalker Density']]
-        medium_vals = [sv['Bloat Density'], sv['Husk Density'], sv['Siren Density'], sv['E.D.A.R Trapper Density'], sv['E.D.A.R Blaster Density'], sv['E.D.A.R Bomber Density']]
-        large_vals = [sv['Scrake Density'], sv['Quarter Pound Density'], sv['Fleshpound Density']]
-        boss_vals = [sv['Hans Density'], sv['Patriarch Density'], sv['King Fleshpound Density'], sv['Abomination Density'], sv['Matriarch Density'], sv['Abomination Spawn Density']]
+        zed_sampler = presets.get_sampler(sv) # Compiling the sliders tells us what can actually be drawn on each wave. Generating reuses this
 
         # Ensure slider values are correct
         if sv['Min Squads'] > sv['Max Squads']:
             errors.append(f"- Min Squads Per Wave must be <= Max Squads Per Wave")
         if sv['Squad Min Length'] > sv['Squad Max Length']:
             errors.append(f"- Min Squad Size must be <= Max Squad Size")
-        if sv['Trash Density'] != 0 and self.all_value(trash_vals, 0):
-            errors.append(f"- Trash Density found to be non-zero but all ZEDs in category have 0% Density!")
-        if sv['Medium Density'] != 0 and self.all_value(medium_vals, 0):
-            errors.append(f"- Medium Density found to be non-zero but all ZEDs in category have 0% Density!")
-        if sv['Large Density'] != 0 and self.all_value(large_vals, 0):
-            errors.append(f"- Large Density found to be non-zero but all ZEDs in category have 0% Density!")
-        if sv['Boss Density'] != 0 and self.all_value(boss_vals, 0):
-            errors.append(f"- Boss Density found to be non-zero but all ZEDs in category have 0% Density!")
+        for category in zed_sampler.get_empty_categories():
+            errors.append(f"- {category} Density found to be non-zero but all ZEDs in category have 0% Density!")
         if sv['Trash Density'] == 0 and sv['Medium Density'] == 0 and sv['Large Density'] == 0 and sv['Boss Density'] == 0:
             errors.append(f"- At least one Category Density setting must be non-zero!")
-        if sv['Large Min Wave'] > 1 and sv['Trash Density'] == 0 and sv['Medium Density'] == 0 and sv['Large Density'] > 0 and sv['Boss Density'] == 0:
-            errors.append(f"- Params suggest Larges Only but Large ZED Min Wave found to be > 1!")
-        if sv['Boss Min Wave'] > 1 and sv['Trash Density'] == 0 and sv['Medium Density'] == 0 and sv['Large Density'] == 0 and sv['Boss Density'] > 0:
-            errors.append(f"- Params suggest Bosses Only but Boss Min Wave found to be > 1!")
-        if sv['Large Min Wave'] > 1 and sv['Boss Min Wave'] > 1 and sv['Trash Density'] == 0 and sv['Medium Density'] == 0 and sv['Large Density'] > 0 and sv['Boss Density'] > 0:
-            errors.append(f"- Params suggest Larges/Bosses Only but Large ZED Min Wave and Boss Min Wave found to be > 1!")
+        else:
+            impossible_waves = zed_sampler.get_impossible_waves()
+            if len(impossible_waves) > 0: # Only Larges / Bosses have Density but they aren't allowed on these waves yet
+                wave_str = ', '.join([str(w) for w in impossible_waves])
+                errors.append(f"- No ZEDs can be generated on Wave(s) {wave_str}! Large ZED Min Wave / Boss Min Wave exclude every category with non-zero Density")
 
         return errors
 
+    # Shows a dialog listing the given errors, encountered while attempting the given action (ie: 'Generate')
+    def show_errors(self, errors, action, anchor=None):
+        if anchor is None:
+            anchor = self.scrollarea
+        diag_title = 'SpawnCycler'
+        x = anchor.mapToGlobal(anchor.rect().center()).x() - 150 # Anchor dialog to center of window
+        y = anchor.mapToGlobal(anchor.rect().center()).y()
+        err_text = '\n'.join(errors)
+        diag_text = f"The following error(s) were encountered while attempting to {action}:\n\n{err_text}\n"
+        diag = widget_helpers.create_simple_dialog(anchor, diag_title, diag_text, x, y, button=True)
+        diag.setWindowIcon(QtGui.QIcon('img/icon_warning.png'))
+        diag.exec_() # Show a dialog to tell user to check messages
+
     # Compiles all current slider data and passes it back to the main window
     def accept_preset(self):
         # Check slider values first to make sure they're okay
         errors = self.check_state()
 
         if len(errors) > 0: # Errors occurred
-            # Show a dialog explaining this
-            diag_title = 'SpawnCycler'
-            x = self.scrollarea.mapToGlobal(self.scrollarea.rect().center()).x() - 150 # Anchor dialog to center of window
-            y = self.scrollarea.mapToGlobal(self.scrollarea.rect().center()).y()
-            err_text = '\n'.join(errors)
-            diag_text = f"The following error(s) were encountered while attempting to Generate:\n\n{err_text}\n"
-            diag = widget_helpers.create_simple_dialog(self.scrollarea, diag_title, diag_text, x, y, button=True)
-            diag.setWindowIcon(QtGui.QIcon('img/icon_warning.png'))
-            diag.exec_() # Show a dialog to tell user to check messages
+            self.show_errors(errors, 'Generate')
         else: # No errors. Good to go!
-            self.parent.generate_wavedefs(self.get_slider_values())
+            self.parent.generate_wavedefs(self.get_slider_values(), seed=self.get_seed())
+
+    # Opens the Search window using the current slider values
+    def open_search(self):
+        # Check slider values first to make sure they're okay
+        errors = self.check_state()
+
+        if len(errors) > 0: # Errors occurred
+            self.show_errors(errors, 'Search')
+            return
+
+        dialog = widget_helpers.CustomDialog(None, QtCore.Qt.WindowCloseButtonHint)
+        dialog.ui = SearchDialog(self, dialog, self.get_slider_values())
+        dialog.ui.setupUi()
+        dialog.exec_()
+
+    # Opens the Quotas window using the current slider values
+    def open_quotas(self):
+        # Check slider values first to make sure they're okay
+        errors = self.check_state()
+
+        if len(errors) > 0: # Errors occurred
+            self.show_errors(errors, 'Generate')
+            return
+
+        dialog = widget_helpers.CustomDialog(None, QtCore.Qt.WindowCloseButtonHint)
+        dialog.ui = QuotaDialog(self, dialog, self.get_slider_values())
+        dialog.ui.setupUi()
+        dialog.exec_()
+
+    # Returns the seed typed into the Seed textbox, or None if it's empty
+    def get_seed(self):
+        seed_text = self.seed_pane['Children']['TextBox'].text()
+        if seed_text == '':
+            return None
+        return min(int(seed_text), generator.SEED_MAX)
+
+    # Returns the position of every slider by name
+    def get_slider_positions(self):
+        return {key: data['Children']['Slider'].value() for (key, data) in self.slider_panes.items()}
 
     # Returns the values of all sliders as a neatly formatted dict
     def get_slider_values(self):
-        slider_vals = {}
-        for (key, data) in self.slider_panes.items():
-            slider_vals.update({key: data['Children']['Slider'].value()})
+        slider_vals = self.get_slider_positions()
 
         # Change game length at last second (to actual wave count)
-        if slider_vals['Game Length'] == 3:
-            slider_vals['Game Length'] = 10
-        elif slider_vals['Game Length'] == 2:
-            slider_vals['Game Length'] = 7
-        else:
-            slider_vals['Game Length'] = 4
+        slider_vals['Game Length'] = presets.get_num_waves(slider_vals['Game Length'])
 
         return slider_vals
 
@@ -858,6 +855,325 @@ class GenerateDialog(object):
         else:
             self.swap_modes()
 
+        # Let the user know about any of their presets that couldn't be loaded (only once)
+        global has_shown_preset_errors
+        if not has_shown_preset_errors and len(presets.user_preset_errors) > 0:
+            self.parent.add_message(f"{len(presets.user_preset_errors)} user preset(s) could not be loaded:\n\n" + '\n\n'.join(presets.user_preset_errors))
+            has_shown_preset_errors = True
+
     def retranslateUi(self, Dialog):
         _translate = QtCore.QCoreApplication.translate
 
+
+# Runs a CandidateSearch in the background so the Search window stays responsive
+class SearchWorker(QtCore.QThread):
+    progress = QtCore.pyqtSignal(int, int) # Candidates done, total candidates
+    ranked_ready = QtCore.pyqtSignal(object) # Emitted whenever the ranked list changes
+    search_done = QtCore.pyqtSignal()
+
+    def __init__(self, engine):
+        super().__init__()
+        self.engine = engine
+
+    def run(self):
+        self.engine.run(progress=self.progress.emit, ranked=self.ranked_ready.emit)
+        self.search_done.emit()
+
+    def cancel(self):
+        self.engine.cancel()
+
+
+# Window for generating lots of SpawnCycles with the current settings and keeping the ones that best meet the given targets
+class SearchDialog(object):
+    def __init__(self, parent, Dialog, slider_data):
+        self.parent = parent # The GenerateDialog this was opened from
+        self.Dialog = Dialog
+        self.slider_data = slider_data # Snapshot of the sliders, so the results can be regenerated even if the sliders change
+        self.param_widgets = {}
+        self.field_limits = {} # Key -> (min, max, default) for fields that can't be left as 'Any'
+        self.ranked = []
+        self.worker = None
+
+    # Creates a label and textbox pair for one of the search settings
+    # Fields given limits are clamped to them (and reset to the default if left empty), same as the Analyze settings
+    def create_field(self, key, text, default, tooltip, max_length, limits=None):
+        # Style stuff
+        font = QtGui.QFont()
+        font.setFamily(_DEF_FONT_FAMILY)
+        font.setPointSize(10)
+        font.setWeight(75)
+        sp = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
+        sp.setHorizontalStretch(0)
+        sp.setVerticalStretch(0)
+        ss_label = 'QLabel {color: rgb(255, 255, 255); background-color: rgb(40, 40, 40);}\nQToolTip {color: rgb(0, 0, 0);}' # Stylesheet
+        ss_le = 'QLineEdit {color: rgb(255, 255, 255); background-color: rgb(40, 40, 40); border: 2px solid white;}\nQToolTip {color: rgb(0, 0, 0);}' # Stylesheet
+
+        # Create components
+        label = widget_helpers.create_label(None, text=text, tooltip=tooltip, style=ss_label, font=font, size_policy=sp, alignment=QtCore.Qt.AlignLeft)
+        field = widget_helpers.create_textfield(default, font, sp, ss_le, 100, 28)
+        field.setPlaceholderText('Any' if limits is None else default)
+        field.setValidator(QtGui.QRegExpValidator(QtCore.QRegExp(f"[0-9]{{0,{max_length}}}")))
+        field.setToolTip(tooltip)
+        self.param_widgets.update({key: field})
+        if limits is not None:
+            self.field_limits.update({key: (limits[0], limits[1], int(default))})
+            field.editingFinished.connect(partial(self.commit_field, key))
+
+        # Create an hbox to put these in
+        frame = QtWidgets.QFrame()
+        hbox = QtWidgets.QHBoxLayout(frame)
+        hbox.setAlignment(QtCore.Qt.AlignLeft)
+        hbox.addWidget(label)
+        hbox.addWidget(field)
+
+        return frame
+
+    # Returns the value of the given field, or None if it's empty
+    # Fields with limits are clamped to them, and give their default if empty
+    def get_field(self, key):
+        text = self.param_widgets[key].text()
+        if key in self.field_limits:
+            (min_value, max_value, default) = self.field_limits[key]
+            return min(max(int(text) if text != '' else default, min_value), max_value)
+        if text == '':
+            return None
+        return int(text)
+
+    # Called when a field with limits is changed. Puts the value back in range
+    def commit_field(self, key):
+        value = str(self.get_field(key))
+        if self.param_widgets[key].text() != value:
+            self.param_widgets[key].setText(value)
+
+    # Returns the band for the given min / max fields, or None if both are empty
+    # Either side of the band is None if its field is empty (no limit on that side)
+    def get_band(self, min_key, max_key):
+        (band_min, band_max) = (self.get_field(min_key), self.get_field(max_key))
+        if band_min is None and band_max is None:
+            return None
+        return (band_min, band_max)
+
+    # Starts a new search using the current settings
+    def start_search(self):
+        self.cancel_search()
+
+        targets = {'Difficulty': self.get_band('Min Difficulty', 'Max Difficulty'),
+                   'Large Share': self.get_band('Min Large', 'Max Large'),
+                   'No Boss Before': self.get_field('No Boss Before')}
+        params = {'Difficulty': self.param_widgets['Difficulty'].currentIndex(),
+                  'WaveSizeFakes': self.get_field('WaveSizeFakes'),
+                  'MaxMonsters': self.get_field('MaxMonsters')}
+        num_candidates = max(self.get_field('Candidates') or 1, 1)
+        top_k = max(self.get_field('Keep Top') or 1, 1)
+
+        self.ranked = []
+        self.results_list.clear()
+        self.progress_label.setText(f"Searching.. 0 / {num_candidates}")
+        self.buttons['Search'].setEnabled(False)
+        self.buttons['Cancel'].setEnabled(True)
+
+        self.worker = SearchWorker(search.CandidateSearch(self.slider_data, num_candidates, top_k, targets, params))
+        self.worker.progress.connect(self.update_progress)
+        self.worker.ranked_ready.connect(self.update_results)
+        self.worker.search_done.connect(self.finish_search)
+        self.worker.start()
+
+    # Stops the search in progress (if there is one). Whatever was found so far is kept
+    def cancel_search(self):
+        if self.worker is None:
+            return
+        self.worker.cancel()
+        self.worker.wait()
+        self.finish_search()
+
+    # Called when the search ends, whether it finished or not
+    def finish_search(self):
+        if self.worker is None:
+            return
+        engine = self.worker.engine
+        status = 'Search complete!' if not engine.cancelled else 'Search cancelled.'
+        self.progress_label.setText(f"{status} {engine.num_matched} of {engine.num_evaluated} candidates met the targets")
+        self.buttons['Search'].setEnabled(True)
+        self.buttons['Cancel'].setEnabled(False)
+        self.worker = None
+
+    # Updates the progress text
+    def update_progress(self, num_done, num_total):
+        if self.worker is None:
+            return
+        self.progress_label.setText(f"Searching.. {num_done} / {num_total} ({self.worker.engine.num_matched} met the targets)")
+
+    # Refills the results list with the new ranked candidates
+    def update_results(self, ranked):
+        self.ranked = ranked
+        self.results_list.clear()
+        for (i, candidate) in enumerate(ranked):
+            stats = candidate['Stats']
+            self.results_list.addItem(f"#{i+1:<3} Seed: {candidate['Seed']:<11} Avg Difficulty: {candidate['Average Difficulty']:<10.0f} Larges: {candidate['Large Share']:5.1f}%  Bosses: {stats['Boss']}")
+
+    # Loads the selected candidate into the editor
+    def load_selected(self):
+        row = self.results_list.currentRow()
+        if row < 0 or row >= len(self.ranked):
+            return
+        seed = self.ranked[row]['Seed']
+        self.Dialog.close()
+        self.parent.parent.generate_wavedefs(self.slider_data, seed=seed)
+
+    # Called when this dialog is closed
+    def teardown(self):
+        self.cancel_search()
+
+    def setupUi(self):
+        self.Dialog.setFixedSize(_WINDOWSIZE_SEARCH_W, _WINDOWSIZE_SEARCH_H)
+        self.Dialog.setStyleSheet("background-color: rgb(40, 40, 40);")
+        self.Dialog.setWindowTitle('Search')
+        self.Dialog.setWindowIcon(QtGui.QIcon('img/icon_analyze.png'))
+        main_layout = QtWidgets.QVBoxLayout(self.Dialog)
+
+        # Style stuff
+        font = QtGui.QFont()
+        font.setFamily(_DEF_FONT_FAMILY)
+        font.setPointSize(10)
+        font.setWeight(75)
+        font_button = QtGui.QFont()
+        font_button.setFamily(_DEF_FONT_FAMILY)
+        font_button.setPointSize(12)
+        font_button.setWeight(75)
+        sp = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
+        sp.setHorizontalStretch(0)
+        sp.setVerticalStretch(0)
+        ss_label = 'QLabel {color: rgb(255, 255, 255); background-color: rgb(40, 40, 40);}\nQToolTip {color: rgb(0, 0, 0);}' # Stylesheet
+        ss_button = 'QPushButton {color: rgb(255, 255, 255);\nbackground-color: rgb(40, 40, 40);} QToolTip {color: rgb(0, 0, 0)};' # Stylesheet
+        ss_cbox = 'QToolTip {color: rgb(0, 0, 0);} QComboBox {color: rgb(255, 255, 255); background-color: rgb(40, 40, 40);}' # Stylesheet
+
+        # Set up the search settings
+        fields = [self.create_field('Candidates', 'Candidates           ', '500', 'The number of SpawnCycles to Generate and check.', 6),
+                  self.create_field('Keep Top', 'Keep Top             ', '10', 'The number of best SpawnCycles to keep.', 3),
+                  self.create_field('WaveSizeFakes', 'Wave Size Fakes      ', '12', "The number of players to sample the waves from.\nSame as the 'Analyze' setting.", len(str(analyze._WAVESIZE_MAX)), limits=(analyze._WAVESIZE_MIN, analyze._WAVESIZE_MAX)),
+                  self.create_field('MaxMonsters', 'Max Monsters         ', '32', "The maximum number of ZEDs that can be alive at once.\nSame as the 'Analyze' setting.", len(str(analyze._MAXMONSTERS_MAX)), limits=(analyze._MAXMONSTERS_MIN, analyze._MAXMONSTERS_MAX)),
+                  self.create_field('Min Difficulty', 'Min Wave Difficulty  ', '', 'The lowest average difficulty allowed on any wave.', 9),
+                  self.create_field('Max Difficulty', 'Max Wave Difficulty  ', '', 'The highest average difficulty allowed on any wave.', 9),
+                  self.create_field('Min Large', 'Min Large Share (%)  ', '', 'The lowest share of Large ZEDs allowed across the whole SpawnCycle.', 3),
+                  self.create_field('Max Large', 'Max Large Share (%)  ', '', 'The highest share of Large ZEDs allowed across the whole SpawnCycle.', 3),
+                  self.create_field('No Boss Before', 'No Boss Before Wave  ', '', 'Bosses are not allowed to appear before this wave.', 2)]
+        difficulty_label = widget_helpers.create_label(None, text='Difficulty           ', tooltip="The Difficulty of the game to sample from.\nSame as the 'Analyze' setting.", style=ss_label, font=font, size_policy=sp, alignment=QtCore.Qt.AlignLeft)
+        difficulty_cbox = widget_helpers.create_combobox(None, options=['Normal', 'Hard', 'Suicidal', 'Hell on Earth'], style=ss_cbox, size_policy=sp)
+        difficulty_cbox.setCurrentIndex(3)
+        self.param_widgets.update({'Difficulty': difficulty_cbox})
+        difficulty_frame = QtWidgets.QFrame()
+        difficulty_frame_layout = QtWidgets.QHBoxLayout(difficulty_frame)
+        difficulty_frame_layout.setAlignment(QtCore.Qt.AlignLeft)
+        difficulty_frame_layout.addWidget(difficulty_label)
+        difficulty_frame_layout.addWidget(difficulty_cbox)
+        fields.insert(2, difficulty_frame)
+
+        config_frame = QtWidgets.QFrame()
+        config_frame_layout = QtWidgets.QGridLayout(config_frame)
+        for (i, field) in enumerate(fields):
+            config_frame_layout.addWidget(field, i // 2, i % 2, 1, 1)
+
+        # Set up the results
+        self.progress_label = widget_helpers.create_label(None, text='Press Search to begin.', style=ss_label, font=font, alignment=QtCore.Qt.AlignLeft)
+        self.results_list = QtWidgets.QListWidget()
+        self.results_list.setFont(font)
+        self.results_list.setStyleSheet('QListWidget {color: rgb(255, 255, 255); background-color: rgb(50, 50, 50);}')
+        self.results_list.setToolTip('Double-click a SpawnCycle to load it.')
+        self.results_list.itemDoubleClicked.connect(self.load_selected)
+
+        # Set up the buttons
+        search_button = widget_helpers.create_button(None, None, None, text=' Search ', tooltip='Generate and check SpawnCycles using the current settings.', icon_path='img/icon_go.png', icon_w=24, icon_h=24, style=ss_button, size_policy=sp, font=font_button, options=False, squad=False, draggable=False)
+        search_button.clicked.connect(self.start_search)
+        cancel_button = widget_helpers.create_button(None, None, None, text=' Cancel ', tooltip='Stop the search. Results found so far are kept.', icon_path='img/icon_clear.png', icon_w=24, icon_h=24, style=ss_button, size_policy=sp, font=font_button, options=False, squad=False, draggable=False)
+        cancel_button.clicked.connect(self.cancel_search)
+        cancel_button.setEnabled(False)
+        load_button = widget_helpers.create_button(None, None, None, text=' Load ', tooltip='Load the selected SpawnCycle.', icon_path='img/icon_open.png', icon_w=24, icon_h=24, style=ss_button, size_policy=sp, font=font_button, options=False, squad=False, draggable=False)
+        load_button.clicked.connect(self.load_selected)
+        self.buttons = {'Search': search_button, 'Cancel': cancel_button, 'Load': load_button}
+        button_frame = QtWidgets.QFrame()
+        button_frame_layout = QtWidgets.QHBoxLayout(button_frame)
+        button_frame_layout.addWidget(search_button)
+        button_frame_layout.addWidget(cancel_button)
+        button_frame_layout.addWidget(load_button)
+
+        # Put everything in
+        main_layout.addWidget(config_frame)
+        main_layout.addWidget(self.progress_label)
+        main_layout.addWidget(self.results_list)
+        main_layout.addWidget(button_frame)
+
+
+# Window for generating a SpawnCycle with an exact number of certain ZEDs or categories on each wave
+class QuotaDialog(object):
+    def __init__(self, parent, Dialog, slider_data):
+        self.parent = parent # The GenerateDialog this was opened from
+        self.Dialog = Dialog
+        self.slider_data = slider_data # Snapshot of the sliders
+
+    # Reads the quotas and passes them back to the main window along with the sliders
+    def accept_quotas(self):
+        try:
+            quotas = generator.parse_quotas(self.rules_textedit.toPlainText(), self.slider_data['Game Length'])
+            generator.QuotaGenerationEngine(self.slider_data, quotas) # Make sure the quotas can be met before closing anything
+        except ValueError as e:
+            self.parent.show_errors(str(e).split('\n'), 'Generate', anchor=self.rules_textedit)
+            return
+
+        seed = self.parent.get_seed()
+        self.Dialog.close()
+        self.parent.parent.generate_wavedefs(self.slider_data, seed=seed, quotas=quotas)
+
+    # Called when this dialog is closed
+    # The rules are kept so they're still there next time the window is opened
+    def teardown(self):
+        self.parent.parent.last_generate_quotas = self.rules_textedit.toPlainText()
+
+    def setupUi(self):
+        self.Dialog.setFixedSize(_WINDOWSIZE_QUOTAS_W, _WINDOWSIZE_QUOTAS_H)
+        self.Dialog.setStyleSheet("background-color: rgb(40, 40, 40);")
+        self.Dialog.setWindowTitle('Quotas')
+        self.Dialog.setWindowIcon(QtGui.QIcon('img/icon_batch.png'))
+        main_layout = QtWidgets.QVBoxLayout(self.Dialog)
+
+        # Style stuff
+        font = QtGui.QFont()
+        font.setFamily(_DEF_FONT_FAMILY)
+        font.setPointSize(10)
+        font.setWeight(75)
+        font_button = QtGui.QFont()
+        font_button.setFamily(_DEF_FONT_FAMILY)
+        font_button.setPointSize(12)
+        font_button.setWeight(75)
+        sp = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
+        sp.setHorizontalStretch(0)
+        sp.setVerticalStretch(0)
+        ss_label = 'QLabel {color: rgb(255, 255, 255); background-color: rgb(40, 40, 40);}\nQToolTip {color: rgb(0, 0, 0);}' # Stylesheet
+        ss_button = 'QPushButton {color: rgb(255, 255, 255);\nbackground-color: rgb(40, 40, 40);} QToolTip {color: rgb(0, 0, 0)};' # Stylesheet
+
+        # Set up the rules
+        help_text = ("One rule per line, of the form  <waves>: <count> <ZED or category>, ..\n" +
+                     "Waves can be a single wave (7), a range (7-10), a wave onwards (7+) or every wave (*).\n" +
+                     "Category quotas (Trash, Medium, Large, Boss) include the ZEDs with their own quota.\n" +
+                     "A count of 0 keeps that ZED or category off the wave. The rest of each wave uses the sliders.")
+        help_label = widget_helpers.create_label(None, text=help_text, style=ss_label, font=font, alignment=QtCore.Qt.AlignLeft)
+        self.rules_textedit = QtWidgets.QPlainTextEdit()
+        self.rules_textedit.setFont(font)
+        self.rules_textedit.setStyleSheet('QPlainTextEdit {color: rgb(255, 255, 255); background-color: rgb(50, 50, 50);}')
+        self.rules_textedit.setPlaceholderText('7+: 6 Fleshpound, 2 Scrake\n1-3: 0 Large')
+        self.rules_textedit.setPlainText(self.parent.parent.last_generate_quotas)
+
+        # Set up the buttons
+        generate_button = widget_helpers.create_button(None, None, None, text=' Generate! ', tooltip='Generate the SpawnCycle using the current settings and quotas.', icon_path='img/icon_go.png', icon_w=24, icon_h=24, style=ss_button, size_policy=sp, font=font_button, options=False, squad=False, draggable=False)
+        generate_button.clicked.connect(self.accept_quotas)
+        clear_button = widget_helpers.create_button(None, None, None, text=' Clear ', tooltip='Remove all quotas.', icon_path='img/icon_clear.png', icon_w=24, icon_h=24, style=ss_button, size_policy=sp, font=font_button, options=False, squad=False, draggable=False)
+        clear_button.clicked.connect(self.rules_textedit.clear)
+        self.buttons = {'Generate': generate_button, 'Clear': clear_button}
+        button_frame = QtWidgets.QFrame()
+        button_frame_layout = QtWidgets.QHBoxLayout(button_frame)
+        button_frame_layout.addWidget(generate_button)
+        button_frame_layout.addWidget(clear_button)
+
+        # Put everything in
+        main_layout.addWidget(help_label)
+        main_layout.addWidget(self.rules_textedit)
+        main_layout.addWidget(button_frame)
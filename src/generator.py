@@ -0,0 +1,482 @@
+#
+#  generator.py
+#
+#  Author: Tamari
+#  Date of creation: 10/18/2026
+#
+#  Headless SpawnCycle generation for the 'Generate' functionality.
+#  Does not depend on PyQt5, so it can be used from worker processes and batch jobs
+#
+
+
+##  LICENSE INFORMATION
+##  =======================================================================
+##  This program is free software: you can redistribute it and/or modify
+##  it under the terms of the GNU General Public License as published by
+##  the Free Software Foundation, either version 3 of the License, or
+##  (at your option) any later version.
+##
+##  This program is distributed in the hope that it will be useful,
+##  but WITHOUT ANY WARRANTY; without even the implied warranty of
+##  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+##  GNU General Public License for more details.
+##
+##  You should have received a copy of the GNU General Public License
+##  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+##  =======================================================================
+##
+##  © Tamari 2020-2022
+##  All rights reserved.
+
+
+import random
+import presets
+import sampler
+import zeds
+
+try: # NumPy is optional. It's only needed for the vectorized generator
+    import numpy as np
+except ImportError:
+    np = None
+
+SEED_MAX = 2**32 - 1 # Seeds are kept short so they're easy to copy into bug reports
+SQUAD_MAX_ZEDS = 10 # Most ZEDs a single squad can hold
+
+# ZED -> class, as the generator sees it. Albino and SpawnRaged versions share the class of the ZED they come from
+zed_categories = {zed_id: category for (category, zed_list) in sampler.category_zeds.items() for (zed_id, _) in zed_list}
+zed_categories.update({albino_id: zed_categories[zed_id] for (zed_id, (albino_id, _)) in sampler.albino_variants.items()})
+zed_categories.update({f"{zed_id} (Enraged)": zed_categories[zed_id] for zed_id in sampler.rage_densities.keys()})
+albino_ids = set([albino_id for (albino_id, _) in sampler.albino_variants.values()])
+
+
+# Returns a new random seed
+def new_seed():
+    return random.SystemRandom().randint(0, SEED_MAX)
+
+
+# Returns the random stream for one wave of a SpawnCycle generated with the given seed
+# Every wave gets its own stream, so any wave can be regenerated on its own
+def get_wave_random(seed, wave_num):
+    return random.Random(f"{seed}:{wave_num}")
+
+
+# Generates SpawnCycles ZED by ZED, same as the 'Generate' dialog
+# Takes either the slider data from GenerateDialog.get_slider_values or the name of a preset
+# Each wave draws from its own stream derived from the seed, so the same seed and sliders always give the same SpawnCycle
+class GenerationEngine(object):
+    def __init__(self, slider_data):
+        if isinstance(slider_data, str): # Preset name
+            slider_data = presets.get_slider_values(slider_data)
+        self.slider_data = slider_data
+        self.sampler = presets.get_sampler(slider_data) # Already compiled if these are a preset's sliders
+
+    # Generates a whole SpawnCycle from the given seed (or a random one if there isn't one)
+    # Returns the waves, each being a list of squads of the form {'Cyst': {'Count': 4, 'Raged': False}, ..}, and the generation stats
+    def generate(self, seed=None):
+        if seed is None: # No seed given. Pick one so the SpawnCycle can still be reproduced later
+            seed = new_seed()
+
+        stats = {'Seed': seed, 'Waves': 0, 'Squads': 0, 'ZEDs': 0, 'Trash': 0, 'Medium': 0, 'Large': 0, 'Boss': 0, 'Albino': 0, 'Omega': 0, 'SpawnRage': 0}
+        waves = []
+        for i in range(self.slider_data['Game Length']):
+            waves.append(self.generate_wave(i, seed, stats))
+            stats['Waves'] += 1
+
+        return waves, stats
+
+    # Generates the given wave (starting at 0) of the SpawnCycle with the given seed, adding to the given stats
+    # Returns the squads of the wave
+    def generate_wave(self, wave_id, seed, stats):
+        sd = self.slider_data
+        wave_random = get_wave_random(seed, wave_id + 1)
+        wave_squads = []
+
+        # Generate squads
+        num_squads_to_generate = wave_random.randint(sd['Min Squads'], sd['Max Squads'])
+        for j in range(num_squads_to_generate):
+            num_zeds_to_generate = wave_random.randint(sd['Squad Min Length'], sd['Squad Max Length'])
+            new_squad = {}
+
+            # Generate ZEDs and add them to the squads
+            for k in range(num_zeds_to_generate):
+                self.add_to_squad(new_squad, self.sampler.draw(wave_id + 1, rng=wave_random), stats)
+
+            stats['ZEDs'] += num_zeds_to_generate
+            stats['Squads'] += 1
+            wave_squads.append(new_squad)
+
+        return wave_squads
+
+    # Adds the given ZED (ZED ID, class, albino, spawnraged) to the given squad, adding to the given stats
+    def add_to_squad(self, squad, zed, stats):
+        (zed_id, zed_type, albino, spawnrage) = zed
+        stats[zed_type] += 1
+        if albino:
+            stats['Albino'] += 1
+        if spawnrage:
+            stats['SpawnRage'] += 1
+        if zeds.zed_flags[zed_id] & zeds.FLAG_OMEGA: # Check for omega
+            stats['Omega'] += 1
+
+        if zed_id in squad and squad[zed_id]['Raged'] == spawnrage: # Already in the squad and same spawnrage status
+            squad.update({zed_id: {'Count': squad[zed_id]['Count'] + 1, 'Raged': spawnrage}})
+        else:
+            squad.update({zed_id: {'Count': 1, 'Raged': spawnrage}})
+
+
+# Returns the waves (starting at 1) covered by the given wave text ('7', '7-10', '7+' or '*'), or None if it isn't valid
+def parse_wave_range(wave_text, num_waves):
+    if wave_text == '*': # Every wave
+        (first, last) = (1, num_waves)
+    elif wave_text.endswith('+') and wave_text[:-1].isdigit(): # This wave onwards
+        (first, last) = (int(wave_text[:-1]), num_waves)
+    elif wave_text.count('-') == 1 and all([w.strip().isdigit() for w in wave_text.split('-')]): # Range
+        (first, last) = [int(w) for w in wave_text.split('-')]
+    elif wave_text.isdigit(): # Single wave
+        (first, last) = (int(wave_text), int(wave_text))
+    else:
+        return None
+
+    if first < 1 or last > num_waves or first > last:
+        return None
+    return range(first, last + 1)
+
+
+# Reads quotas from text, one rule per line of the form '<waves>: <count> <ZED or class>, ..'
+# Waves can be a single wave ('7'), a range ('7-10'), a wave and every wave after it ('7+') or every wave ('*')
+# ie: '7+: 6 Fleshpound, 2 Scrake' asks for exactly 6 Fleshpounds and 2 Scrakes on every wave from 7 onwards
+# Later rules replace earlier ones for the same ZED / class on the same wave. Blank lines and lines starting with '#' are skipped
+# Returns the quotas as a list with one dict ({ZED or class: count}) per wave. Raises ValueError listing every bad rule
+def parse_quotas(text, num_waves):
+    targets = {name.lower(): name for name in list(zed_categories.keys()) + [category for (category, _) in sampler.categories]}
+    quotas = [{} for i in range(num_waves)]
+    errors = []
+
+    for (line_num, line) in enumerate(text.splitlines(), start=1):
+        line = line.strip()
+        if line == '' or line.startswith('#'):
+            continue
+        if ':' not in line:
+            errors.append(f"- Line {line_num}: Expected '<waves>: <count> <ZED or class>, ..'")
+            continue
+
+        (wave_text, rule_text) = [s.strip() for s in line.split(':', 1)]
+        waves = parse_wave_range(wave_text, num_waves)
+        if waves is None:
+            errors.append(f"- Line {line_num}: '{wave_text}' is not a wave or range of waves between 1 and {num_waves}")
+            continue
+
+        for rule in rule_text.split(','):
+            parts = rule.strip().split(' ', 1)
+            if len(parts) != 2 or not parts[0].isdigit() or parts[1].strip().lower() not in targets:
+                errors.append(f"- Line {line_num}: '{rule.strip()}' must be a count followed by a ZED or class (ie: '6 Fleshpound', '2 Large')")
+                continue
+            for wave_num in waves:
+                quotas[wave_num-1].update({targets[parts[1].strip().lower()]: int(parts[0])})
+
+    if len(errors) > 0:
+        raise ValueError('\n'.join(errors))
+    return quotas
+
+
+# Generates SpawnCycles that meet exact per-wave ZED counts (quotas), ie: exactly 6 Fleshpounds and 2 Scrakes on every wave from 7 onwards
+# Quotas are a list with one dict ({ZED or class: count}) per wave, same as parse_quotas returns. A class quota counts every ZED
+# of that class on the wave, including the ones with their own quota. A quota of 0 keeps that ZED / class off the wave entirely
+# Each wave is built in one pass: the squad sizes are picked so there's exactly enough room, the quota'd ZEDs are laid down,
+# the rest is drawn from the sliders (never as a quota'd ZED or class) and everything is shuffled into the squads
+# Waves without quotas come out exactly as they would without any. Raises ValueError if the quotas can't be met
+class QuotaGenerationEngine(GenerationEngine):
+    def __init__(self, slider_data, quotas):
+        super().__init__(slider_data)
+        num_waves = self.slider_data['Game Length']
+        self.quotas = [quotas[i] if i < len(quotas) and quotas[i] is not None else {} for i in range(num_waves)]
+
+        # Everything that doesn't depend on the seed is worked out once up front
+        errors = []
+        self.wave_plans = [self.plan_wave(i+1, quota, errors) if len(quota) > 0 else None for (i, quota) in enumerate(self.quotas)]
+        if len(errors) > 0:
+            raise ValueError('\n'.join(errors))
+
+    # Works out how the given wave (starting at 1) meets its quota, adding any problems to errors
+    # Returns the quota'd ZEDs, how many ZEDs are left to draw for each class quota, the tables to draw them from and the fewest ZEDs the wave can have
+    def plan_wave(self, wave_num, quota, errors):
+        sd = self.slider_data
+        num_errors = len(errors)
+        for (target, count) in quota.items():
+            if target not in zed_categories and target not in self.sampler.category_weights:
+                errors.append(f"- Wave {wave_num}: Unknown ZED or class '{target}'")
+            elif not isinstance(count, int) or count < 0:
+                errors.append(f"- Wave {wave_num}: {target} quota must be a whole number >= 0 (got {count})")
+        if len(errors) > num_errors: # Can't plan around these
+            return None
+
+        zed_quotas = {zed_id: count for (zed_id, count) in quota.items() if zed_id in zed_categories and count > 0}
+        category_quotas = {category: count for (category, count) in quota.items() if category not in zed_categories}
+        excluded = set(quota.keys()) # Only ever placed by their quota
+
+        # One ZED table per class, leaving out the quota'd ZEDs
+        zed_tables = {}
+        for (category, zed_list) in sampler.category_zeds.items():
+            zed_list = [(zed_id, key) for (zed_id, key) in zed_list if zed_id not in excluded]
+            zed_tables.update({category: sampler.AliasTable([zed_id for (zed_id, _) in zed_list], [sd[key] for (_, key) in zed_list])})
+
+        # Work out what's left of each class quota once its quota'd ZEDs are taken out
+        category_draws = {}
+        for (category, count) in category_quotas.items():
+            remaining = count - sum([c for (zed_id, c) in zed_quotas.items() if zed_categories[zed_id] == category])
+            if remaining < 0:
+                errors.append(f"- Wave {wave_num}: {category} quota ({count}) is lower than its ZED quotas add up to ({count - remaining})")
+            elif remaining > 0 and zed_tables[category].empty:
+                errors.append(f"- Wave {wave_num}: {category} quota can't be met! Every {category} ZED without its own quota has 0% Density")
+            category_draws.update({category: max(remaining, 0)})
+        num_required = sum(zed_quotas.values()) + sum(category_draws.values())
+
+        # The rest of the wave is filled from the classes without a quota, same as without quotas
+        larges_allowed = (wave_num >= self.sampler.min_waves['Large'])
+        bosses_allowed = (wave_num >= self.sampler.min_waves['Boss'])
+        weights = []
+        for (category, _) in sampler.categories:
+            allowed = (category not in excluded and not zed_tables[category].empty and (category != 'Large' or larges_allowed) and (category != 'Boss' or bosses_allowed))
+            weights.append(self.sampler.category_weights[category] if allowed else 0)
+        fill_table = sampler.AliasTable([category for (category, _) in sampler.categories], weights)
+
+        # Find the fewest ZEDs the wave can have while fitting every quota'd ZED into whole squads
+        (min_len, max_len) = (sd['Squad Min Length'], min(sd['Squad Max Length'], SQUAD_MAX_ZEDS))
+        wave_sizes = [max(num_required, n * min_len) for n in range(sd['Min Squads'], sd['Max Squads'] + 1) if num_required <= n * max_len]
+        if len(wave_sizes) == 0:
+            errors.append(f"- Wave {wave_num}: Quotas add up to {num_required} ZEDs, but only {sd['Max Squads'] * max_len} fit in {sd['Max Squads']} squads of {max_len}")
+        elif fill_table.empty and num_required not in wave_sizes:
+            errors.append(f"- Wave {wave_num}: Quotas add up to {num_required} ZEDs, which can't be split into {sd['Min Squads']}-{sd['Max Squads']} squads of {min_len}-{max_len} and nothing else can be generated to fill the gap")
+
+        return {'ZED Quotas': zed_quotas,
+                'Category Draws': category_draws,
+                'Excluded': excluded,
+                'ZED Tables': zed_tables,
+                'Fill Table': fill_table,
+                'Min Size': min(wave_sizes) if not fill_table.empty and len(wave_sizes) > 0 else num_required}
+
+    # Generates the given wave (starting at 0) of the SpawnCycle with the given seed, adding to the given stats
+    # Returns the squads of the wave
+    def generate_wave(self, wave_id, seed, stats):
+        plan = self.wave_plans[wave_id]
+        if plan is None: # No quota on this wave
+            return super().generate_wave(wave_id, seed, stats)
+
+        wave_num = wave_id + 1
+        wave_random = get_wave_random(seed, wave_num)
+        squad_sizes = self.get_squad_sizes(plan, wave_random)
+
+        # Lay down the quota'd ZEDs, then draw the rest of each class quota, then fill whatever room is left
+        wave_zeds = []
+        for (zed_id, count) in plan['ZED Quotas'].items():
+            base_id = zed_id.replace(' (Enraged)', '')
+            wave_zeds.extend([(zed_id, zed_categories[zed_id], base_id in albino_ids, base_id != zed_id)] * count)
+        for (category, count) in plan['Category Draws'].items():
+            wave_zeds.extend([self.draw_zed(category, plan, wave_num, wave_random) for k in range(count)])
+        for k in range(sum(squad_sizes) - len(wave_zeds)):
+            wave_zeds.append(self.draw_zed(plan['Fill Table'].draw(wave_random), plan, wave_num, wave_random))
+        wave_random.shuffle(wave_zeds)
+
+        # Deal the ZEDs out into the squads
+        wave_squads = []
+        pos = 0
+        for num_zeds in squad_sizes:
+            new_squad = {}
+            for zed in wave_zeds[pos:pos+num_zeds]:
+                self.add_to_squad(new_squad, zed, stats)
+            pos += num_zeds
+
+            stats['ZEDs'] += num_zeds
+            stats['Squads'] += 1
+            wave_squads.append(new_squad)
+
+        return wave_squads
+
+    # Draws a ZED of the given class for the given wave (starting at 1), never as one of the wave's quota'd ZEDs
+    # Returns (ZED ID, class, albino, spawnraged)
+    def draw_zed(self, category, plan, wave_num, rng):
+        zed_id = plan['ZED Tables'][category].draw(rng)
+        (zed_id, albino, spawnrage) = self.sampler.roll_variants(zed_id, wave_num, rng, excluded=plan['Excluded'])
+        return zed_id, category, albino, spawnrage
+
+    # Picks the squad sizes for a wave with a quota. They're drawn the same way as without quotas, then grown
+    # (or shrunk, if nothing else can be generated) one ZED at a time until the wave has room for every quota'd ZED
+    def get_squad_sizes(self, plan, rng):
+        sd = self.slider_data
+        (min_len, max_len) = (sd['Squad Min Length'], min(sd['Squad Max Length'], SQUAD_MAX_ZEDS))
+        num_squads = rng.randint(sd['Min Squads'], sd['Max Squads'])
+        squad_sizes = [rng.randint(min_len, max_len) for j in range(num_squads)]
+        num_zeds = max(sum(squad_sizes), plan['Min Size']) if not plan['Fill Table'].empty else plan['Min Size']
+
+        # Add or remove squads until the ZEDs can fit
+        fewest_squads = max(sd['Min Squads'], -(-num_zeds // max_len))
+        most_squads = min(sd['Max Squads'], num_zeds // min_len)
+        num_squads = min(max(num_squads, fewest_squads), most_squads)
+        squad_sizes = squad_sizes[:num_squads] + [rng.randint(min_len, max_len) for j in range(num_squads - len(squad_sizes))]
+
+        # Then grow / shrink random squads to match
+        diff = num_zeds - sum(squad_sizes)
+        while diff != 0:
+            step = 1 if diff > 0 else -1
+            j = rng.choice([j for (j, size) in enumerate(squad_sizes) if min_len <= size + step <= max_len])
+            squad_sizes[j] += step
+            diff -= step
+
+        return squad_sizes
+
+
+# Returns a summary of the given generation stats
+def format_summary(stats):
+    return (f"Summary\n----------------------\n" +
+            f"Seed: {stats['Seed']}\n" +
+            f"{stats['Waves']} Waves generated\n" +
+            f"{stats['Squads']} Squads generated\n" +
+            f"{stats['ZEDs']} ZEDs generated ({stats['Trash']} Trash, {stats['Medium']} Mediums, {stats['Large']} Larges, {stats['Boss']} Bosses)\n" +
+            f"{stats['Albino']} Albino ZEDs generated\n" +
+            f"{stats['Omega']} Omega ZEDs generated\n" +
+            f"{stats['SpawnRage']} SpawnRaged ZEDs generated")
+
+
+# Generates whole SpawnCycles at once using NumPy
+# Every random decision for every cycle is drawn as one array, so this is much faster than going ZED by ZED
+# when lots of cycles are needed. The slider data is the same dict that GenerateDialog.get_slider_values returns
+# Each cycle is a list of waves, each being a list of squads of the form {'Cyst': {'Count': 4, 'Raged': False}, ..}
+class VectorizedGenerator(object):
+    def __init__(self, slider_data):
+        if np is None:
+            raise ImportError('NumPy is required for vectorized generation')
+
+        sd = slider_data
+        self.slider_data = sd
+        self.num_waves = sd['Game Length']
+
+        # Every ZED that can come out of the generator. Albino and SpawnRaged versions are added on the end
+        self.zed_names = [zed_id for (category, _) in sampler.categories for (zed_id, _) in sampler.category_zeds[category]]
+        for (albino_id, _) in sampler.albino_variants.values():
+            self.zed_names.append(albino_id)
+        for zed_id in sampler.rage_densities.keys():
+            self.zed_names.append(f"{zed_id} (Enraged)")
+        zed_index = {zed_id: i for (i, zed_id) in enumerate(self.zed_names)}
+
+        # Cumulative class weights for each wave. Larges / Bosses get no weight before their min wave
+        # These are kept as integers so a class with 0% Density can never be picked due to rounding
+        category_weights = np.zeros((self.num_waves, len(sampler.categories)), dtype=np.int64)
+        for i in range(self.num_waves):
+            wave_num = i + 1
+            for (j, (category, key)) in enumerate(sampler.categories):
+                if (category == 'Large' and wave_num < sd['Large Min Wave']) or (category == 'Boss' and wave_num < sd['Boss Min Wave']):
+                    continue
+                category_weights[i, j] = sd[key]
+        self.category_cumsum = np.cumsum(category_weights, axis=1)
+
+        # Cumulative ZED weights and their indices in zed_names, for each class
+        self.zed_cumsums = []
+        self.zed_indices = []
+        for (category, _) in sampler.categories:
+            zed_list = sampler.category_zeds[category]
+            self.zed_cumsums.append(np.cumsum(np.array([sd[key] for (_, key) in zed_list], dtype=np.int64)))
+            self.zed_indices.append(np.array([zed_index[zed_id] for (zed_id, _) in zed_list], dtype=np.int64))
+
+        # Albino / SpawnRage lookups. -1 means the ZED has no albino / SpawnRaged version
+        num_zeds = len(self.zed_names)
+        self.albino_target = np.full(num_zeds, -1, dtype=np.int64)
+        self.albino_chance = np.zeros(num_zeds)
+        for (zed_id, (albino_id, key)) in sampler.albino_variants.items():
+            self.albino_target[zed_index[zed_id]] = zed_index[albino_id]
+            self.albino_chance[zed_index[zed_id]] = sd[key] / 100.0
+        self.rage_target = np.full(num_zeds, -1, dtype=np.int64)
+        self.rage_chance = np.zeros(num_zeds)
+        for (zed_id, key) in sampler.rage_densities.items():
+            self.rage_target[zed_index[zed_id]] = zed_index[f"{zed_id} (Enraged)"]
+            self.rage_chance[zed_index[zed_id]] = sd[key] / 100.0
+
+    # Draws the given number of indices using the given integer cumulative weights
+    def draw_weighted(self, rng, cumsum, size):
+        picks = (rng.random(size) * cumsum[-1]).astype(np.int64) # Uniform in [0, total)
+        return np.searchsorted(cumsum, picks, side='right')
+
+    # Returns the random stream for each wave. Each one is spawned from the seed, so they're independent of each other
+    def get_wave_generators(self, seed):
+        return [np.random.default_rng(s) for s in np.random.SeedSequence(seed).spawn(self.num_waves)]
+
+    # Generates the given number of SpawnCycles from the given seed (or a random one if there isn't one)
+    # Each wave is generated for every cycle at once from its own stream, so the same seed always gives the same cycles
+    # Returns the cycles and the stats of the run, which include the seed used
+    def generate(self, num_cycles=1, seed=None):
+        if seed is None: # No seed given. Pick one so the SpawnCycles can still be reproduced later
+            seed = new_seed()
+
+        wave_generators = self.get_wave_generators(seed)
+        waves = [self.generate_wave(i, num_cycles, wave_generators[i]) for i in range(self.num_waves)]
+        return [[wave[j] for wave in waves] for j in range(num_cycles)], {'Seed': seed, 'Cycles': num_cycles}
+
+    # Generates the given wave (starting at 0) for each cycle, using the wave's random stream
+    # Returns the squads of the wave for each cycle
+    def generate_wave(self, wave_id, num_cycles, rng):
+        sd = self.slider_data
+
+        # Number of squads in the wave for each cycle, and the size of every squad
+        squad_counts = rng.integers(sd['Min Squads'], sd['Max Squads'] + 1, size=num_cycles)
+        squad_sizes = rng.integers(sd['Squad Min Length'], sd['Squad Max Length'] + 1, size=int(squad_counts.sum()))
+        num_zeds = int(squad_sizes.sum())
+        wave_num = wave_id + 1
+
+        # Pick each ZED's class
+        if num_zeds > 0 and self.category_cumsum[wave_id][-1] <= 0:
+            raise ValueError('Total of weights must be greater than zero')
+        category_picks = self.draw_weighted(rng, self.category_cumsum[wave_id], num_zeds)
+
+        # Pick the ZEDs within each class
+        zed_ids = np.zeros(num_zeds, dtype=np.int64)
+        for (c, (cumsum, indices)) in enumerate(zip(self.zed_cumsums, self.zed_indices)):
+            mask = (category_picks == c)
+            num_in_category = int(mask.sum())
+            if num_in_category == 0:
+                continue
+            if cumsum[-1] <= 0:
+                raise ValueError('Total of weights must be greater than zero')
+            picks = self.draw_weighted(rng, cumsum, num_in_category)
+            zed_ids[mask] = indices[picks]
+
+        # Account for albinos
+        if wave_num >= sd['Albino Min Wave']:
+            albino = (self.albino_target[zed_ids] >= 0) & (rng.random(num_zeds) < self.albino_chance[zed_ids])
+            zed_ids[albino] = self.albino_target[zed_ids[albino]]
+
+        # Account for spawnrage. Done after the albino roll so Alpha Fleshpounds can rage too
+        if wave_num >= sd['SpawnRage Min Wave']:
+            spawnrage = (self.rage_target[zed_ids] >= 0) & (rng.random(num_zeds) < self.rage_chance[zed_ids])
+            zed_ids[spawnrage] = self.rage_target[zed_ids[spawnrage]]
+
+        return self.assemble(squad_counts, squad_sizes, zed_ids)
+
+    # Groups the generated ZEDs of a wave back into squads, then splits them up between the cycles
+    # Squads list their ZEDs in the order they first appeared, same as the ZED by ZED generator
+    def assemble(self, squad_counts, squad_sizes, zed_ids):
+        num_squads = len(squad_sizes)
+        num_names = len(self.zed_names)
+        zed_squads = np.repeat(np.arange(num_squads), squad_sizes)
+
+        # Count each (squad, ZED) pair and sort them by squad, then by first appearance
+        keys = zed_squads * num_names + zed_ids
+        (unique_keys, first_seen, counts) = np.unique(keys, return_index=True, return_counts=True)
+        order = np.lexsort((first_seen, unique_keys // num_names))
+        entry_squads = (unique_keys[order] // num_names).tolist()
+        entry_zeds = (unique_keys[order] % num_names).tolist()
+        entry_counts = counts[order].tolist()
+
+        # Build the squad dicts
+        zed_names = self.zed_names
+        zed_raged = [name.endswith(' (Enraged)') for name in zed_names]
+        squads = [{} for i in range(num_squads)]
+        for (squad_id, zed_id, count) in zip(entry_squads, entry_zeds, entry_counts):
+            squads[squad_id][zed_names[zed_id]] = {'Count': count, 'Raged': zed_raged[zed_id]}
+
+        # Split the squads between the cycles
+        waves = []
+        pos = 0
+        for num_wave_squads in squad_counts.tolist():
+            waves.append(squads[pos:pos+num_wave_squads])
+            pos += num_wave_squads
+
+        return waves
@@ -43,7 +43,8 @@ def init_metadict():
                  'save_json_default_target': 0, # 0 always ask, 1 = adaptive (match length), 2 = preferred med, 3 = preferred long
                  'save_default_filetype': 0, # 0 = adaptive (match currently opened type), 1 = txt, 2 = json
                  'new_squad_min_amount': 1,
-                 'analyze_default_length': 0} # 0 = last used, 1 = adaptive, 2 = preferred short, 3 = preferred med, 4 = preferred long
+                 'analyze_default_length': 0, # 0 = last used, 1 = adaptive, 2 = preferred short, 3 = preferred med, 4 = preferred long
+                 'analyze_vectorized': False}
     with open(_PATH_META, 'w') as f:
         f.write(json.dumps(meta_dict))
 
@@ -0,0 +1,249 @@
+#
+#  optimize.py
+#
+#  Author: Tamari
+#  Date of creation: 10/18/2026
+#
+#  Headless difficulty curve optimizer.
+#  Mutates the squads of a SpawnCycle until the average difficulty of each wave matches a target curve.
+#  Does not depend on PyQt5, so it can be used from worker processes and batch jobs
+#
+
+
+##  LICENSE INFORMATION
+##  =======================================================================
+##  This program is free software: you can redistribute it and/or modify
+##  it under the terms of the GNU General Public License as published by
+##  the Free Software Foundation, either version 3 of the License, or
+##  (at your option) any later version.
+##
+##  This program is distributed in the hope that it will be useful,
+##  but WITHOUT ANY WARRANTY; without even the implied warranty of
+##  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+##  GNU General Public License for more details.
+##
+##  You should have received a copy of the GNU General Public License
+##  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+##  =======================================================================
+##
+##  © Tamari 2020-2022
+##  All rights reserved.
+
+
+from itertools import accumulate
+import math
+import random
+import time
+import simulate
+import zeds
+
+try: # NumPy is optional. It's only used to speed up scoring waves that hit the difficulty cap
+    import numpy as np
+except ImportError:
+    np = None
+
+_SQUAD_MAX = 10 # Max ZEDs in a squad
+_DIFFICULTY_CAP = 750000.0 # Same cap as the Analyze difficulty scores
+_MUTATIONS = ['Swap', 'Resize', 'Reorder']
+
+
+# Mutates a SpawnCycle until the average difficulty of each wave (as shown by 'Analyze') matches the target curve
+# The cycle is a list of waves, each being a list of squads of the form {'Cyst': {'Count': 4, 'Raged': False}, ..}
+# Targets has one average difficulty (or None to leave the wave alone) per wave. The avg_difficulty_data from
+# 'Analyze' ([(0, 0.0), (1, avg), ..]) can be given as-is
+# The analysis params are the same as AnalysisEngine's. ZEDs swapped or added in are drawn from zed_pool,
+# which defaults to the ZEDs already in the cycle
+#
+# Uses simulated annealing. Each step mutates one squad of one wave by either swapping a ZED for another type,
+# adding or removing a ZED, or swapping two squads around. Only the mutated wave is re-scored, and its score is
+# worked out straight from prefix sums of its ZED weights rather than by simulating the wave again
+class CurveOptimizer(object):
+    def __init__(self, cycle, targets, GameLength, Difficulty, WaveSizeFakes, MaxMonsters, zed_pool=None, seed=None):
+        self.cycle = [[{zed_id: dict(zed_data) for (zed_id, zed_data) in squad.items()} for squad in wave] for wave in cycle] # Own copy, since the squads get mutated
+        self.targets = self.get_targets(targets)
+        self.engine = simulate.AnalysisEngine(self.cycle, GameLength, Difficulty, WaveSizeFakes, MaxMonsters) # Only used for the wave sizes and score modifiers
+        self.random = random.Random(seed)
+        self.cancelled = False
+
+        # Everything about a wave's score except its ZEDs is fixed, so work it out once
+        self.window = [] # Max number of ZEDs alive at once in each wave
+        self.score_mods = [] # Multiplier to go from the weight of the ZEDs alive to the difficulty score
+        self.wave_num_zeds = []
+        for i in range(len(self.cycle)):
+            (zed_diff_mod, wave_score_mod, wsf_mod) = self.engine.get_score_mods(i)
+            wave_num_zeds = self.engine.get_wave_num_zeds(i) if len(self.cycle[i]) > 0 else 0
+            self.wave_num_zeds.append(wave_num_zeds)
+            self.window.append(min(wave_num_zeds, MaxMonsters))
+            self.score_mods.append(wsf_mod * wave_score_mod * zed_diff_mod)
+
+        if zed_pool is None:
+            zed_pool = sorted(set(zed_id for wave in self.cycle for squad in wave for zed_id in squad))
+        self.zed_pool = list(zed_pool)
+
+    # Returns the target average difficulty of every wave, padded out with None to the length of the cycle
+    def get_targets(self, targets):
+        if len(targets) > 0 and isinstance(targets[0], tuple): # avg_difficulty_data from 'Analyze'
+            targets = [y for (_, y) in targets[1:]]
+        targets = list(targets[:len(self.cycle)])
+        return targets + [None for i in range(len(self.cycle) - len(targets))]
+
+    # Stops an optimization that's in progress (ie: from another thread). The best cycle found so far is returned once it notices
+    def cancel(self):
+        self.cancelled = True
+
+    # Returns the average difficulty of the given wave, same as what 'Analyze' gives
+    # The wave is the expanded squads repeated until it's full, so the weight of the ZEDs alive at any step comes
+    # straight from the prefix sums of the expanded squad weights (see AnalysisEngine.sample_difficulty_vectorized)
+    def score_wave(self, wave_id, wave):
+        wave_num_zeds = self.wave_num_zeds[wave_id]
+        if wave_num_zeds == 0 or len(wave) == 0: # Wave is empty!
+            return 0.0
+
+        weights = [zeds.zed_weights[zed_id] for squad in wave for (zed_id, zed_data) in squad.items() for i in range(zed_data['Count'])]
+        if len(weights) == 0:
+            return 0.0
+        window = self.window[wave_id]
+        score_mod = self.score_mods[wave_id]
+        num_steps = wave_num_zeds + window + 1 # Every spawn, the "wind down", and the starting point
+
+        # If the cap can never be hit, every ZED adds its weight to exactly 'window' steps, so the sum of every step
+        # is just 'window' times the total weight of the wave. No need to look at the steps at all
+        if score_mod * window * max(weights) <= _DIFFICULTY_CAP:
+            (num_passes, num_leftover) = divmod(wave_num_zeds, len(weights))
+            total_weight = num_passes * sum(weights) + sum(weights[:num_leftover])
+            return score_mod * window * total_weight / num_steps
+
+        # Some steps are capped, so they have to be summed one by one
+        if np is not None:
+            squad_prefix = np.concatenate(([0], np.cumsum(np.array(weights, dtype=np.int64))))
+            wave_prefix = lambda n: (n // len(weights)) * squad_prefix[-1] + squad_prefix[n % len(weights)]
+            steps = np.arange(wave_num_zeds + window, dtype=np.int64)
+            zed_count = wave_prefix(np.minimum(steps + 1, wave_num_zeds)) - wave_prefix(np.maximum(steps + 1 - window, 0))
+            return float(np.minimum(score_mod * zed_count, _DIFFICULTY_CAP).sum()) / num_steps
+
+        squad_prefix = [0] + list(accumulate(weights))
+        wave_prefix = lambda n: (n // len(weights)) * squad_prefix[-1] + squad_prefix[n % len(weights)]
+        total = 0.0
+        for step in range(wave_num_zeds + window):
+            zed_count = wave_prefix(min(step + 1, wave_num_zeds)) - wave_prefix(max(step + 1 - window, 0))
+            total += min(score_mod * zed_count, _DIFFICULTY_CAP)
+        return total / num_steps
+
+    # Returns the error of the given wave score against its target
+    # Relative to the target, so early (easy) waves matter as much as late (hard) ones
+    def get_wave_error(self, wave_id, score):
+        target = self.targets[wave_id]
+        if target is None:
+            return 0.0
+        return ((score - target) / max(target, 1.0)) ** 2
+
+    # Returns a mutated copy of the given wave. The wave itself is left alone, so it can be kept if the mutation is rejected
+    def mutate_wave(self, wave):
+        new_wave = list(wave)
+        mutation = self.random.choice(_MUTATIONS if len(wave) > 1 else _MUTATIONS[:2])
+
+        # Swap two squads around
+        if mutation == 'Reorder':
+            (i, j) = self.random.sample(range(len(new_wave)), 2)
+            (new_wave[i], new_wave[j]) = (new_wave[j], new_wave[i])
+            return new_wave, mutation
+
+        squad_id = self.random.randrange(len(new_wave))
+        squad = {zed_id: dict(zed_data) for (zed_id, zed_data) in new_wave[squad_id].items()}
+        squad_count = sum([zed_data['Count'] for zed_data in squad.values()])
+        zed_id = self.random.choice(list(squad.keys()))
+
+        # Swap one ZED for another type (keeps the squad size)
+        if mutation == 'Swap':
+            self.remove_zed(squad, zed_id)
+            self.add_zed(squad, self.random.choice(self.zed_pool))
+
+        # Add or remove a ZED. Squads always keep at least one ZED, and never go over the squad cap
+        elif (self.random.random() < 0.5 and squad_count < _SQUAD_MAX) or squad_count == 1:
+            self.add_zed(squad, self.random.choice(self.zed_pool))
+        else:
+            self.remove_zed(squad, zed_id)
+
+        new_wave[squad_id] = squad
+        return new_wave, mutation
+
+    # Adds one of the given ZED to the squad
+    def add_zed(self, squad, zed_id):
+        if zed_id in squad:
+            squad[zed_id]['Count'] += 1
+        else:
+            squad.update({zed_id: {'Count': 1, 'Raged': bool(zeds.zed_flags[zed_id] & zeds.FLAG_RAGED)}})
+
+    # Removes one of the given ZED from the squad
+    def remove_zed(self, squad, zed_id):
+        squad[zed_id]['Count'] -= 1
+        if squad[zed_id]['Count'] == 0:
+            del squad[zed_id]
+
+    # Runs the optimizer until the curve is within tolerance (relative RMS error over the targeted waves),
+    # max_iterations is reached or it's cancelled
+    # Temperature is the starting temperature of the annealing, in units of squared relative error. It cools
+    # geometrically to near zero over max_iterations, at which point only improvements are accepted
+    # If given, progress is called with (iterations done, max iterations, best error) every progress_interval iterations
+    # Returns the best cycle found along with its average difficulty curve and the convergence stats
+    def run(self, max_iterations=50000, tolerance=0.01, temperature=0.001, progress=None, progress_interval=1000):
+        targeted_waves = [i for i in range(len(self.cycle)) if self.targets[i] is not None and len(self.cycle[i]) > 0]
+        scores = [self.score_wave(i, self.cycle[i]) for i in range(len(self.cycle))]
+        errors = [self.get_wave_error(i, scores[i]) for i in range(len(self.cycle))]
+        get_rms = lambda e: math.sqrt(e / len(targeted_waves)) if len(targeted_waves) > 0 else 0.0
+        current_error = sum(errors)
+        best = {'Cycle': list(self.cycle), 'Scores': list(scores), 'Error': current_error}
+        stats = {'Iterations': 0, 'Accepted': 0, 'Improved': 0,
+                 'Mutations': {mutation: {'Tried': 0, 'Accepted': 0} for mutation in _MUTATIONS},
+                 'Initial Error': get_rms(current_error), 'History': [(0, get_rms(current_error))]}
+        cooling = (1e-6 / temperature) ** (1.0 / max_iterations) if temperature > 0.0 else 0.0
+        start_time = time.perf_counter()
+
+        while stats['Iterations'] < max_iterations and get_rms(best['Error']) > tolerance and len(targeted_waves) > 0 and not self.cancelled:
+            stats['Iterations'] += 1
+
+            # Focus on the waves that are furthest off
+            wave_id = self.random.choices(targeted_waves, weights=[errors[i] + 1e-12 for i in targeted_waves])[0]
+            (new_wave, mutation) = self.mutate_wave(self.cycle[wave_id])
+            stats['Mutations'][mutation]['Tried'] += 1
+
+            # Only this wave changed, so only it needs re-scoring
+            new_score = self.score_wave(wave_id, new_wave)
+            new_wave_error = self.get_wave_error(wave_id, new_score)
+            delta = new_wave_error - errors[wave_id]
+            if delta <= 0.0 or (temperature > 0.0 and self.random.random() < math.exp(-delta / temperature)):
+                self.cycle[wave_id] = new_wave
+                scores[wave_id] = new_score
+                errors[wave_id] = new_wave_error
+                current_error += delta
+                stats['Accepted'] += 1
+                stats['Mutations'][mutation]['Accepted'] += 1
+
+                if current_error < best['Error']: # Waves are never mutated in place, so a shallow copy is enough to keep the best cycle
+                    best = {'Cycle': list(self.cycle), 'Scores': list(scores), 'Error': current_error}
+                    stats['Improved'] += 1
+                    stats['History'].append((stats['Iterations'], get_rms(current_error)))
+
+            temperature *= cooling
+            if progress is not None and stats['Iterations'] % progress_interval == 0:
+                progress(stats['Iterations'], max_iterations, get_rms(best['Error']))
+
+        elapsed = time.perf_counter() - start_time
+        stats.update({'Final Error': get_rms(best['Error']),
+                      'Converged': get_rms(best['Error']) <= tolerance,
+                      'Elapsed': elapsed,
+                      'Iterations/sec': stats['Iterations'] / elapsed if elapsed > 0.0 else 0.0})
+
+        return {'Cycle': best['Cycle'],
+                'Average Difficulty': [(0, 0.0)] + [(i+1, score) for (i, score) in enumerate(best['Scores'])],
+                'Stats': stats}
+
+
+# Returns a summary of the given optimizer stats
+def format_summary(stats):
+    mutation_str = ', '.join([f"{mutation}: {data['Accepted']}/{data['Tried']}" for (mutation, data) in stats['Mutations'].items()])
+    return (f"Summary\n----------------------\n" +
+            f"{'Converged' if stats['Converged'] else 'Did not converge'} after {stats['Iterations']} iterations ({stats['Iterations/sec']:.0f} iterations/sec)\n" +
+            f"Error: {100.0 * stats['Initial Error']:.2f}% -> {100.0 * stats['Final Error']:.2f}%\n" +
+            f"{stats['Accepted']} mutations accepted, {stats['Improved']} improvements\n" +
+            f"Accepted per mutation: {mutation_str}")
@@ -28,181 +28,39 @@
 ##  All rights reserved.
 
 
-from copy import deepcopy
-
-zed_tokens = {'Cyst': ['cy', 'cys', 'cyst', 'cc', 'clotc'],
-              'Alpha Clot': ['al', 'alp', 'alph', 'alpha', 'ca', 'clota'],
-              'Slasher': ['sl', 'sla', 'slas', 'slash', 'slashe', 'slasher', 'cs', 'clots'],
-              'Crawler': ['cr', 'cra', 'craw', 'crawl', 'crawle', 'crawler'],
-              'Gorefast': ['g', 'go', 'gor', 'gore', 'goref', 'gorefa', 'gorefas', 'gorefast', 'gf'],
-              'Stalker': ['st', 'sta', 'stal', 'stalk', 'stalke', 'stalker'],
-              'Bloat': ['b', 'bl', 'blo', 'bloa', 'bloat'],
-              'Husk': ['h', 'hu', 'hus', 'husk'],
-              'Siren': ['si', 'sir', 'sire', 'siren'],
-              'E.D.A.R Trapper': ['edare', 'etr', 'ee', 'de'],
-              'E.D.A.R Blaster': ['edarl', 'ebl', 'el', 'dl'],
-              'E.D.A.R Bomber': ['edarr' 'ebo', 'er', 'dr'],
-              'Scrake': ['sc', 'scr', 'scra', 'scrak', 'scrake'],
-              'Quarter Pound': ['mi', 'min', 'mini', 'minif', 'minifl', 'minifle', 'minifles', 'miniflesh', 'minifleshp', 'minifleshpo', 'minifleshpou', 'minifleshpoun', 'minifleshpound', 'mf', 'mfp'],
-              'Fleshpound': ['f', 'fl', 'fle', 'fles', 'flesh', 'fleshp', 'fleshpo', 'fleshpou', 'fleshpoun', 'fleshpound', 'fp'],
-              'Alpha Scrake': ['alphasc', 'asc'],
-              'Alpha Fleshpound': ['alphafp', 'afp', 'af'],
-              'Dr. Hans Volter': ['hansvolter', 'hansv', 'hv'],
-              'Patriarch': ['patriarch', 'pat', 'pt'],
-              'Matriarch': ['matriarch', 'mat', 'mt'],
-              'King Fleshpound': ['ki', 'kin', 'king', 'kingf', 'kingfl', 'kingfle', 'kingfles', 'kingflesh', 'kingfleshp', 'kingfleshpo', 'kingfleshpou', 'kingfleshpoun', 'kingfleshpound', 'kf', 'kfp'],
-              'Abomination': ['abomination', 'abm', 'ab'], 
-              'Abomination Spawn': ['as'],
-              'Slasher Omega': ['osl', 'omegasl', 'omegasla', 'omegaslas', 'omegaslas', 'omegaslash', 'omegaslasher'],
-              'Stalker Omega': ['ost', 'omegast', 'omegasta', 'omegastal', 'omegastalk', 'omegastalke', 'omegastalker'],
-              'Siren Omega': ['os', 'omegas', 'omegasi', 'omegasir', 'omegasire', 'omegasiren'],
-              'Fleshpound Omega': ['ofp', 'omegafp', 'omegaf', 'omegafl', 'omegafle', 'omegafles', 'omegaflesh', 'omegafleshp', 'omegafleshpo', 'omegafleshpou', 'omegafleshpoun', 'omegafleshpound'],
-              'Gorefast Omega': ['ogf', 'omegagf', 'omegag', 'omegago', 'omegagor', 'omegagorf', 'omegagorefa', 'omegagorefas', 'omegagorefast'],
-              'Husk Omega': ['ohs', 'omegahs', 'omegah', 'omegahu', 'omegahus', 'omegahusk'],
-              'Tiny Husk': ['mhs', 'minihs', 'minih', 'minihu', 'minihus', 'minihusk'],
-              'Scrake Emperor': ['esc', 'empsc', 'e', 'em', 'emp', 'empe', 'emper', 'empero', 'emperor', 'emperors', 'emperorsc', 'emperorscr', 'emperorscra', 'emperorscrak', 'emperorscrake'],
-              'Scrake Omega': ['osc', 'omegasc', 'omegascr', 'omegascra', 'omegascrak', 'omegascrake'],
-              'Tiny Scrake': ['tsc', 'tinysc', 'tinys', 'tinysc', 'tinyscr', 'tinyscra', 'tinyscrak', 'tinyscrake'],
-              'Tiny Crawler': ['crm', 'crawm', 'minic', 'minicr', 'minicra', 'minicraw', 'minicrawl', 'minicrawle', 'minicrawler'],
-              'Medium Crawler': ['mcr', 'crawlermed', 'mediumc', 'mediumcr', 'mediumcra', 'mediumcraw', 'mediumcrawl', 'mediumcrawle', 'mediumcrawler'],
-              'Big Crawler': ['bcr', 'crawlerbig', 'bigc', 'bigcr', 'bigcra', 'bigcraw', 'bigcrawl', 'bigcrawle', 'bigcrawler'],
-              'Huge Crawler': ['hcr', 'crawlerhuge', 'hugec', 'hugecr', 'hugecraw', 'hugecrawl', 'hugecrawle', 'hugecrawler'],
-              'Ultra Crawler': ['ucr', 'crawlerult', 'ultrac', 'ultracr', 'ultracra', 'ultracraw', 'ultracrawl' 'ultracrawle', 'ultracrawler']}
-
-
-# Returns a formatted zed name
-def format_zed_id(id, albino=False, raged=False):
-    if id in zed_tokens['Alpha Clot']:
-        return 'Alpha Clot' if not albino else 'Rioter'
-    elif id in zed_tokens['Cyst']:
-        return 'Cyst'
-    elif id in zed_tokens['Bloat']:
-        return 'Bloat'
-    elif id in zed_tokens['Crawler']:
-        return 'Crawler' if not albino else 'Elite Crawler'
-    elif id in zed_tokens['Fleshpound']:
-        if albino:
-            return 'Alpha Fleshpound' if not raged else 'Alpha Fleshpound (Enraged)'
-        else:
-            return 'Fleshpound' if not raged else 'Fleshpound (Enraged)'
-    elif id in zed_tokens['Gorefast']:
-        return 'Gorefast' if not albino else 'Gorefiend'
-    elif id in zed_tokens['Husk']:
-        return 'Husk'
-    elif id in zed_tokens['Quarter Pound']:
-        return 'Quarter Pound' if not raged else 'Quarter Pound (Enraged)'
-    elif id in zed_tokens['Scrake']:
-        return 'Scrake' if not albino else 'Alpha Scrake'
-    elif id in zed_tokens['Siren']:
-        return 'Siren'
-    elif id in zed_tokens['Slasher']:
-        return 'Slasher'
-    elif id in zed_tokens['Stalker']:
-        return 'Stalker'
-    elif id in zed_tokens['Abomination Spawn']:
-        return 'Abomination Spawn'
-    elif id in zed_tokens['Dr. Hans Volter']:
-        return 'Dr. Hans Volter'
-    elif id in zed_tokens['Patriarch']:
-        return 'Patriarch'
-    elif id in zed_tokens['King Fleshpound']:
-        return 'King Fleshpound'
-    elif id in zed_tokens['Abomination']:
-        return 'Abomination'
-    elif id in zed_tokens['Matriarch']:
-        return 'Matriarch'
-    elif id in zed_tokens['Alpha Scrake']:
-        return 'Alpha Scrake'
-    elif id in zed_tokens['Alpha Fleshpound']:
-        return 'Alpha Fleshpound'
-    elif id in zed_tokens['E.D.A.R Trapper']:
-        return 'E.D.A.R Trapper'
-    elif id in zed_tokens['E.D.A.R Blaster']:
-        return 'E.D.A.R Blaster'
-    elif id in zed_tokens['E.D.A.R Bomber']:
-        return 'E.D.A.R Bomber'
-    elif id in zed_tokens['Slasher Omega']:
-        return 'Slasher Omega'
-    elif id in zed_tokens['Stalker Omega']:
-        return 'Stalker Omega'
-    elif id in zed_tokens['Siren Omega']:
-        return 'Siren Omega'
-    elif id in zed_tokens['Fleshpound Omega']:
-        return 'Fleshpound Omega'
-    elif id in zed_tokens['Gorefast Omega']:
-        return 'Gorefast Omega'
-    elif id in zed_tokens['Husk Omega']:
-        return 'Husk Omega'
-    elif id in zed_tokens['Tiny Husk']:
-        return 'Tiny Husk'
-    elif id in zed_tokens['Scrake Emperor']:
-        return 'Scrake Emperor'
-    elif id in zed_tokens['Scrake Omega']:
-        return 'Scrake Omega'
-    elif id in zed_tokens['Tiny Scrake']:
-        return 'Tiny Scrake'
-    elif id in zed_tokens['Tiny Crawler']:
-        return 'Tiny Crawler'
-    elif id in zed_tokens['Medium Crawler']:
-        return 'Medium Crawler'
-    elif id in zed_tokens['Big Crawler']:
-        return 'Big Crawler'
-    elif id in zed_tokens['Huge Crawler']:
-        return 'Huge Crawler'
-    elif id in zed_tokens['Ultra Crawler']:
-        return 'Ultra Crawler'
-    else:
-        return None
-
-
-# Returns a JSON-formatted version of the squad array
-def format_squad(squad):
-    new_squad = {}
-
-    # First split the squad into individual zeds
-    zeds = squad.split('_')
-
-    # Now separate tokens and add into the dictionary
-    for token in zeds:
-        zed_count, zed_id = separate_token(token) # This is the identifier for the zed with the number stripped
-        zed_id, quantifiers = strip_quantifiers(zed_id) # Check for quantifiers
-        albino = False
-        raged = False
-        for q in quantifiers:
-            if q == '!':
-                raged = True
-            else:
-                albino = True
-
-        # Get the "Nice Name" for the ZED
-        zed_id = format_zed_id(zed_id.lower(), albino=albino, raged=raged)
-        zed_count = int(zed_count)
-
-        # Add it to the squad
-        if zed_id in new_squad and new_squad[zed_id]['Raged'] == raged: # Already in the squad and same raged status
-            new_squad.update({zed_id: {'Count': new_squad[zed_id]['Count'] + zed_count, 'Raged': raged}})
-        else:
-            new_squad.update({zed_id: {'Count': zed_count, 'Raged': raged}})
-
-    return new_squad
-
-
-# Takes in a token (ie: '4AL') and returns the count and zed identifier
-def separate_token(token):
-    zed_count = '' # The beginning of the token should have a number
-    n = 0 # This is where the token parse stopped, to separate the number from the identifier
-    while n < len(token):
-        ch = token[n]
-        if not ch.isnumeric(): # Stop at the first non-number
-            break
-        zed_count += ch
-        n += 1
-
-    # Get components of the spawndef
-    zed_id = token[n:] # This is the identifier for the zed with the number stripped
-    zed_count = int(token[:n])
-
-    return zed_count, zed_id
+import tokens
+import json
+import os
+import re
+
+_WAVE_PREFIX = 'SpawnCycleDefs='
+_MAX_WAVES = 10
+_MAX_SQUAD_ZEDS = 10
+_BAD_CHAR = re.compile(r'[^\w*!]') # Anything but letters, numbers, the '_' delimiter and the '*' / '!' quantifiers
+_COUNT = re.compile(r'\d*') # ZED count at the start of a token
+_WHITESPACE = re.compile(r'\s*')
+_NEAR_LENGTH = 60 # Longest bit of a squad quoted in an error message
+DEFAULT_MAX_ERRORS = 100 # Most problems reported for one file before parsing stops
+_PARSED_TOKENS_SIZE = 4096 # Most tokens remembered by parse_token before starting over
+_parsed_tokens = {} # Token -> (ZED ID, count, raged), for tokens that parsed without any problems
+_JSON_SLOTS = ['ShortSpawnCycle', 'NormalSpawnCycle', 'LongSpawnCycle']
+_STREAM_CHUNK_SIZE = 65536 # Characters read at a time when streaming JSON
+_MAX_JSON_SIZE = 1048576 # Longest single JSON value read when streaming. Anything bigger is treated as broken
+_TOO_DEEP = 'JSON data is nested too deeply.'
+
+# Diagnostic code -> message. Filled in by format_diagnostic, only when the message is actually shown
+_messages = {'empty-file': "No valid definitions found in file '{filename}'.\nFile is empty!",
+             'too-many-waves': "Unexpected extra data found in '{filename}'.\nDoes the file have more than {max_waves} waves defined?",
+             'missing-prefix': "Improper or missing wave prefix.\nDid you make sure to include '{prefix}' at the start of each line?",
+             'bad-character': "Invalid quantifier/delimiter '{text}' in squad {squad} (near '{near}').\nValid squad delimiters are: '_' and ','\nValid quantifiers are: '*' and '!'",
+             'empty-token': "Found missing or broken token sequence in squad {squad} (near '{near}').",
+             'missing-count': "Missing value prefix for token '{text}' in squad {squad} (near '{near}').",
+             'unknown-zed': "Invalid ZED identifier '{text}' found in squad {squad} (near '{near}').",
+             'rage-not-allowed': "'!' quantifier not allowed for '{text}' in squad {squad} (near '{near}').\nApplicable ZEDs are: Quarter Pound, Fleshpound, Alpha Fleshpound",
+             'albino-not-allowed': "'*' quantifier not allowed for '{text}' in squad {squad} (near '{near}').\nApplicable ZEDs are: Alpha Clot, Gorefast, Crawler, Scrake, Fleshpound",
+             'squad-too-big': "Squad {squad} (near '{near}') surpasses maximum capacity of {max_squad_zeds} ZEDs.",
+             'bad-json': "Invalid JSON data found in '{filename}'.\n{text}",
+             'no-cycles': "No SpawnCycle definitions found in '{filename}'.\nFMX SpawnCycles need a 'ShortSpawnCycle', 'NormalSpawnCycle' or 'LongSpawnCycle'."}
 
 
 # Strips all quantifiers (!, *) from the token and returns them as a list
@@ -235,104 +93,357 @@ def parse_syntax_export(filename, wavedefs):
     return errors
 
 
-# Parses the syntax of the given file. Returns 'None' if successful
-def parse_syntax_import(filename, lines):
-    waves = deepcopy(lines)
-    total_ids = [] # Combination of all id lists for easy checking
-    for l in zed_tokens.values():
-        total_ids += l
-    valid_quantifiers = ['*', '!']
+# Raised once a parse has found as many problems as it's allowed to report
+class TooManyErrors(Exception):
+    pass
+
+
+# Problems found while parsing a SpawnCycle. Each one is a small record of the form
+# {'Line', 'Column', 'Length', 'Squad', 'Code', 'Text', 'Near'}, where Text is the offending text and Near is the squad it's in
+# Lines, columns and squads start at 1. Problems with the whole file have no line / column, and problems with the whole line have no squad
+# Nothing is formatted until it's shown (see format_diagnostic), so even a badly broken file stays cheap to check
+class Diagnostics(list):
+    def __init__(self, max_errors=None):
+        super().__init__()
+        self.max_errors = max_errors # Stop after this many problems (None for no limit)
+        self.truncated = False # Whether any problems were left out because of max_errors
+
+    # Adds a problem. Raises TooManyErrors if max_errors have already been found, so the parse can stop right away
+    # The first problem is always kept, so a broken SpawnCycle never looks clean
+    def add(self, line_num, column, length, squad_num, code, text=None, near=None):
+        if self.max_errors is not None and len(self) >= max(self.max_errors, 1):
+            self.truncated = True
+            raise TooManyErrors()
+        self.append({'Line': line_num, 'Column': column, 'Length': length, 'Squad': squad_num, 'Code': code, 'Text': text, 'Near': near})
+
+
+# Parses one token (ie: '4FP!') starting at the given column (starting at 1) of the given line, adding any problems found to diagnostics
+# Returns (ZED ID, count, raged), with no ZED ID if the identifier is unknown, or None if the token can't be counted at all
+def parse_token(token, line_num, column, squad, squad_num, diagnostics):
+    if len(token) < 1: # Empty token found
+        diagnostics.add(line_num, column, 0, squad_num, 'empty-token', near=squad)
+        return None
+
+    # The beginning of the token should have a number
+    zed_count = _COUNT.match(token).group()
+    if len(zed_count) < 1: # No number at the start of the token
+        diagnostics.add(line_num, column, len(token), squad_num, 'missing-count', text=token, near=squad)
+        return None
+
+    # Check the identifier
+    (zed_id, quantifiers) = strip_quantifiers(token[len(zed_count):])
+    entry = tokens.token_index.get(zed_id.lower())
+    if entry is None:
+        diagnostics.add(line_num, column, len(token), squad_num, 'unknown-zed', text=zed_id, near=squad)
+        entry = (None, False, False) # No quantifiers allowed on an unknown ZED
+    (_, albino_allowed, sr_allowed) = entry
+
+    # Found quantifiers. Make sure it's on the right ZED(s)
+    failed = False
+    for q in quantifiers:
+        if q == '!' and not sr_allowed:
+            diagnostics.add(line_num, column, len(token), squad_num, 'rage-not-allowed', text=zed_id, near=squad)
+            failed = True
+        if q == '*' and not albino_allowed:
+            diagnostics.add(line_num, column, len(token), squad_num, 'albino-not-allowed', text=zed_id, near=squad)
+            failed = True
+    if failed: # Stop if it found invalid quantifiers
+        return None
+    if entry[0] is None: # Still counts towards the squad size
+        return None, int(zed_count), False
+
+    # Get the "Nice Name" for the ZED
+    raged = ('!' in quantifiers)
+    albino = any([q != '!' for q in quantifiers])
+    parsed = (tokens.resolve(zed_id, albino=albino, raged=raged), int(zed_count), raged)
+
+    # Remember it. The same few tokens make up most of any SpawnCycle
+    if len(_parsed_tokens) >= _PARSED_TOKENS_SIZE:
+        _parsed_tokens.clear()
+    _parsed_tokens.update({token: parsed})
+    return parsed
+
+
+# Parses one squad (ie: '4CY_2AL*') starting at the given column (starting at 0) of the given line, adding any problems found to diagnostics
+# Returns the squad in the form {'Cyst': {'Count': 4, 'Raged': False}, ..}
+def parse_squad(squad, line_num, column, squad_num, diagnostics):
+    new_squad = {}
+
+    # Check for bad symbols first
+    for match in _BAD_CHAR.finditer(squad):
+        diagnostics.add(line_num, column + match.start() + 1, 1, squad_num, 'bad-character', text=match.group(), near=squad)
+
+    # Now check the individual tokens, adding each ZED to the squad as it goes
+    total_zeds = 0
+    token_column = column + 1
+    for token in squad.split('_'):
+        parsed = _parsed_tokens.get(token) # Only tokens without any problems are remembered
+        if parsed is None:
+            parsed = parse_token(token, line_num, token_column, squad, squad_num, diagnostics)
+        token_column += len(token) + 1
+        if parsed is None:
+            continue
+
+        # Add this token's ZED count to the total, and the ZED to the squad
+        (zed_id, zed_count, raged) = parsed
+        total_zeds += zed_count
+        if zed_id is None:
+            continue
+        if zed_id in new_squad and new_squad[zed_id]['Raged'] == raged: # Already in the squad and same raged status
+            new_squad.update({zed_id: {'Count': new_squad[zed_id]['Count'] + zed_count, 'Raged': raged}})
+        else:
+            new_squad.update({zed_id: {'Count': zed_count, 'Raged': raged}})
+
+    if total_zeds > _MAX_SQUAD_ZEDS: # Too many ZEDs in squad
+        diagnostics.add(line_num, column + 1, len(squad), squad_num, 'squad-too-big', near=squad)
 
+    return new_squad
+
+
+# Parses one wave (a 'SpawnCycleDefs=' line) in a single pass, adding any problems found to diagnostics
+# Returns the squads of the wave. Empty squads (ie: from a trailing ',') are skipped
+def parse_wave(line, line_num, diagnostics):
+    line = line.replace('\n', '')
+    if line.startswith(_WAVE_PREFIX):
+        column = len(_WAVE_PREFIX)
+    else: # Improper prefix
+        diagnostics.add(line_num, 1, 0, None, 'missing-prefix')
+        column = 0
+
+    wave = []
+    for (j, squad) in enumerate(line[column:].split(','), start=1):
+        if len(squad) > 0:
+            wave.append(parse_squad(squad, line_num, column, j, diagnostics))
+        column += len(squad) + 1
+
+    return wave
+
+
+# Parses the given SpawnCycle (one 'SpawnCycleDefs=' line per wave), checking it for errors as it goes
+# Returns the waves, each being a list of squads of the form {'Cyst': {'Count': 4, 'Raged': False}, ..}, and the Diagnostics
+# The waves are only usable if there are no diagnostics. Parsing stops early once a problem turns up past the first max_errors
+# first_line is the line number of the first wave, for SpawnCycles that don't start at the top of a file
+def parse_spawncycle(lines, max_errors=None, first_line=1):
+    diagnostics = Diagnostics(max_errors)
+    waves = []
+    try:
+        # File is completely empty
+        if len(lines) == 0:
+            diagnostics.add(None, None, None, None, 'empty-file')
+            return waves, diagnostics # Just leave after this error because it's likely there will be hundreds of syntax errors
+
+        # More waves defined than allowed
+        if len(lines) > _MAX_WAVES:
+            diagnostics.add(None, None, None, None, 'too-many-waves')
+            return waves, diagnostics
+
+        for (i, line) in enumerate(lines):
+            waves.append(parse_wave(line, first_line+i, diagnostics))
+    except TooManyErrors: # Found enough problems already
+        pass
+
+    return waves, diagnostics
+
+
+# Returns the message for the given diagnostic
+def format_diagnostic(diagnostic, filename):
+    near = diagnostic['Near']
+    if near is not None and len(near) > _NEAR_LENGTH: # Don't flood the Messages box with a whole broken line
+        near = near[:_NEAR_LENGTH] + '..'
+    return _messages[diagnostic['Code']].format(filename=filename, text=diagnostic['Text'], squad=diagnostic['Squad'], near=near,
+                                                prefix=_WAVE_PREFIX, max_waves=_MAX_WAVES, max_squad_zeds=_MAX_SQUAD_ZEDS)
+
+
+# Returns the given diagnostics as the error messages shown in the Messages box
+# Only the first max_shown diagnostics are formatted (all of them if None)
+def format_diagnostics(filename, diagnostics, max_shown=None):
     fname = f" ('{filename}')" if filename != 'Untitled' else ''
     parse_prefix = f"Parse errors{fname}:\n\n"
-
     errors = []
+    for d in diagnostics[:max_shown]:
+        if d['Line'] is None: # Whole file
+            errors.append(format_diagnostic(d, filename))
+        else:
+            errors.append(f"{parse_prefix}line {d['Line']}: {format_diagnostic(d, filename)}")
 
-    # File is completely empty
-    if len(waves) == 0:
-        errors.append(f"No valid definitions found in file '{filename}'.\nFile is empty!")
-        return errors # Just leave after this error because it's likely there will be hundreds of syntax errors
-
-    # More waves defined than allowed
-    if len(waves) > 10:
-        errors.append(f"Unexpected extra data found in '{filename}'.\nDoes the file have more than 10 waves defined?")
-        return errors
-
-    # Check for invalid characters or identifiers
-    for i in range(len(waves)):
-        waves[i] = waves[i].replace('\n', '') # Replace all newlines
-        line_num = f"line {i+1}:"
-
-        if waves[i][:15] != 'SpawnCycleDefs=': # Improper prefix
-            errors.append(f"{parse_prefix}{line_num} Improper or missing wave prefix.\nDid you make sure to include 'SpawnCycleDefs=' at the start of each line?")
-        
-        # Check squads
-        l = waves[i].replace('SpawnCycleDefs=', '')
-        squads = l.split(',')
-        if len(squads) < 1: # No squads to parse!
-            errors.append(f"{parse_prefix}{line_num} No squads found to parse. Wave is empty!")
-
-        # Now attempt to break down the wave and check tokens
-        for j in range(len(squads)):
-            squad = squads[j] # Current squad
-            if len(squad) < 1: # Empty squad found
-                #errors.append(f"{parse_prefix}{line_num} Found empty/missing squad definition ({j+1}).")
-                continue
-
-            # Check for bad symbols first
-            for ch in squad:
-                if not ch.isalnum() and ch not in (valid_quantifiers + ['_']):
-                    errors.append(f"{parse_prefix}{line_num} Invalid quantifier/delimiter '{ch}' in squad {j+1} (near '{squad}').\nValid squad delimiters are: '_' and ','\nValid quantifiers are: '*' and '!'")
-
-            # Now check the individual tokens
-            tokens = squad.split('_')
-            total_zeds = 0
-            for token in tokens:
-                if len(token) < 1: # Empty token found
-                    errors.append(f"{parse_prefix}{line_num} Found missing or broken token sequence in squad {j+1} (near '{squad}').")
-                    continue
-                # The beginning of the token should have a number
-                zed_count = ''
-                i = 0 # This is where the token parse stopped, to separate the number from the identifier
-                while i < len(token):
-                    ch = token[i]
-                    if not ch.isnumeric(): # Stop at the first non-number
-                        break
-                    zed_count += ch
-                    i += 1
-
-                zed_id = token[i:] # This is the identifier for the zed with the number stripped
-                if len(zed_count) < 1: # No number at the start of the token
-                    errors.append(f"{parse_prefix}{line_num} Missing value prefix for token '{zed_id}' in squad {j+1} (near '{squad}').")
-                    continue
-                zed_count = int(zed_count)
-
-                # Check for invalid quantifiers
-                zed_id, quantifiers = strip_quantifiers(zed_id)
-
-                # Now check the specific identifiers
-                if zed_id.lower() not in total_ids:
-                    errors.append(f"{parse_prefix}{line_num} Invalid ZED identifier '{zed_id}' found in squad {j+1} (near '{squad}').")
-
-                # Found quantifiers. Make sure it's on the right ZED(s)
-                if len(quantifiers) > 0:
-                    sr_allowed = zed_tokens['Fleshpound'] + zed_tokens['Quarter Pound'] + zed_tokens['Alpha Fleshpound']
-                    alb_allowed = zed_tokens['Alpha Clot'] + zed_tokens['Gorefast'] + zed_tokens['Crawler'] + zed_tokens['Fleshpound'] + zed_tokens['Scrake']
-                    failed = False
-                    for q in quantifiers:
-                        if q == '!' and zed_id.lower() not in sr_allowed:
-                            errors.append(f"{parse_prefix}{line_num} '!' quantifier not allowed for '{zed_id}' in squad {j+1} (near '{squad}').\nApplicable ZEDs are: Quarter Pound, Fleshpound, Alpha Fleshpound")
-                            failed = True
-                        if q == '*' and zed_id.lower() not in alb_allowed:
-                            errors.append(f"{parse_prefix}{line_num} '*' quantifier not allowed for '{zed_id}' in squad {j+1} (near '{squad}').\nApplicable ZEDs are: Alpha Clot, Gorefast, Crawler, Scrake, Fleshpound")
-                            failed = True
-                    if failed: # Stop if it found invalid quantifiers
-                        continue
-
-                # Add this squad's ZED count to the total
-                total_zeds += zed_count
-
-            if total_zeds > 10: # Too many ZEDs in squad
-                errors.append(f"{parse_prefix}{line_num} Squad {j+1} (near '{squad}') surpasses maximum capacity of 10 ZEDs.")
+    # Let the user know if they aren't seeing everything
+    if getattr(diagnostics, 'truncated', False):
+        errors.append(f"Too many errors! Stopped checking '{filename}' after the first {len(diagnostics)}.")
+    elif max_shown is not None and len(diagnostics) > max_shown:
+        errors.append(f"{len(diagnostics) - max_shown} more error(s) not shown.")
 
     return errors
+
+
+# Parses the syntax of the given file. Returns a list of error messages (empty if successful)
+def parse_syntax_import(filename, lines, max_errors=DEFAULT_MAX_ERRORS):
+    (_, diagnostics) = parse_spawncycle(lines, max_errors=max_errors)
+    return format_diagnostics(filename, diagnostics)
+
+
+# Returns the format ('txt', 'json' or 'jsonl') of the given file, going by its extension
+def get_stream_format(filename):
+    file_ext = os.path.splitext(filename)[1].lower()
+    if file_ext == '.jsonl':
+        return 'jsonl'
+    elif file_ext == '.json':
+        return 'json'
+    return 'txt'
+
+
+# Returns a record for one streamed SpawnCycle. Index is filled in by iter_spawncycles
+# Line is the line of the file the SpawnCycle starts on. Name and Slot are only set for FMX SpawnCycles (ie: 'LongSpawnCycle')
+def make_cycle(line_num, name, slot, waves, diagnostics):
+    return {'Index': None, 'Line': line_num, 'Name': name, 'Slot': slot, 'Waves': waves, 'Diagnostics': diagnostics}
+
+
+# Returns a record for something in a stream that couldn't be read as a SpawnCycle at all (ie: broken JSON)
+def make_bad_cycle(line_num, code, max_errors, text=None):
+    diagnostics = Diagnostics(max_errors)
+    diagnostics.add(None, None, None, None, code, text=text) # The first problem is always kept
+    return make_cycle(line_num, None, None, [], diagnostics)
+
+
+# Yields the SpawnCycles in a TXT stream. SpawnCycles are separated by one or more blank lines
+# At most one SpawnCycle's worth of lines is held at a time
+def iter_txt_cycles(stream, max_errors):
+    lines = []
+    first_line = None
+    num_cycles = 0
+    for (i, line) in enumerate(stream, start=1):
+        if line.strip() == '': # End of a SpawnCycle
+            if first_line is not None:
+                num_cycles += 1
+                yield make_cycle(first_line, None, None, *parse_spawncycle(lines, max_errors=max_errors, first_line=first_line))
+                lines = []
+                first_line = None
+            continue
+
+        if first_line is None:
+            first_line = i
+        if len(lines) <= _MAX_WAVES: # Anything past this is too many waves anyway. No need to hold onto it
+            lines.append(line)
+
+    if first_line is not None or num_cycles == 0: # Last SpawnCycle, or an empty file
+        first_line = first_line if first_line is not None else 1
+        yield make_cycle(first_line, None, None, *parse_spawncycle(lines, max_errors=max_errors, first_line=first_line))
+
+
+# Returns the SpawnCycles in one FMX SpawnCycle (JSON) value, checking each slot that has one
+# Legacy FMX files store the waves as a dict instead of a list. A (flat) list of FMX SpawnCycles is also accepted
+def parse_fmx(value, line_num, max_errors):
+    if isinstance(value, list):
+        return [cycle for v in value for cycle in parse_fmx_object(v, line_num, max_errors)]
+    return parse_fmx_object(value, line_num, max_errors)
+
+
+# Returns the SpawnCycles in one FMX SpawnCycle (JSON) object
+def parse_fmx_object(value, line_num, max_errors):
+    cycles = []
+    if isinstance(value, dict):
+        for slot in _JSON_SLOTS:
+            cycledef = value.get(slot)
+            if isinstance(cycledef, dict):
+                cycledef = list(cycledef.values())
+            if not isinstance(cycledef, list) or len(cycledef) == 0:
+                continue
+            if not all([isinstance(wd, str) for wd in cycledef]): # Each wave must be a 'SpawnCycleDefs=' string (without the prefix)
+                cycles.append(make_bad_cycle(line_num, 'bad-json', max_errors, text=f"Every wave of '{slot}' must be a string."))
+                continue
+            (waves, diagnostics) = parse_spawncycle([f"{_WAVE_PREFIX}{wd}" for wd in cycledef], max_errors=max_errors)
+            name = value.get('Name') if isinstance(value.get('Name'), str) else None
+            cycles.append(make_cycle(line_num, name, slot, waves, diagnostics))
+
+    if len(cycles) == 0:
+        cycles.append(make_bad_cycle(line_num, 'no-cycles', max_errors))
+    return cycles
+
+
+# Yields the SpawnCycles in a JSON Lines stream (one FMX SpawnCycle per line)
+def iter_jsonl_cycles(stream, max_errors):
+    num_values = 0
+    for (i, line) in enumerate(stream, start=1):
+        if line.strip() == '':
+            continue
+        num_values += 1
+        try:
+            value = json.loads(line)
+        except ValueError as e: # Broken line. The next one is still fine
+            yield make_bad_cycle(i, 'bad-json', max_errors, text=getattr(e, 'msg', str(e)))
+            continue
+        except RecursionError: # Nested too deep to read
+            yield make_bad_cycle(i, 'bad-json', max_errors, text=_TOO_DEEP)
+            continue
+        yield from parse_fmx(value, i, max_errors)
+
+    if num_values == 0:
+        yield make_bad_cycle(1, 'empty-file', max_errors)
+
+
+# Yields the SpawnCycles in a JSON stream holding one or more FMX SpawnCycles, one after the other
+# The stream is read a chunk at a time, so only the JSON value being read is held at once
+def iter_json_cycles(stream, max_errors):
+    decoder = json.JSONDecoder()
+    buf = ''
+    pos = 0
+    line_num = 1 # Line of the stream at pos
+    eof = False
+    num_values = 0
+    while True:
+        # Skip the whitespace between values
+        end = _WHITESPACE.match(buf, pos).end()
+        line_num += buf.count('\n', pos, end)
+        pos = end
+
+        error = None
+        if pos < len(buf):
+            try:
+                (value, end) = decoder.raw_decode(buf, pos)
+            except ValueError as e: # Either broken, or cut off at the end of what's been read so far
+                error = getattr(e, 'msg', str(e))
+            except RecursionError: # Nested too deep to read. Reading more won't help
+                yield make_bad_cycle(line_num, 'bad-json', max_errors, text=_TOO_DEEP)
+                return
+            else:
+                num_values += 1
+                yield from parse_fmx(value, line_num, max_errors)
+                line_num += buf.count('\n', pos, end)
+                pos = end
+                continue
+
+        # Read some more and try again
+        if not eof and len(buf) - pos < _MAX_JSON_SIZE:
+            chunk = stream.read(_STREAM_CHUNK_SIZE)
+            eof = (chunk == '')
+            buf = buf[pos:] + chunk
+            pos = 0
+            continue
+
+        if error is not None: # There's no telling where the next value starts, so nothing past here can be read
+            yield make_bad_cycle(line_num, 'bad-json', max_errors, text=error)
+        elif num_values == 0:
+            yield make_bad_cycle(1, 'empty-file', max_errors)
+        return
+
+
+_stream_readers = {'txt': iter_txt_cycles, 'json': iter_json_cycles, 'jsonl': iter_jsonl_cycles}
+
+
+# Parses every SpawnCycle in the given file (or open text stream) one at a time, without reading it all in at once
+# Yields a record for each SpawnCycle found (see make_cycle), with its Index in the file (starting at 1), its waves and its Diagnostics
+# Handles TXT files with any number of SpawnCycles separated by blank lines, JSON files with one or more FMX SpawnCycles, and JSON Lines files
+# The format is worked out from the file extension unless given ('txt', 'json' or 'jsonl')
+def iter_spawncycles(source, file_format=None, max_errors=DEFAULT_MAX_ERRORS):
+    if isinstance(source, str): # Filename
+        with open(source, 'r') as f_in:
+            yield from iter_spawncycles(f_in, file_format=file_format if file_format is not None else get_stream_format(source), max_errors=max_errors)
+        return
+
+    if file_format is None:
+        file_format = get_stream_format(str(getattr(source, 'name', '')))
+    if file_format not in _stream_readers:
+        raise ValueError(f"Unknown SpawnCycle format '{file_format}'")
+
+    for (i, cycle) in enumerate(_stream_readers[file_format](source, max_errors), start=1):
+        cycle.update({'Index': i})
+        yield cycle
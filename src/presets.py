@@ -0,0 +1,367 @@
+#
+#  presets.py
+#
+#  Author: Tamari
+#  Date of creation: 10/18/2026
+#
+#  Generator presets.
+#  Every preset is validated and compiled into sampler tables once, when it's loaded
+#
+
+
+##  LICENSE INFORMATION
+##  =======================================================================
+##  This program is free software: you can redistribute it and/or modify
+##  it under the terms of the GNU General Public License as published by
+##  the Free Software Foundation, either version 3 of the License, or
+##  (at your option) any later version.
+##
+##  This program is distributed in the hope that it will be useful,
+##  but WITHOUT ANY WARRANTY; without even the implied warranty of
+##  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+##  GNU General Public License for more details.
+##
+##  You should have received a copy of the GNU General Public License
+##  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+##  =======================================================================
+##
+##  © Tamari 2020-2022
+##  All rights reserved.
+
+
+from collections import OrderedDict
+import json
+import os
+import sampler
+
+_PATH_USER_PRESETS = 'user_presets' # User-defined presets are loaded from the JSON files in here
+_COMPILED_CACHE_SIZE = 64 # Max number of compiled slider settings kept, on top of the presets themselves
+
+# The Generator's sliders, in the order they're applied
+slider_keys = ['Game Length', 'Min Squads', 'Max Squads', 'Squad Min Length', 'Squad Max Length', 'Albino Min Wave', 'Large Min Wave', 'SpawnRage Min Wave', 'Boss Min Wave',
+               'Trash Density', 'Medium Density', 'Large Density', 'Boss Density',
+               'Cyst Density', 'Slasher Density', 'Slasher Omega Density', 'Alpha Clot Density', 'Alpha Clot Albino Density', 'Gorefast Density', 'Gorefast Albino Density',
+               'Gorefast Omega Density', 'Crawler Density', 'Crawler Albino Density', 'Tiny Crawler Density', 'Medium Crawler Density', 'Big Crawler Density',
+               'Huge Crawler Density', 'Ultra Crawler Density', 'Stalker Density', 'Stalker Omega Density',
+               'Bloat Density', 'Husk Density', 'Husk Omega Density', 'Tiny Husk Density', 'Siren Density', 'Siren Omega Density', 'E.D.A.R Trapper Density',
+               'E.D.A.R Blaster Density', 'E.D.A.R Bomber Density',
+               'Scrake Density', 'Scrake Albino Density', 'Scrake Omega Density', 'Scrake Emperor Density', 'Tiny Scrake Density', 'Quarter Pound Density',
+               'Quarter Pound Rage Density', 'Fleshpound Density', 'Fleshpound Albino Density', 'Fleshpound Rage Density', 'Fleshpound Omega Density',
+               'Hans Density', 'Patriarch Density', 'King Fleshpound Density', 'Abomination Density', 'Matriarch Density', 'Abomination Spawn Density']
+
+# The range of every slider. The SpawnCycle Length slider is 1 = Short, 2 = Medium, 3 = Long
+slider_ranges = {key: (0, 100) for key in slider_keys} # Density sliders
+slider_ranges.update({'Game Length': (1, 3), 'Min Squads': (1, 100), 'Max Squads': (1, 100), 'Squad Min Length': (1, 10), 'Squad Max Length': (1, 10),
+                      'Albino Min Wave': (1, 10), 'Large Min Wave': (1, 10), 'SpawnRage Min Wave': (1, 10), 'Boss Min Wave': (1, 10)})
+
+# Built-in presets for the Generator, as slider values by name (the same form as user presets)
+# These are only used to build the preset registry (presets) at the bottom of this file
+_builtin_values = {
+    'Light': {'Game Length': 3, 'Min Squads': 15, 'Max Squads': 20, 'Squad Min Length': 3, 'Squad Max Length': 5, 'Albino Min Wave': 5, 'Large Min Wave': 7, 'SpawnRage Min Wave': 10, 'Boss Min Wave': 10,
+              'Trash Density': 100, 'Medium Density': 50, 'Large Density': 15, 'Boss Density': 0,
+              'Cyst Density': 100, 'Slasher Density': 100, 'Slasher Omega Density': 0, 'Alpha Clot Density': 100, 'Alpha Clot Albino Density': 5, 'Gorefast Density': 100, 'Gorefast Albino Density': 5, 'Gorefast Omega Density': 0, 'Crawler Density': 100, 'Crawler Albino Density': 5, 'Tiny Crawler Density': 0, 'Medium Crawler Density': 0, 'Big Crawler Density': 0, 'Huge Crawler Density': 0, 'Ultra Crawler Density': 0, 'Stalker Density': 100, 'Stalker Omega Density': 0,
+              'Bloat Density': 100, 'Husk Density': 100, 'Husk Omega Density': 0, 'Tiny Husk Density': 0, 'Siren Density': 100, 'Siren Omega Density': 0, 'E.D.A.R Trapper Density': 0, 'E.D.A.R Blaster Density': 0, 'E.D.A.R Bomber Density': 0,
+              'Scrake Density': 100, 'Scrake Albino Density': 0, 'Scrake Omega Density': 0, 'Scrake Emperor Density': 0, 'Tiny Scrake Density': 0, 'Quarter Pound Density': 100, 'Quarter Pound Rage Density': 0, 'Fleshpound Density': 100, 'Fleshpound Albino Density': 0, 'Fleshpound Rage Density': 0, 'Fleshpound Omega Density': 0,
+              'Hans Density': 0, 'Patriarch Density': 0, 'King Fleshpound Density': 0, 'Abomination Density': 0, 'Matriarch Density': 0, 'Abomination Spawn Density': 0},
+    'Moderate': {'Game Length': 3, 'Min Squads': 20, 'Max Squads': 25, 'Squad Min Length': 4, 'Squad Max Length': 7, 'Albino Min Wave': 4, 'Large Min Wave': 4, 'SpawnRage Min Wave': 8, 'Boss Min Wave': 10,
+                 'Trash Density': 75, 'Medium Density': 60, 'Large Density': 35, 'Boss Density': 0,
+                 'Cyst Density': 100, 'Slasher Density': 100, 'Slasher Omega Density': 0, 'Alpha Clot Density': 100, 'Alpha Clot Albino Density': 10, 'Gorefast Density': 100, 'Gorefast Albino Density': 10, 'Gorefast Omega Density': 0, 'Crawler Density': 100, 'Crawler Albino Density': 10, 'Tiny Crawler Density': 0, 'Medium Crawler Density': 0, 'Big Crawler Density': 0, 'Huge Crawler Density': 0, 'Ultra Crawler Density': 0, 'Stalker Density': 100, 'Stalker Omega Density': 0,
+                 'Bloat Density': 100, 'Husk Density': 100, 'Husk Omega Density': 0, 'Tiny Husk Density': 0, 'Siren Density': 100, 'Siren Omega Density': 0, 'E.D.A.R Trapper Density': 0, 'E.D.A.R Blaster Density': 0, 'E.D.A.R Bomber Density': 0,
+                 'Scrake Density': 100, 'Scrake Albino Density': 0, 'Scrake Omega Density': 0, 'Scrake Emperor Density': 0, 'Tiny Scrake Density': 0, 'Quarter Pound Density': 100, 'Quarter Pound Rage Density': 5, 'Fleshpound Density': 100, 'Fleshpound Albino Density': 0, 'Fleshpound Rage Density': 5, 'Fleshpound Omega Density': 0,
+                 'Hans Density': 0, 'Patriarch Density': 0, 'King Fleshpound Density': 0, 'Abomination Density': 0, 'Matriarch Density': 0, 'Abomination Spawn Density': 0},
+    'Heavy': {'Game Length': 3, 'Min Squads': 30, 'Max Squads': 35, 'Squad Min Length': 5, 'Squad Max Length': 10, 'Albino Min Wave': 2, 'Large Min Wave': 2, 'SpawnRage Min Wave': 7, 'Boss Min Wave': 10,
+              'Trash Density': 60, 'Medium Density': 50, 'Large Density': 40, 'Boss Density': 0,
+              'Cyst Density': 100, 'Slasher Density': 100, 'Slasher Omega Density': 0, 'Alpha Clot Density': 100, 'Alpha Clot Albino Density': 15, 'Gorefast Density': 100, 'Gorefast Albino Density': 15, 'Gorefast Omega Density': 0, 'Crawler Density': 100, 'Crawler Albino Density': 15, 'Tiny Crawler Density': 0, 'Medium Crawler Density': 0, 'Big Crawler Density': 0, 'Huge Crawler Density': 0, 'Ultra Crawler Density': 0, 'Stalker Density': 100, 'Stalker Omega Density': 0,
+              'Bloat Density': 100, 'Husk Density': 100, 'Husk Omega Density': 0, 'Tiny Husk Density': 0, 'Siren Density': 100, 'Siren Omega Density': 0, 'E.D.A.R Trapper Density': 0, 'E.D.A.R Blaster Density': 0, 'E.D.A.R Bomber Density': 0,
+              'Scrake Density': 100, 'Scrake Albino Density': 0, 'Scrake Omega Density': 0, 'Scrake Emperor Density': 0, 'Tiny Scrake Density': 0, 'Quarter Pound Density': 100, 'Quarter Pound Rage Density': 10, 'Fleshpound Density': 100, 'Fleshpound Albino Density': 0, 'Fleshpound Rage Density': 10, 'Fleshpound Omega Density': 0,
+              'Hans Density': 0, 'Patriarch Density': 0, 'King Fleshpound Density': 0, 'Abomination Density': 0, 'Matriarch Density': 0, 'Abomination Spawn Density': 0},
+    'Albino': {'Game Length': 3, 'Min Squads': 25, 'Max Squads': 30, 'Squad Min Length': 4, 'Squad Max Length': 8, 'Albino Min Wave': 1, 'Large Min Wave': 4, 'SpawnRage Min Wave': 8, 'Boss Min Wave': 10,
+               'Trash Density': 100, 'Medium Density': 30, 'Large Density': 30, 'Boss Density': 0,
+               'Cyst Density': 50, 'Slasher Density': 50, 'Slasher Omega Density': 0, 'Alpha Clot Density': 100, 'Alpha Clot Albino Density': 80, 'Gorefast Density': 100, 'Gorefast Albino Density': 80, 'Gorefast Omega Density': 0, 'Crawler Density': 100, 'Crawler Albino Density': 80, 'Tiny Crawler Density': 0, 'Medium Crawler Density': 0, 'Big Crawler Density': 0, 'Huge Crawler Density': 0, 'Ultra Crawler Density': 0, 'Stalker Density': 50, 'Stalker Omega Density': 0,
+               'Bloat Density': 100, 'Husk Density': 100, 'Husk Omega Density': 0, 'Tiny Husk Density': 0, 'Siren Density': 100, 'Siren Omega Density': 0, 'E.D.A.R Trapper Density': 0, 'E.D.A.R Blaster Density': 0, 'E.D.A.R Bomber Density': 0,
+               'Scrake Density': 100, 'Scrake Albino Density': 0, 'Scrake Omega Density': 0, 'Scrake Emperor Density': 0, 'Tiny Scrake Density': 0, 'Quarter Pound Density': 100, 'Quarter Pound Rage Density': 5, 'Fleshpound Density': 100, 'Fleshpound Albino Density': 0, 'Fleshpound Rage Density': 5, 'Fleshpound Omega Density': 0,
+               'Hans Density': 0, 'Patriarch Density': 0, 'King Fleshpound Density': 0, 'Abomination Density': 0, 'Matriarch Density': 0, 'Abomination Spawn Density': 0},
+    'Poundemonium': {'Game Length': 3, 'Min Squads': 25, 'Max Squads': 35, 'Squad Min Length': 5, 'Squad Max Length': 10, 'Albino Min Wave': 4, 'Large Min Wave': 3, 'SpawnRage Min Wave': 8, 'Boss Min Wave': 10,
+                     'Trash Density': 30, 'Medium Density': 30, 'Large Density': 65, 'Boss Density': 0,
+                     'Cyst Density': 100, 'Slasher Density': 100, 'Slasher Omega Density': 0, 'Alpha Clot Density': 100, 'Alpha Clot Albino Density': 15, 'Gorefast Density': 100, 'Gorefast Albino Density': 15, 'Gorefast Omega Density': 0, 'Crawler Density': 100, 'Crawler Albino Density': 15, 'Tiny Crawler Density': 0, 'Medium Crawler Density': 0, 'Big Crawler Density': 0, 'Huge Crawler Density': 0, 'Ultra Crawler Density': 0, 'Stalker Density': 100, 'Stalker Omega Density': 0,
+                     'Bloat Density': 100, 'Husk Density': 100, 'Husk Omega Density': 0, 'Tiny Husk Density': 0, 'Siren Density': 100, 'Siren Omega Density': 0, 'E.D.A.R Trapper Density': 0, 'E.D.A.R Blaster Density': 0, 'E.D.A.R Bomber Density': 0,
+                     'Scrake Density': 50, 'Scrake Albino Density': 0, 'Scrake Omega Density': 0, 'Scrake Emperor Density': 0, 'Tiny Scrake Density': 0, 'Quarter Pound Density': 100, 'Quarter Pound Rage Density': 7, 'Fleshpound Density': 100, 'Fleshpound Albino Density': 0, 'Fleshpound Rage Density': 7, 'Fleshpound Omega Density': 0,
+                     'Hans Density': 0, 'Patriarch Density': 0, 'King Fleshpound Density': 0, 'Abomination Density': 0, 'Matriarch Density': 0, 'Abomination Spawn Density': 0},
+    'GSO': {'Game Length': 3, 'Min Squads': 25, 'Max Squads': 40, 'Squad Min Length': 8, 'Squad Max Length': 10, 'Albino Min Wave': 4, 'Large Min Wave': 3, 'SpawnRage Min Wave': 5, 'Boss Min Wave': 10,
+            'Trash Density': 15, 'Medium Density': 15, 'Large Density': 100, 'Boss Density': 0,
+            'Cyst Density': 100, 'Slasher Density': 100, 'Slasher Omega Density': 0, 'Alpha Clot Density': 100, 'Alpha Clot Albino Density': 15, 'Gorefast Density': 100, 'Gorefast Albino Density': 15, 'Gorefast Omega Density': 0, 'Crawler Density': 100, 'Crawler Albino Density': 15, 'Tiny Crawler Density': 0, 'Medium Crawler Density': 0, 'Big Crawler Density': 0, 'Huge Crawler Density': 0, 'Ultra Crawler Density': 0, 'Stalker Density': 100, 'Stalker Omega Density': 0,
+            'Bloat Density': 100, 'Husk Density': 100, 'Husk Omega Density': 0, 'Tiny Husk Density': 0, 'Siren Density': 100, 'Siren Omega Density': 0, 'E.D.A.R Trapper Density': 0, 'E.D.A.R Blaster Density': 0, 'E.D.A.R Bomber Density': 0,
+            'Scrake Density': 10, 'Scrake Albino Density': 0, 'Scrake Omega Density': 0, 'Scrake Emperor Density': 0, 'Tiny Scrake Density': 0, 'Quarter Pound Density': 100, 'Quarter Pound Rage Density': 12, 'Fleshpound Density': 100, 'Fleshpound Albino Density': 0, 'Fleshpound Rage Density': 12, 'Fleshpound Omega Density': 0,
+            'Hans Density': 0, 'Patriarch Density': 0, 'King Fleshpound Density': 0, 'Abomination Density': 0, 'Matriarch Density': 0, 'Abomination Spawn Density': 0},
+    'Min Settings': {'Game Length': 1, 'Min Squads': 1, 'Max Squads': 50, 'Squad Min Length': 1, 'Squad Max Length': 8, 'Albino Min Wave': 1, 'Large Min Wave': 1, 'SpawnRage Min Wave': 1, 'Boss Min Wave': 4,
+                     'Trash Density': 100, 'Medium Density': 100, 'Large Density': 100, 'Boss Density': 0,
+                     'Cyst Density': 100, 'Slasher Density': 100, 'Slasher Omega Density': 0, 'Alpha Clot Density': 100, 'Alpha Clot Albino Density': 0, 'Gorefast Density': 100, 'Gorefast Albino Density': 0, 'Gorefast Omega Density': 0, 'Crawler Density': 100, 'Crawler Albino Density': 0, 'Tiny Crawler Density': 0, 'Medium Crawler Density': 0, 'Big Crawler Density': 0, 'Huge Crawler Density': 0, 'Ultra Crawler Density': 0, 'Stalker Density': 100, 'Stalker Omega Density': 0,
+                     'Bloat Density': 100, 'Husk Density': 100, 'Husk Omega Density': 0, 'Tiny Husk Density': 0, 'Siren Density': 100, 'Siren Omega Density': 0, 'E.D.A.R Trapper Density': 0, 'E.D.A.R Blaster Density': 0, 'E.D.A.R Bomber Density': 0,
+                     'Scrake Density': 100, 'Scrake Albino Density': 0, 'Scrake Omega Density': 0, 'Scrake Emperor Density': 0, 'Tiny Scrake Density': 0, 'Quarter Pound Density': 100, 'Quarter Pound Rage Density': 0, 'Fleshpound Density': 100, 'Fleshpound Albino Density': 0, 'Fleshpound Rage Density': 0, 'Fleshpound Omega Density': 0,
+                     'Hans Density': 0, 'Patriarch Density': 0, 'King Fleshpound Density': 100, 'Abomination Density': 0, 'Matriarch Density': 0, 'Abomination Spawn Density': 100},
+    'Max Settings': {'Game Length': 3, 'Min Squads': 100, 'Max Squads': 100, 'Squad Min Length': 10, 'Squad Max Length': 10, 'Albino Min Wave': 1, 'Large Min Wave': 1, 'SpawnRage Min Wave': 1, 'Boss Min Wave': 10,
+                     'Trash Density': 100, 'Medium Density': 100, 'Large Density': 100, 'Boss Density': 0,
+                     'Cyst Density': 100, 'Slasher Density': 100, 'Slasher Omega Density': 0, 'Alpha Clot Density': 100, 'Alpha Clot Albino Density': 100, 'Gorefast Density': 100, 'Gorefast Albino Density': 100, 'Gorefast Omega Density': 0, 'Crawler Density': 100, 'Crawler Albino Density': 100, 'Tiny Crawler Density': 0, 'Medium Crawler Density': 0, 'Big Crawler Density': 0, 'Huge Crawler Density': 0, 'Ultra Crawler Density': 0, 'Stalker Density': 100, 'Stalker Omega Density': 0,
+                     'Bloat Density': 100, 'Husk Density': 100, 'Husk Omega Density': 0, 'Tiny Husk Density': 0, 'Siren Density': 100, 'Siren Omega Density': 0, 'E.D.A.R Trapper Density': 0, 'E.D.A.R Blaster Density': 0, 'E.D.A.R Bomber Density': 0,
+                     'Scrake Density': 100, 'Scrake Albino Density': 0, 'Scrake Omega Density': 0, 'Scrake Emperor Density': 0, 'Tiny Scrake Density': 0, 'Quarter Pound Density': 100, 'Quarter Pound Rage Density': 100, 'Fleshpound Density': 100, 'Fleshpound Albino Density': 0, 'Fleshpound Rage Density': 100, 'Fleshpound Omega Density': 0,
+                     'Hans Density': 0, 'Patriarch Density': 0, 'King Fleshpound Density': 100, 'Abomination Density': 0, 'Matriarch Density': 0, 'Abomination Spawn Density': 100},
+    'Putrid Pollution': {'Game Length': 3, 'Min Squads': 15, 'Max Squads': 25, 'Squad Min Length': 5, 'Squad Max Length': 8, 'Albino Min Wave': 3, 'Large Min Wave': 5, 'SpawnRage Min Wave': 10, 'Boss Min Wave': 10,
+                         'Trash Density': 60, 'Medium Density': 75, 'Large Density': 10, 'Boss Density': 0,
+                         'Cyst Density': 100, 'Slasher Density': 100, 'Slasher Omega Density': 0, 'Alpha Clot Density': 100, 'Alpha Clot Albino Density': 5, 'Gorefast Density': 100, 'Gorefast Albino Density': 5, 'Gorefast Omega Density': 0, 'Crawler Density': 100, 'Crawler Albino Density': 5, 'Tiny Crawler Density': 0, 'Medium Crawler Density': 0, 'Big Crawler Density': 0, 'Huge Crawler Density': 0, 'Ultra Crawler Density': 0, 'Stalker Density': 100, 'Stalker Omega Density': 0,
+                         'Bloat Density': 100, 'Husk Density': 30, 'Husk Omega Density': 0, 'Tiny Husk Density': 0, 'Siren Density': 30, 'Siren Omega Density': 0, 'E.D.A.R Trapper Density': 0, 'E.D.A.R Blaster Density': 0, 'E.D.A.R Bomber Density': 0,
+                         'Scrake Density': 100, 'Scrake Albino Density': 0, 'Scrake Omega Density': 0, 'Scrake Emperor Density': 0, 'Tiny Scrake Density': 0, 'Quarter Pound Density': 100, 'Quarter Pound Rage Density': 5, 'Fleshpound Density': 100, 'Fleshpound Albino Density': 0, 'Fleshpound Rage Density': 5, 'Fleshpound Omega Density': 0,
+                         'Hans Density': 0, 'Patriarch Density': 0, 'King Fleshpound Density': 0, 'Abomination Density': 0, 'Matriarch Density': 0, 'Abomination Spawn Density': 0},
+    'Sonic Subversion': {'Game Length': 3, 'Min Squads': 15, 'Max Squads': 25, 'Squad Min Length': 5, 'Squad Max Length': 8, 'Albino Min Wave': 3, 'Large Min Wave': 5, 'SpawnRage Min Wave': 10, 'Boss Min Wave': 10,
+                         'Trash Density': 60, 'Medium Density': 75, 'Large Density': 10, 'Boss Density': 0,
+                         'Cyst Density': 100, 'Slasher Density': 100, 'Slasher Omega Density': 0, 'Alpha Clot Density': 100, 'Alpha Clot Albino Density': 5, 'Gorefast Density': 100, 'Gorefast Albino Density': 5, 'Gorefast Omega Density': 0, 'Crawler Density': 100, 'Crawler Albino Density': 5, 'Tiny Crawler Density': 0, 'Medium Crawler Density': 0, 'Big Crawler Density': 0, 'Huge Crawler Density': 0, 'Ultra Crawler Density': 0, 'Stalker Density': 100, 'Stalker Omega Density': 0,
+                         'Bloat Density': 30, 'Husk Density': 30, 'Husk Omega Density': 0, 'Tiny Husk Density': 0, 'Siren Density': 100, 'Siren Omega Density': 0, 'E.D.A.R Trapper Density': 0, 'E.D.A.R Blaster Density': 0, 'E.D.A.R Bomber Density': 0,
+                         'Scrake Density': 100, 'Scrake Albino Density': 0, 'Scrake Omega Density': 0, 'Scrake Emperor Density': 0, 'Tiny Scrake Density': 0, 'Quarter Pound Density': 100, 'Quarter Pound Rage Density': 5, 'Fleshpound Density': 100, 'Fleshpound Albino Density': 0, 'Fleshpound Rage Density': 5, 'Fleshpound Omega Density': 0,
+                         'Hans Density': 0, 'Patriarch Density': 0, 'King Fleshpound Density': 0, 'Abomination Density': 0, 'Matriarch Density': 0, 'Abomination Spawn Density': 0},
+    'Android Annihilation': {'Game Length': 3, 'Min Squads': 15, 'Max Squads': 25, 'Squad Min Length': 5, 'Squad Max Length': 8, 'Albino Min Wave': 3, 'Large Min Wave': 5, 'SpawnRage Min Wave': 10, 'Boss Min Wave': 10,
+                             'Trash Density': 60, 'Medium Density': 75, 'Large Density': 10, 'Boss Density': 0,
+                             'Cyst Density': 100, 'Slasher Density': 100, 'Slasher Omega Density': 0, 'Alpha Clot Density': 100, 'Alpha Clot Albino Density': 5, 'Gorefast Density': 100, 'Gorefast Albino Density': 5, 'Gorefast Omega Density': 0, 'Crawler Density': 100, 'Crawler Albino Density': 5, 'Tiny Crawler Density': 0, 'Medium Crawler Density': 0, 'Big Crawler Density': 0, 'Huge Crawler Density': 0, 'Ultra Crawler Density': 0, 'Stalker Density': 100, 'Stalker Omega Density': 0,
+                             'Bloat Density': 30, 'Husk Density': 30, 'Husk Omega Density': 0, 'Tiny Husk Density': 0, 'Siren Density': 30, 'Siren Omega Density': 0, 'E.D.A.R Trapper Density': 10, 'E.D.A.R Blaster Density': 100, 'E.D.A.R Bomber Density': 100,
+                             'Scrake Density': 100, 'Scrake Albino Density': 0, 'Scrake Omega Density': 0, 'Scrake Emperor Density': 0, 'Tiny Scrake Density': 0, 'Quarter Pound Density': 100, 'Quarter Pound Rage Density': 5, 'Fleshpound Density': 100, 'Fleshpound Albino Density': 0, 'Fleshpound Rage Density': 5, 'Fleshpound Omega Density': 0,
+                             'Hans Density': 0, 'Patriarch Density': 0, 'King Fleshpound Density': 0, 'Abomination Density': 0, 'Matriarch Density': 0, 'Abomination Spawn Density': 0},
+    'Arachnophobia': {'Game Length': 3, 'Min Squads': 15, 'Max Squads': 25, 'Squad Min Length': 5, 'Squad Max Length': 8, 'Albino Min Wave': 3, 'Large Min Wave': 5, 'SpawnRage Min Wave': 10, 'Boss Min Wave': 10,
+                      'Trash Density': 100, 'Medium Density': 10, 'Large Density': 10, 'Boss Density': 0,
+                      'Cyst Density': 10, 'Slasher Density': 10, 'Slasher Omega Density': 0, 'Alpha Clot Density': 10, 'Alpha Clot Albino Density': 5, 'Gorefast Density': 10, 'Gorefast Albino Density': 5, 'Gorefast Omega Density': 0, 'Crawler Density': 100, 'Crawler Albino Density': 15, 'Tiny Crawler Density': 0, 'Medium Crawler Density': 0, 'Big Crawler Density': 0, 'Huge Crawler Density': 0, 'Ultra Crawler Density': 0, 'Stalker Density': 10, 'Stalker Omega Density': 0,
+                      'Bloat Density': 100, 'Husk Density': 100, 'Husk Omega Density': 0, 'Tiny Husk Density': 0, 'Siren Density': 100, 'Siren Omega Density': 0, 'E.D.A.R Trapper Density': 0, 'E.D.A.R Blaster Density': 0, 'E.D.A.R Bomber Density': 0,
+                      'Scrake Density': 100, 'Scrake Albino Density': 0, 'Scrake Omega Density': 0, 'Scrake Emperor Density': 0, 'Tiny Scrake Density': 0, 'Quarter Pound Density': 100, 'Quarter Pound Rage Density': 5, 'Fleshpound Density': 100, 'Fleshpound Albino Density': 0, 'Fleshpound Rage Density': 5, 'Fleshpound Omega Density': 0,
+                      'Hans Density': 0, 'Patriarch Density': 0, 'King Fleshpound Density': 0, 'Abomination Density': 0, 'Matriarch Density': 0, 'Abomination Spawn Density': 0},
+    'Cloaked Carnage': {'Game Length': 3, 'Min Squads': 15, 'Max Squads': 25, 'Squad Min Length': 5, 'Squad Max Length': 8, 'Albino Min Wave': 3, 'Large Min Wave': 5, 'SpawnRage Min Wave': 10, 'Boss Min Wave': 10,
+                        'Trash Density': 100, 'Medium Density': 10, 'Large Density': 10, 'Boss Density': 0,
+                        'Cyst Density': 10, 'Slasher Density': 10, 'Slasher Omega Density': 0, 'Alpha Clot Density': 10, 'Alpha Clot Albino Density': 5, 'Gorefast Density': 10, 'Gorefast Albino Density': 5, 'Gorefast Omega Density': 0, 'Crawler Density': 10, 'Crawler Albino Density': 5, 'Tiny Crawler Density': 0, 'Medium Crawler Density': 0, 'Big Crawler Density': 0, 'Huge Crawler Density': 0, 'Ultra Crawler Density': 0, 'Stalker Density': 100, 'Stalker Omega Density': 0,
+                        'Bloat Density': 100, 'Husk Density': 100, 'Husk Omega Density': 0, 'Tiny Husk Density': 0, 'Siren Density': 100, 'Siren Omega Density': 0, 'E.D.A.R Trapper Density': 0, 'E.D.A.R Blaster Density': 0, 'E.D.A.R Bomber Density': 0,
+                        'Scrake Density': 100, 'Scrake Albino Density': 0, 'Scrake Omega Density': 0, 'Scrake Emperor Density': 0, 'Tiny Scrake Density': 0, 'Quarter Pound Density': 100, 'Quarter Pound Rage Density': 5, 'Fleshpound Density': 100, 'Fleshpound Albino Density': 0, 'Fleshpound Rage Density': 5, 'Fleshpound Omega Density': 0,
+                        'Hans Density': 0, 'Patriarch Density': 0, 'King Fleshpound Density': 0, 'Abomination Density': 0, 'Matriarch Density': 0, 'Abomination Spawn Density': 0},
+    'Hellish Inferno': {'Game Length': 2, 'Min Squads': 15, 'Max Squads': 25, 'Squad Min Length': 5, 'Squad Max Length': 10, 'Albino Min Wave': 2, 'Large Min Wave': 4, 'SpawnRage Min Wave': 7, 'Boss Min Wave': 7,
+                        'Trash Density': 10, 'Medium Density': 100, 'Large Density': 10, 'Boss Density': 0,
+                        'Cyst Density': 100, 'Slasher Density': 100, 'Slasher Omega Density': 0, 'Alpha Clot Density': 100, 'Alpha Clot Albino Density': 10, 'Gorefast Density': 100, 'Gorefast Albino Density': 10, 'Gorefast Omega Density': 0, 'Crawler Density': 100, 'Crawler Albino Density': 10, 'Tiny Crawler Density': 0, 'Medium Crawler Density': 0, 'Big Crawler Density': 0, 'Huge Crawler Density': 0, 'Ultra Crawler Density': 0, 'Stalker Density': 100, 'Stalker Omega Density': 0,
+                        'Bloat Density': 0, 'Husk Density': 100, 'Husk Omega Density': 0, 'Tiny Husk Density': 0, 'Siren Density': 0, 'Siren Omega Density': 0, 'E.D.A.R Trapper Density': 0, 'E.D.A.R Blaster Density': 0, 'E.D.A.R Bomber Density': 0,
+                        'Scrake Density': 100, 'Scrake Albino Density': 0, 'Scrake Omega Density': 0, 'Scrake Emperor Density': 0, 'Tiny Scrake Density': 0, 'Quarter Pound Density': 100, 'Quarter Pound Rage Density': 5, 'Fleshpound Density': 100, 'Fleshpound Albino Density': 0, 'Fleshpound Rage Density': 5, 'Fleshpound Omega Density': 0,
+                        'Hans Density': 0, 'Patriarch Density': 0, 'King Fleshpound Density': 0, 'Abomination Density': 0, 'Matriarch Density': 0, 'Abomination Spawn Density': 0},
+    'Trash Only': {'Game Length': 3, 'Min Squads': 15, 'Max Squads': 20, 'Squad Min Length': 1, 'Squad Max Length': 4, 'Albino Min Wave': 3, 'Large Min Wave': 4, 'SpawnRage Min Wave': 8, 'Boss Min Wave': 10,
+                   'Trash Density': 100, 'Medium Density': 0, 'Large Density': 0, 'Boss Density': 0,
+                   'Cyst Density': 100, 'Slasher Density': 100, 'Slasher Omega Density': 0, 'Alpha Clot Density': 100, 'Alpha Clot Albino Density': 10, 'Gorefast Density': 100, 'Gorefast Albino Density': 10, 'Gorefast Omega Density': 0, 'Crawler Density': 100, 'Crawler Albino Density': 10, 'Tiny Crawler Density': 0, 'Medium Crawler Density': 0, 'Big Crawler Density': 0, 'Huge Crawler Density': 0, 'Ultra Crawler Density': 0, 'Stalker Density': 100, 'Stalker Omega Density': 0,
+                   'Bloat Density': 100, 'Husk Density': 100, 'Husk Omega Density': 0, 'Tiny Husk Density': 0, 'Siren Density': 100, 'Siren Omega Density': 0, 'E.D.A.R Trapper Density': 0, 'E.D.A.R Blaster Density': 0, 'E.D.A.R Bomber Density': 0,
+                   'Scrake Density': 100, 'Scrake Albino Density': 0, 'Scrake Omega Density': 0, 'Scrake Emperor Density': 0, 'Tiny Scrake Density': 0, 'Quarter Pound Density': 100, 'Quarter Pound Rage Density': 5, 'Fleshpound Density': 100, 'Fleshpound Albino Density': 0, 'Fleshpound Rage Density': 5, 'Fleshpound Omega Density': 0,
+                   'Hans Density': 0, 'Patriarch Density': 0, 'King Fleshpound Density': 0, 'Abomination Density': 0, 'Matriarch Density': 0, 'Abomination Spawn Density': 0},
+    'Medium Only': {'Game Length': 3, 'Min Squads': 15, 'Max Squads': 20, 'Squad Min Length': 1, 'Squad Max Length': 4, 'Albino Min Wave': 3, 'Large Min Wave': 4, 'SpawnRage Min Wave': 8, 'Boss Min Wave': 10,
+                    'Trash Density': 0, 'Medium Density': 100, 'Large Density': 0, 'Boss Density': 0,
+                    'Cyst Density': 100, 'Slasher Density': 100, 'Slasher Omega Density': 0, 'Alpha Clot Density': 100, 'Alpha Clot Albino Density': 10, 'Gorefast Density': 100, 'Gorefast Albino Density': 10, 'Gorefast Omega Density': 0, 'Crawler Density': 100, 'Crawler Albino Density': 10, 'Tiny Crawler Density': 0, 'Medium Crawler Density': 0, 'Big Crawler Density': 0, 'Huge Crawler Density': 0, 'Ultra Crawler Density': 0, 'Stalker Density': 100, 'Stalker Omega Density': 0,
+                    'Bloat Density': 100, 'Husk Density': 100, 'Husk Omega Density': 0, 'Tiny Husk Density': 0, 'Siren Density': 100, 'Siren Omega Density': 0, 'E.D.A.R Trapper Density': 0, 'E.D.A.R Blaster Density': 0, 'E.D.A.R Bomber Density': 0,
+                    'Scrake Density': 100, 'Scrake Albino Density': 0, 'Scrake Omega Density': 0, 'Scrake Emperor Density': 0, 'Tiny Scrake Density': 0, 'Quarter Pound Density': 100, 'Quarter Pound Rage Density': 5, 'Fleshpound Density': 100, 'Fleshpound Albino Density': 0, 'Fleshpound Rage Density': 5, 'Fleshpound Omega Density': 0,
+                    'Hans Density': 0, 'Patriarch Density': 0, 'King Fleshpound Density': 0, 'Abomination Density': 0, 'Matriarch Density': 0, 'Abomination Spawn Density': 0},
+    'Large Only': {'Game Length': 3, 'Min Squads': 15, 'Max Squads': 20, 'Squad Min Length': 1, 'Squad Max Length': 4, 'Albino Min Wave': 3, 'Large Min Wave': 1, 'SpawnRage Min Wave': 8, 'Boss Min Wave': 10,
+                   'Trash Density': 0, 'Medium Density': 0, 'Large Density': 100, 'Boss Density': 0,
+                   'Cyst Density': 100, 'Slasher Density': 100, 'Slasher Omega Density': 0, 'Alpha Clot Density': 100, 'Alpha Clot Albino Density': 10, 'Gorefast Density': 100, 'Gorefast Albino Density': 10, 'Gorefast Omega Density': 0, 'Crawler Density': 100, 'Crawler Albino Density': 10, 'Tiny Crawler Density': 0, 'Medium Crawler Density': 0, 'Big Crawler Density': 0, 'Huge Crawler Density': 0, 'Ultra Crawler Density': 0, 'Stalker Density': 100, 'Stalker Omega Density': 0,
+                   'Bloat Density': 100, 'Husk Density': 100, 'Husk Omega Density': 0, 'Tiny Husk Density': 0, 'Siren Density': 100, 'Siren Omega Density': 0, 'E.D.A.R Trapper Density': 0, 'E.D.A.R Blaster Density': 0, 'E.D.A.R Bomber Density': 0,
+                   'Scrake Density': 100, 'Scrake Albino Density': 0, 'Scrake Omega Density': 0, 'Scrake Emperor Density': 0, 'Tiny Scrake Density': 0, 'Quarter Pound Density': 100, 'Quarter Pound Rage Density': 5, 'Fleshpound Density': 100, 'Fleshpound Albino Density': 0, 'Fleshpound Rage Density': 5, 'Fleshpound Omega Density': 0,
+                   'Hans Density': 0, 'Patriarch Density': 0, 'King Fleshpound Density': 0, 'Abomination Density': 0, 'Matriarch Density': 0, 'Abomination Spawn Density': 0},
+    'Boss Only': {'Game Length': 3, 'Min Squads': 15, 'Max Squads': 20, 'Squad Min Length': 1, 'Squad Max Length': 4, 'Albino Min Wave': 3, 'Large Min Wave': 4, 'SpawnRage Min Wave': 8, 'Boss Min Wave': 1,
+                  'Trash Density': 0, 'Medium Density': 0, 'Large Density': 0, 'Boss Density': 100,
+                  'Cyst Density': 100, 'Slasher Density': 100, 'Slasher Omega Density': 0, 'Alpha Clot Density': 100, 'Alpha Clot Albino Density': 10, 'Gorefast Density': 100, 'Gorefast Albino Density': 10, 'Gorefast Omega Density': 0, 'Crawler Density': 100, 'Crawler Albino Density': 10, 'Tiny Crawler Density': 0, 'Medium Crawler Density': 0, 'Big Crawler Density': 0, 'Huge Crawler Density': 0, 'Ultra Crawler Density': 0, 'Stalker Density': 100, 'Stalker Omega Density': 0,
+                  'Bloat Density': 100, 'Husk Density': 100, 'Husk Omega Density': 0, 'Tiny Husk Density': 0, 'Siren Density': 100, 'Siren Omega Density': 0, 'E.D.A.R Trapper Density': 0, 'E.D.A.R Blaster Density': 0, 'E.D.A.R Bomber Density': 0,
+                  'Scrake Density': 100, 'Scrake Albino Density': 0, 'Scrake Omega Density': 0, 'Scrake Emperor Density': 0, 'Tiny Scrake Density': 0, 'Quarter Pound Density': 100, 'Quarter Pound Rage Density': 5, 'Fleshpound Density': 100, 'Fleshpound Albino Density': 0, 'Fleshpound Rage Density': 5, 'Fleshpound Omega Density': 0,
+                  'Hans Density': 100, 'Patriarch Density': 100, 'King Fleshpound Density': 100, 'Abomination Density': 100, 'Matriarch Density': 100, 'Abomination Spawn Density': 100},
+    'Large-less': {'Game Length': 2, 'Min Squads': 15, 'Max Squads': 25, 'Squad Min Length': 5, 'Squad Max Length': 10, 'Albino Min Wave': 3, 'Large Min Wave': 7, 'SpawnRage Min Wave': 7, 'Boss Min Wave': 7,
+                   'Trash Density': 100, 'Medium Density': 100, 'Large Density': 0, 'Boss Density': 0,
+                   'Cyst Density': 100, 'Slasher Density': 100, 'Slasher Omega Density': 0, 'Alpha Clot Density': 100, 'Alpha Clot Albino Density': 30, 'Gorefast Density': 100, 'Gorefast Albino Density': 30, 'Gorefast Omega Density': 0, 'Crawler Density': 100, 'Crawler Albino Density': 30, 'Tiny Crawler Density': 0, 'Medium Crawler Density': 0, 'Big Crawler Density': 0, 'Huge Crawler Density': 0, 'Ultra Crawler Density': 0, 'Stalker Density': 100, 'Stalker Omega Density': 0,
+                   'Bloat Density': 100, 'Husk Density': 100, 'Husk Omega Density': 0, 'Tiny Husk Density': 0, 'Siren Density': 100, 'Siren Omega Density': 0, 'E.D.A.R Trapper Density': 0, 'E.D.A.R Blaster Density': 0, 'E.D.A.R Bomber Density': 0,
+                   'Scrake Density': 100, 'Scrake Albino Density': 0, 'Scrake Omega Density': 0, 'Scrake Emperor Density': 0, 'Tiny Scrake Density': 0, 'Quarter Pound Density': 100, 'Quarter Pound Rage Density': 10, 'Fleshpound Density': 100, 'Fleshpound Albino Density': 0, 'Fleshpound Rage Density': 10, 'Fleshpound Omega Density': 0,
+                   'Hans Density': 0, 'Patriarch Density': 0, 'King Fleshpound Density': 0, 'Abomination Density': 0, 'Matriarch Density': 0, 'Abomination Spawn Density': 0},
+    'Custom Craziness': {'Game Length': 3, 'Min Squads': 20, 'Max Squads': 30, 'Squad Min Length': 3, 'Squad Max Length': 6, 'Albino Min Wave': 2, 'Large Min Wave': 4, 'SpawnRage Min Wave': 7, 'Boss Min Wave': 7,
+                         'Trash Density': 100, 'Medium Density': 100, 'Large Density': 100, 'Boss Density': 50,
+                         'Cyst Density': 100, 'Slasher Density': 100, 'Slasher Omega Density': 0, 'Alpha Clot Density': 100, 'Alpha Clot Albino Density': 10, 'Gorefast Density': 100, 'Gorefast Albino Density': 10, 'Gorefast Omega Density': 0, 'Crawler Density': 100, 'Crawler Albino Density': 10, 'Tiny Crawler Density': 0, 'Medium Crawler Density': 0, 'Big Crawler Density': 0, 'Huge Crawler Density': 0, 'Ultra Crawler Density': 0, 'Stalker Density': 100, 'Stalker Omega Density': 0,
+                         'Bloat Density': 100, 'Husk Density': 100, 'Husk Omega Density': 0, 'Tiny Husk Density': 0, 'Siren Density': 100, 'Siren Omega Density': 0, 'E.D.A.R Trapper Density': 100, 'E.D.A.R Blaster Density': 100, 'E.D.A.R Bomber Density': 100,
+                         'Scrake Density': 100, 'Scrake Albino Density': 35, 'Scrake Omega Density': 0, 'Scrake Emperor Density': 0, 'Tiny Scrake Density': 0, 'Quarter Pound Density': 75, 'Quarter Pound Rage Density': 8, 'Fleshpound Density': 100, 'Fleshpound Albino Density': 35, 'Fleshpound Rage Density': 8, 'Fleshpound Omega Density': 0,
+                         'Hans Density': 100, 'Patriarch Density': 100, 'King Fleshpound Density': 100, 'Abomination Density': 100, 'Matriarch Density': 100, 'Abomination Spawn Density': 0},
+    'Boss Rush': {'Game Length': 1, 'Min Squads': 15, 'Max Squads': 20, 'Squad Min Length': 3, 'Squad Max Length': 6, 'Albino Min Wave': 2, 'Large Min Wave': 3, 'SpawnRage Min Wave': 4, 'Boss Min Wave': 2,
+                  'Trash Density': 10, 'Medium Density': 10, 'Large Density': 10, 'Boss Density': 100,
+                  'Cyst Density': 100, 'Slasher Density': 100, 'Slasher Omega Density': 0, 'Alpha Clot Density': 10, 'Alpha Clot Albino Density': 100, 'Gorefast Density': 100, 'Gorefast Albino Density': 100, 'Gorefast Omega Density': 0, 'Crawler Density': 10, 'Crawler Albino Density': 10, 'Tiny Crawler Density': 0, 'Medium Crawler Density': 0, 'Big Crawler Density': 0, 'Huge Crawler Density': 0, 'Ultra Crawler Density': 0, 'Stalker Density': 100, 'Stalker Omega Density': 0,
+                  'Bloat Density': 100, 'Husk Density': 100, 'Husk Omega Density': 0, 'Tiny Husk Density': 0, 'Siren Density': 100, 'Siren Omega Density': 0, 'E.D.A.R Trapper Density': 100, 'E.D.A.R Blaster Density': 100, 'E.D.A.R Bomber Density': 100,
+                  'Scrake Density': 100, 'Scrake Albino Density': 15, 'Scrake Omega Density': 0, 'Scrake Emperor Density': 0, 'Tiny Scrake Density': 0, 'Quarter Pound Density': 100, 'Quarter Pound Rage Density': 5, 'Fleshpound Density': 100, 'Fleshpound Albino Density': 15, 'Fleshpound Rage Density': 5, 'Fleshpound Omega Density': 0,
+                  'Hans Density': 100, 'Patriarch Density': 100, 'King Fleshpound Density': 100, 'Abomination Density': 100, 'Matriarch Density': 100, 'Abomination Spawn Density': 0},
+    'Omega Onslaught': {'Game Length': 3, 'Min Squads': 8, 'Max Squads': 15, 'Squad Min Length': 3, 'Squad Max Length': 7, 'Albino Min Wave': 3, 'Large Min Wave': 4, 'SpawnRage Min Wave': 10, 'Boss Min Wave': 10,
+                        'Trash Density': 100, 'Medium Density': 100, 'Large Density': 100, 'Boss Density': 0,
+                        'Cyst Density': 100, 'Slasher Density': 100, 'Slasher Omega Density': 75, 'Alpha Clot Density': 100, 'Alpha Clot Albino Density': 10, 'Gorefast Density': 100, 'Gorefast Albino Density': 10, 'Gorefast Omega Density': 75, 'Crawler Density': 100, 'Crawler Albino Density': 10, 'Tiny Crawler Density': 20, 'Medium Crawler Density': 20, 'Big Crawler Density': 20, 'Huge Crawler Density': 5, 'Ultra Crawler Density': 5, 'Stalker Density': 100, 'Stalker Omega Density': 75,
+                        'Bloat Density': 100, 'Husk Density': 100, 'Husk Omega Density': 75, 'Tiny Husk Density': 15, 'Siren Density': 100, 'Siren Omega Density': 75, 'E.D.A.R Trapper Density': 0, 'E.D.A.R Blaster Density': 0, 'E.D.A.R Bomber Density': 0,
+                        'Scrake Density': 100, 'Scrake Albino Density': 0, 'Scrake Omega Density': 15, 'Scrake Emperor Density': 5, 'Tiny Scrake Density': 15, 'Quarter Pound Density': 100, 'Quarter Pound Rage Density': 0, 'Fleshpound Density': 100, 'Fleshpound Albino Density': 0, 'Fleshpound Rage Density': 0, 'Fleshpound Omega Density': 60,
+                        'Hans Density': 0, 'Patriarch Density': 0, 'King Fleshpound Density': 0, 'Abomination Density': 0, 'Matriarch Density': 0, 'Abomination Spawn Density': 0},
+    'Default': {'Game Length': 3, 'Min Squads': 8, 'Max Squads': 15, 'Squad Min Length': 3, 'Squad Max Length': 7, 'Albino Min Wave': 3, 'Large Min Wave': 4, 'SpawnRage Min Wave': 7, 'Boss Min Wave': 7,
+                'Trash Density': 100, 'Medium Density': 100, 'Large Density': 100, 'Boss Density': 0,
+                'Cyst Density': 100, 'Slasher Density': 100, 'Slasher Omega Density': 0, 'Alpha Clot Density': 100, 'Alpha Clot Albino Density': 30, 'Gorefast Density': 100, 'Gorefast Albino Density': 30, 'Gorefast Omega Density': 0, 'Crawler Density': 100, 'Crawler Albino Density': 30, 'Tiny Crawler Density': 0, 'Medium Crawler Density': 0, 'Big Crawler Density': 0, 'Huge Crawler Density': 0, 'Ultra Crawler Density': 0, 'Stalker Density': 100, 'Stalker Omega Density': 0,
+                'Bloat Density': 100, 'Husk Density': 100, 'Husk Omega Density': 0, 'Tiny Husk Density': 0, 'Siren Density': 100, 'Siren Omega Density': 0, 'E.D.A.R Trapper Density': 0, 'E.D.A.R Blaster Density': 0, 'E.D.A.R Bomber Density': 0,
+                'Scrake Density': 100, 'Scrake Albino Density': 0, 'Scrake Omega Density': 0, 'Scrake Emperor Density': 0, 'Tiny Scrake Density': 0, 'Quarter Pound Density': 100, 'Quarter Pound Rage Density': 10, 'Fleshpound Density': 100, 'Fleshpound Albino Density': 0, 'Fleshpound Rage Density': 10, 'Fleshpound Omega Density': 0,
+                'Hans Density': 0, 'Patriarch Density': 0, 'King Fleshpound Density': 100, 'Abomination Density': 0, 'Matriarch Density': 0, 'Abomination Spawn Density': 100}}
+
+# Built-in presets that use the Custom ZED set
+_builtin_custom = ['Boss Rush', 'Custom Craziness', 'Boss Only', 'Android Annihilation', 'Omega Onslaught']
+
+# Descriptions of the built-in presets, shown in the Presets menu
+_builtin_descriptions = {'Light': 'Predominantly Trash ZEDs',
+                         'Moderate': 'Decent mixture of Trash and Large ZEDs',
+                         'Heavy': 'Predominantly Large ZEDs',
+                         'Albino': 'Predominantly Albino ZEDs',
+                         'Poundemonium': 'Predominantly Larges, spawning earlier in the cycle',
+                         'GSO': 'Almost all Fleshpounds, spawning very early in the cycle',
+                         'Min Settings': 'All settings are at their minimum values',
+                         'Max Settings': 'All settings are at their maximum values',
+                         'Putrid Pollution': 'Predominantly Bloats',
+                         'Sonic Subversion': 'Predominantly Sirens',
+                         'Android Annihilation': 'Predominantly E.D.A.Rs',
+                         'Arachnophobia': 'Predominantly Crawlers',
+                         'Cloaked Carnage': 'Predominantly Stalkers',
+                         'Hellish Inferno': 'Predominantly Husks',
+                         'Trash Only': 'Only Trash ZEDs spawn',
+                         'Medium Only': 'Only Medium ZEDs spawn',
+                         'Large Only': 'Only Large ZEDs spawn',
+                         'Boss Only': 'Only Bosses spawn',
+                         'Large-less': 'No Large ZEDs or Bosses at all',
+                         'Custom Craziness': 'Predominantly Custom ZEDs',
+                         'Boss Rush': 'Predominantly Bosses',
+                         'Omega Onslaught': 'Predominantly Omega ZEDs',
+                         'Default': 'The default Generator settings'}
+
+_compiled = OrderedDict() # Slider values -> compiled ZEDSampler. See get_sampler
+
+
+# Returns the number of waves for the given position of the SpawnCycle Length slider
+def get_num_waves(game_length):
+    if game_length == 3:
+        return 10
+    elif game_length == 2:
+        return 7
+    return 4
+
+
+# Returns the given slider values (by name, as slider positions) as slider data, in the same form as GenerateDialog.get_slider_values
+def get_slider_data(sliders):
+    slider_data = {key: sliders[key] for key in slider_keys}
+    slider_data['Game Length'] = get_num_waves(slider_data['Game Length'])
+
+    # The Min Wave sliders can't go past the last wave
+    for key in ['Albino Min Wave', 'Large Min Wave', 'SpawnRage Min Wave', 'Boss Min Wave']:
+        slider_data[key] = min(slider_data[key], slider_data['Game Length'])
+
+    return slider_data
+
+
+# Returns the compiled ZEDSampler for the given slider data
+# Samplers are cached by their slider values, so generating from a preset (or from the same settings as last time) doesn't compile anything
+def get_sampler(slider_data):
+    key = tuple([slider_data[k] for k in slider_keys])
+    if key in _compiled:
+        _compiled.move_to_end(key) # Mark as most recently used
+        return _compiled[key]
+
+    zed_sampler = sampler.ZEDSampler(slider_data)
+    _compiled[key] = zed_sampler
+    while len(_compiled) > _COMPILED_CACHE_SIZE + len(presets):
+        _compiled.popitem(last=False)
+    return zed_sampler
+
+
+# Returns a list of problems with the given slider values (by name, as slider positions). Empty if they're okay
+def validate_sliders(sliders):
+    errors = []
+    for key in sliders:
+        if key not in slider_ranges:
+            errors.append(f"- Unknown slider '{key}'")
+
+    for key in slider_keys:
+        if key not in sliders:
+            errors.append(f"- Missing slider '{key}'")
+            continue
+        value = sliders[key]
+        (min_value, max_value) = slider_ranges[key]
+        if not isinstance(value, int) or isinstance(value, bool):
+            errors.append(f"- {key} must be a whole number (got {value!r})")
+        elif value < min_value or value > max_value:
+            errors.append(f"- {key} must be between {min_value} and {max_value} (got {value})")
+
+    # The Generator picks a value between each of these pairs, so the lower end can't be above the upper end
+    for (min_key, max_key) in [('Min Squads', 'Max Squads'), ('Squad Min Length', 'Squad Max Length')]:
+        (min_value, max_value) = (sliders.get(min_key), sliders.get(max_key))
+        if not all([isinstance(v, int) and not isinstance(v, bool) for v in [min_value, max_value]]):
+            continue # Already reported above
+        if min_value > max_value:
+            errors.append(f"- {min_key} ({min_value}) can't be more than {max_key} ({max_value})")
+
+    return errors
+
+
+# A Generator preset
+# Sliders are stored by name (as slider positions, same as the dialog), so they don't depend on the order the sliders are laid out in
+# The slider data and sampler tables the Generator needs are worked out once, when the preset is created
+# With validate off the sliders are taken as-is. Only for slider positions straight from the Generate dialog, which reports its own problems
+class Preset(object):
+    def __init__(self, name, sliders, zed_set='Default', description=None, validate=True):
+        errors = validate_sliders(sliders) if validate else []
+        if zed_set not in ['Default', 'Custom']:
+            errors.append(f"- Unknown ZED Set '{zed_set}'")
+        if len(errors) > 0:
+            raise ValueError(f"Invalid preset '{name}':\n" + '\n'.join(errors))
+
+        self.name = name
+        self.sliders = {key: sliders[key] for key in slider_keys} # Same order as slider_keys, so the SpawnCycle Length is always applied first
+        self.zed_set = zed_set
+        self.description = description if description is not None else name
+        self.slider_data = get_slider_data(self.sliders)
+        self.sampler = get_sampler(self.slider_data)
+
+
+# Loads the user-defined presets from the JSON files in the given directory, adding them to the registry
+# Each file holds one preset of the form {"Name": "My Preset", "Description": "..", "ZED Set": "Default", "Sliders": {"Trash Density": 50, ..}}
+# Sliders that aren't given are taken from the Default preset
+# Returns a list of problems with any files that couldn't be loaded
+def load_user_presets(path=_PATH_USER_PRESETS):
+    errors = []
+    if not os.path.isdir(path):
+        return errors
+
+    loaded = {} # Name -> file it was loaded from
+    for filename in sorted(os.listdir(path)):
+        if not filename.lower().endswith('.json'):
+            continue
+        try:
+            with open(os.path.join(path, filename), 'r') as f_in:
+                data = json.load(f_in)
+            name = data['Name']
+            if not isinstance(name, str) or len(name.strip()) == 0:
+                raise ValueError(f"Name must be a non-empty string (got {name!r})")
+            if name in _builtin_values:
+                raise ValueError(f"There is already a built-in preset named '{name}'")
+            if name in loaded:
+                raise ValueError(f"There is already a user preset named '{name}' (in {loaded[name]})")
+            if not isinstance(data.get('Description', ''), str):
+                raise ValueError(f"Description must be a string (got {data['Description']!r})")
+            sliders = dict(presets['Default'].sliders)
+            sliders.update(data.get('Sliders', {}))
+            presets[name] = Preset(name, sliders, zed_set=data.get('ZED Set', 'Default'), description=data.get('Description'))
+            loaded.update({name: filename})
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            errors.append(f"{filename}: {e}")
+
+    return errors
+
+
+# Returns the slider data for the given preset, in the same form as GenerateDialog.get_slider_values
+def get_slider_values(preset):
+    return dict(presets[preset].slider_data)
+
+
+# Returns the name of the preset with exactly the given slider data, or None if it doesn't match any of them
+def find_preset(slider_data):
+    for (name, preset) in presets.items():
+        if all([slider_data.get(key) == preset.slider_data[key] for key in slider_keys]):
+            return name
+    return None
+
+
+# Build the preset registry. Built-in presets have to be valid, so a bad one stops the program right away
+presets = OrderedDict() # Name -> Preset
+for (name, sliders) in _builtin_values.items():
+    presets[name] = Preset(name, sliders, zed_set=('Custom' if name in _builtin_custom else 'Default'), description=_builtin_descriptions[name])
+user_preset_errors = load_user_presets() # Problems with user-defined presets don't stop the program. They're shown in the Generate dialog instead
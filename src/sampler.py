@@ -0,0 +1,180 @@
+#
+#  sampler.py
+#
+#  Author: Tamari
+#  Date of creation: 10/18/2026
+#
+#  Weighted ZED sampling for the generator
+#
+
+
+##  LICENSE INFORMATION
+##  =======================================================================
+##  This program is free software: you can redistribute it and/or modify
+##  it under the terms of the GNU General Public License as published by
+##  the Free Software Foundation, either version 3 of the License, or
+##  (at your option) any later version.
+##
+##  This program is distributed in the hope that it will be useful,
+##  but WITHOUT ANY WARRANTY; without even the implied warranty of
+##  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+##  GNU General Public License for more details.
+##
+##  You should have received a copy of the GNU General Public License
+##  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+##  =======================================================================
+##
+##  © Tamari 2020-2022
+##  All rights reserved.
+
+
+import random
+
+# The ZED classes the generator picks from, and the slider controlling each class' density
+categories = [('Trash', 'Trash Density'), ('Medium', 'Medium Density'), ('Large', 'Large Density'), ('Boss', 'Boss Density')]
+
+# The ZEDs in each class, and the slider controlling each ZED's density
+category_zeds = {'Trash': [('Cyst', 'Cyst Density'), ('Slasher', 'Slasher Density'), ('Alpha Clot', 'Alpha Clot Density'), ('Gorefast', 'Gorefast Density'),
+                           ('Crawler', 'Crawler Density'), ('Stalker', 'Stalker Density'), ('Slasher Omega', 'Slasher Omega Density'),
+                           ('Gorefast Omega', 'Gorefast Omega Density'), ('Tiny Crawler', 'Tiny Crawler Density'), ('Medium Crawler', 'Medium Crawler Density'),
+                           ('Big Crawler', 'Big Crawler Density'), ('Huge Crawler', 'Huge Crawler Density'), ('Ultra Crawler', 'Ultra Crawler Density'),
+                           ('Stalker Omega', 'Stalker Omega Density')],
+                 'Medium': [('Bloat', 'Bloat Density'), ('Husk', 'Husk Density'), ('Siren', 'Siren Density'), ('E.D.A.R Trapper', 'E.D.A.R Trapper Density'),
+                            ('E.D.A.R Blaster', 'E.D.A.R Blaster Density'), ('E.D.A.R Bomber', 'E.D.A.R Bomber Density'), ('Husk Omega', 'Husk Omega Density'),
+                            ('Tiny Husk', 'Tiny Husk Density'), ('Siren Omega', 'Siren Omega Density')],
+                 'Large': [('Scrake', 'Scrake Density'), ('Quarter Pound', 'Quarter Pound Density'), ('Fleshpound', 'Fleshpound Density'),
+                           ('Scrake Omega', 'Scrake Omega Density'), ('Scrake Emperor', 'Scrake Emperor Density'), ('Tiny Scrake', 'Tiny Scrake Density'),
+                           ('Fleshpound Omega', 'Fleshpound Omega Density')],
+                 'Boss': [('Dr. Hans Volter', 'Hans Density'), ('Patriarch', 'Patriarch Density'), ('King Fleshpound', 'King Fleshpound Density'),
+                          ('Abomination', 'Abomination Density'), ('Matriarch', 'Matriarch Density'), ('Abomination Spawn', 'Abomination Spawn Density')]}
+
+# ZED -> (Albino version, slider controlling the chance to turn albino)
+albino_variants = {'Alpha Clot': ('Rioter', 'Alpha Clot Albino Density'),
+                   'Gorefast': ('Gorefiend', 'Gorefast Albino Density'),
+                   'Crawler': ('Elite Crawler', 'Crawler Albino Density'),
+                   'Scrake': ('Alpha Scrake', 'Scrake Albino Density'),
+                   'Fleshpound': ('Alpha Fleshpound', 'Fleshpound Albino Density')}
+
+# ZED -> slider controlling the chance to SpawnRage. Checked after the albino roll
+rage_densities = {'Quarter Pound': 'Quarter Pound Rage Density',
+                  'Fleshpound': 'Fleshpound Rage Density',
+                  'Alpha Fleshpound': 'Fleshpound Rage Density'}
+
+
+# Walker alias table for drawing from a fixed weighted list in O(1)
+# Built with Vose's method. Draws follow the same distribution as random.choices(items, weights=weights)
+class AliasTable(object):
+    def __init__(self, items, weights):
+        self.items = list(items)
+        self.size = len(self.items)
+        self.prob = [1.0] * self.size
+        self.alias = list(range(self.size))
+
+        total = float(sum(weights))
+        self.empty = (total <= 0) # Nothing can be drawn
+        if self.empty:
+            return
+
+        # Scale the weights so the average is 1, then pair each under-full slot with an over-full one
+        scaled = [w * self.size / total for w in weights]
+        small = [i for (i, p) in enumerate(scaled) if p < 1.0]
+        large = [i for (i, p) in enumerate(scaled) if p >= 1.0]
+        while small and large:
+            s = small.pop()
+            l = large.pop()
+            self.prob[s] = scaled[s]
+            self.alias[s] = l
+            scaled[l] = (scaled[l] + scaled[s]) - 1.0
+            if scaled[l] < 1.0:
+                small.append(l)
+            else:
+                large.append(l)
+
+        # Whatever's left over is full (up to rounding error)
+        for i in small + large:
+            self.prob[i] = 1.0
+
+    # Returns a random item
+    def draw(self, rng=random):
+        if self.empty:
+            raise ValueError('Total of weights must be greater than zero')
+        i = int(rng.random() * self.size)
+        if rng.random() < self.prob[i]:
+            return self.items[i]
+        return self.items[self.alias[i]]
+
+
+# Draws ZEDs according to the Generator's slider data
+# Everything that depends on the sliders is compiled once up front, so each draw is O(1)
+class ZEDSampler(object):
+    def __init__(self, slider_data, rng=random):
+        sd = slider_data
+        self.rng = rng
+        self.min_waves = {'Large': sd['Large Min Wave'], 'Boss': sd['Boss Min Wave'], 'Albino': sd['Albino Min Wave'], 'SpawnRage': sd['SpawnRage Min Wave']}
+        self.category_weights = {category: sd[key] for (category, key) in categories}
+
+        # One class table per combination of Larges / Bosses being allowed
+        # Leaving a class out is the same as re-rolling whenever it's picked, but only ever needs one draw
+        self.category_tables = {}
+        for larges_allowed in [False, True]:
+            for bosses_allowed in [False, True]:
+                allowed = {'Trash': True, 'Medium': True, 'Large': larges_allowed, 'Boss': bosses_allowed}
+                weights = [self.category_weights[category] if allowed[category] else 0 for (category, _) in categories]
+                self.category_tables.update({(larges_allowed, bosses_allowed): AliasTable([category for (category, _) in categories], weights)})
+
+        # The class table used on each wave
+        self.wave_tables = [self.get_category_table(i+1) for i in range(sd['Game Length'])]
+
+        # One ZED table per class
+        self.zed_tables = {}
+        for (category, zed_list) in category_zeds.items():
+            self.zed_tables.update({category: AliasTable([zed_id for (zed_id, _) in zed_list], [sd[key] for (_, key) in zed_list])})
+
+        # Albino and SpawnRage chances. The sliders are percentages
+        self.albino_chances = {zed_id: (albino_id, sd[key] / 100.0) for (zed_id, (albino_id, key)) in albino_variants.items()}
+        self.rage_chances = {zed_id: sd[key] / 100.0 for (zed_id, key) in rage_densities.items()}
+
+    # Returns the class table for the given wave (starting at 1)
+    def get_category_table(self, wave_num):
+        larges_allowed = (wave_num >= self.min_waves['Large'])
+        bosses_allowed = (wave_num >= self.min_waves['Boss'])
+        return self.category_tables[(larges_allowed, bosses_allowed)]
+
+    # Returns the waves (starting at 1) where nothing can be drawn because every class allowed on them has 0% Density
+    def get_impossible_waves(self):
+        return [i+1 for (i, table) in enumerate(self.wave_tables) if table.empty]
+
+    # Returns the classes that can be drawn but don't have any ZEDs with a non-zero Density
+    def get_empty_categories(self):
+        return [category for (category, key) in categories if self.category_weights[category] > 0 and self.zed_tables[category].empty]
+
+    # Returns a random ZED for the given wave (starting at 1) as (ZED ID, class, albino, spawnraged)
+    # The ZED ID of a SpawnRaged ZED is its ' (Enraged)' version. Uses the given random stream if there is one
+    def draw(self, wave_num, rng=None):
+        if rng is None:
+            rng = self.rng
+        category = self.wave_tables[wave_num-1].draw(rng)
+        zed_id = self.zed_tables[category].draw(rng)
+        (zed_id, albino, spawnrage) = self.roll_variants(zed_id, wave_num, rng)
+        return zed_id, category, albino, spawnrage
+
+    # Rolls the albino and SpawnRage chances of the given ZED for the given wave (starting at 1)
+    # Returns (ZED ID, albino, spawnraged). Rolls that would turn the ZED into one in excluded are ignored
+    def roll_variants(self, zed_id, wave_num, rng, excluded=()):
+        albino = False
+        spawnrage = False
+
+        # Account for albinos
+        if zed_id in self.albino_chances and wave_num >= self.min_waves['Albino']:
+            (albino_id, chance) = self.albino_chances[zed_id]
+            if rng.random() < chance and albino_id not in excluded:
+                zed_id = albino_id
+                albino = True
+
+        # Account for spawnrage
+        if zed_id in self.rage_chances and wave_num >= self.min_waves['SpawnRage']:
+            if rng.random() < self.rage_chances[zed_id] and f"{zed_id} (Enraged)" not in excluded:
+                zed_id += ' (Enraged)'
+                spawnrage = True
+
+        return zed_id, albino, spawnrage
@@ -0,0 +1,212 @@
+#
+#  search.py
+#
+#  Author: Tamari
+#  Date of creation: 10/18/2026
+#
+#  Headless generate-and-select search for the 'Generate' functionality.
+#  Generates lots of candidate SpawnCycles, analyzes each one and keeps the best ones that meet the given targets.
+#  Does not depend on PyQt5, so the candidates can be scored in worker processes
+#
+
+
+##  LICENSE INFORMATION
+##  =======================================================================
+##  This program is free software: you can redistribute it and/or modify
+##  it under the terms of the GNU General Public License as published by
+##  the Free Software Foundation, either version 3 of the License, or
+##  (at your option) any later version.
+##
+##  This program is distributed in the hope that it will be useful,
+##  but WITHOUT ANY WARRANTY; without even the implied warranty of
+##  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+##  GNU General Public License for more details.
+##
+##  You should have received a copy of the GNU General Public License
+##  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+##  =======================================================================
+##
+##  © Tamari 2020-2022
+##  All rights reserved.
+
+
+import multiprocessing
+import bisect
+import random
+import generator
+import presets
+import simulate
+
+_CHUNK_SIZE = 16 # Number of candidates handed to a worker process at once
+_worker_state = {} # Per-process engines, set up once by init_worker so they aren't rebuilt for every candidate
+
+
+# Returns the analysis GameLength index (0 = Short, 1 = Medium, 2 = Long) for the given number of waves
+def get_gamelength_index(num_waves):
+    return [4, 7, 10].index(num_waves)
+
+
+# Scores the analysis results of one candidate against the given targets
+# Targets is a dict with any of the following (missing or None means no constraint):
+#   'Difficulty': (min, max) band the average difficulty of every wave must fall within. Can also be a list with one band (or None) per wave
+#                 Either side of a band can be None for no limit on that side
+#   'Large Share': (min %, max %) band the share of Large ZEDs across the whole SpawnCycle must fall within
+#   'No Boss Before': first wave (starting at 1) that's allowed to have Bosses
+# Returns (violation, distance). Violation is 0.0 if every target is met and grows the further off the candidate is
+# Distance is how far the candidate is from the centre of its bands, used to rank candidates that meet every target
+def score_results(results, targets):
+    violation = 0.0
+    distance = 0.0
+    num_bands = 0
+    num_waves = len([w for w in results['Waves'] if w is not None])
+
+    # Check difficulty. Band widths are used to scale things so the targets are comparable to each other
+    difficulty_band = targets.get('Difficulty')
+    if difficulty_band is not None:
+        if isinstance(difficulty_band, tuple): # Same band for every wave
+            difficulty_band = [difficulty_band for i in range(num_waves)]
+        for (wave_num, avg_difficulty) in results['Average Difficulty'][1:num_waves+1]:
+            if wave_num > len(difficulty_band) or difficulty_band[wave_num-1] is None:
+                continue
+            (band_min, band_max) = difficulty_band[wave_num-1]
+            (v, d) = score_band(avg_difficulty, band_min, band_max)
+            violation += v
+            if d is not None:
+                distance += d
+                num_bands += 1
+
+    # Check large share
+    large_band = targets.get('Large Share')
+    if large_band is not None:
+        (v, d) = score_band(get_large_share(results), large_band[0], large_band[1])
+        violation += v
+        if d is not None:
+            distance += d
+            num_bands += 1
+
+    # Check bosses. Every early Boss counts as a full violation
+    no_boss_before = targets.get('No Boss Before')
+    if no_boss_before is not None:
+        for wave_stats in results['Waves'][:min(no_boss_before-1, num_waves)]:
+            violation += wave_stats['Category']['Boss']
+
+    return violation, (distance / num_bands if num_bands > 0 else 0.0)
+
+
+# Returns (violation, distance) of the given value for the given band, both scaled by the width of the band
+# Either side of the band can be None (no limit). Open bands have no centre, so their distance is None
+# and the violation is scaled by the limit that was missed instead
+def score_band(value, band_min, band_max):
+    width = max(float(band_max - band_min), 1.0) if band_min is not None and band_max is not None else None
+    if band_min is not None and value < band_min:
+        violation = (band_min - value) / (width if width is not None else max(abs(band_min), 1.0))
+    elif band_max is not None and value > band_max:
+        violation = (value - band_max) / (width if width is not None else max(abs(band_max), 1.0))
+    else:
+        violation = 0.0
+
+    if width is None:
+        return violation, None
+    return violation, abs(value - (band_min + band_max) / 2.0) / width
+
+
+# Returns the percentage of ZEDs in the analysis results that are Large
+def get_large_share(results):
+    merged = results['Merged']
+    if merged['Total'] == 0:
+        return 0.0
+    return 100.0 * merged['Category']['Large'] / merged['Total']
+
+
+# Sets up the engines used by evaluate_seed. Called once in each worker process
+def init_worker(slider_data, params, targets):
+    _worker_state.update({'Engine': generator.GenerationEngine(slider_data), 'Params': params, 'Targets': targets})
+
+
+# Generates and analyzes the SpawnCycle with the given seed using the engines set up by init_worker
+# Only the scores and a summary are sent back. The waves themselves can be regenerated from the seed
+def evaluate_seed(seed):
+    (waves, stats) = _worker_state['Engine'].generate(seed)
+    params = _worker_state['Params']
+    engine = simulate.AnalysisEngine(waves, get_gamelength_index(len(waves)), params['Difficulty'], params['WaveSizeFakes'], params['MaxMonsters'], vectorized=simulate.np is not None)
+    results = engine.run()
+    (violation, distance) = score_results(results, _worker_state['Targets'])
+    avg_difficulty = [y for (_, y) in results['Average Difficulty'][1:len(waves)+1]]
+
+    return {'Seed': seed,
+            'Violation': violation,
+            'Score': distance,
+            'Average Difficulty': sum(avg_difficulty) / len(avg_difficulty),
+            'Large Share': get_large_share(results),
+            'Stats': stats}
+
+
+# Searches for SpawnCycles that meet the given targets
+# Generates num_candidates SpawnCycles from the slider data (or preset name), analyzes each of them with the given
+# analysis params ({'Difficulty', 'WaveSizeFakes', 'MaxMonsters'}, same as the Analyze dialog) and keeps the top_k
+# candidates that meet every target (see score_results), best first
+# The candidate seeds are drawn from the search seed, so the same search seed always checks the same candidates
+class CandidateSearch(object):
+    def __init__(self, slider_data, num_candidates, top_k, targets, params, processes=None, seed=None):
+        if isinstance(slider_data, str): # Preset name
+            slider_data = presets.get_slider_values(slider_data)
+        self.slider_data = slider_data
+        self.num_candidates = num_candidates
+        self.top_k = top_k
+        self.targets = targets
+        self.params = params
+        self.processes = processes if processes is not None else multiprocessing.cpu_count()
+        self.seed = seed if seed is not None else generator.new_seed()
+        self.ranked = [] # Best candidates found so far, best first
+        self.num_evaluated = 0
+        self.num_matched = 0
+        self.cancelled = False
+
+    # Stops a search that's in progress (ie: from another thread). The search returns what it's found so far once it notices
+    def cancel(self):
+        self.cancelled = True
+
+    # Returns the seeds of every candidate in this search
+    def get_candidate_seeds(self):
+        seed_random = random.Random(self.seed)
+        return [seed_random.randint(0, generator.SEED_MAX) for i in range(self.num_candidates)]
+
+    # Runs the search, returning the ranked candidates
+    # If given, progress is called with (candidates done, total candidates) after each candidate,
+    # and ranked is called with the new ranked list whenever it changes
+    def run(self, progress=None, ranked=None):
+        seeds = self.get_candidate_seeds()
+        initargs = (self.slider_data, self.params, self.targets)
+
+        if self.processes <= 1: # No pool needed
+            init_worker(*initargs)
+            self.collect(map(evaluate_seed, seeds), seeds, progress, ranked)
+        else:
+            with multiprocessing.Pool(self.processes, initializer=init_worker, initargs=initargs) as pool: # Exiting the pool terminates any workers still going
+                self.collect(pool.imap_unordered(evaluate_seed, seeds, chunksize=_CHUNK_SIZE), seeds, progress, ranked)
+
+        return self.ranked
+
+    # Ranks candidates as they come in from the workers
+    def collect(self, candidates, seeds, progress, ranked):
+        keys = [] # Sort keys of the ranked list. Ties go to the candidate that came first in the search
+        order = {seed: i for (i, seed) in enumerate(seeds)}
+        for candidate in candidates:
+            if self.cancelled:
+                return
+
+            self.num_evaluated += 1
+            if candidate['Violation'] == 0.0: # Meets every target
+                self.num_matched += 1
+                key = (candidate['Score'], order[candidate['Seed']])
+                if len(keys) < self.top_k or key < keys[-1]:
+                    i = bisect.bisect(keys, key)
+                    keys.insert(i, key)
+                    self.ranked.insert(i, candidate)
+                    del keys[self.top_k:]
+                    del self.ranked[self.top_k:]
+                    if ranked is not None:
+                        ranked(list(self.ranked))
+
+            if progress is not None:
+                progress(self.num_evaluated, self.num_candidates)
@@ -47,7 +47,8 @@ setting_tooltips = {'should_warn_zedset': 'Display a warning when changing to a
                     'save_json_default_target': 'For JSON SpawnCycles only.\nSets the default GameLength that SpawnCycler will save data into when manually saving:\n\nAlways Ask  -  Always ask for confirmation whenever multiple destinations are available.\nAdaptive  -  Assign the SpawnCycle to the closest compatible GameLength.\nPreferred Medium  -  Attempt to assign the SpawnCycle to the Medium GameLength. Defaults to Adaptive if this is not possible for any reason.\nPreferred Long  -  Attempt to assign the SpawnCycle to the Long GameLength. Defaults to Adaptive if this is not possible for any reason.\n\nNote that for Autosaving, SpawnCycler attempts to assign the SpawnCycle to the last opened or saved to slot, and uses the Adaptive setting if this is not possible.',
                     'save_default_filetype': 'Sets the default filetype that SpawnCycler uses when opening the Save or Save As menus:\n\nAdaptive  -  Use the currently opened filetype.\nStandard  -  The Standard (.txt) format used by most builds of CD.\nCustom  -  The Custom (.json) format used by Forrest Mark X\'s CD Build.',
                     'new_squad_min_amount': 'Sets the minimum amount of ZEDs added when creating a new squad.',
-                    'analyze_default_length': 'Sets the default GameLength that the Analyze tool will use for sampling:\n\nLast Used  -  Sample using the previously used GameLength. Uses \'Preferred Long\' when opening the Analyzer for the first time.\nAdaptive  -  Sample using the closest GameLength to the current amount of waves in the SpawnCycle\nPreferred Short  -  Sample using the Short GameLength if available. Defaults to Adaptive if this is not possible for any reason.\nPreferred Medium  -  Sample using the Medium GameLength if available. Defaults to Adaptive if this is not possible for any reason.\nPreferred Long  -  Sample using the Long GameLength if available. Defaults to Adaptive if this is not possible for any reason.'}
+                    'analyze_default_length': 'Sets the default GameLength that the Analyze tool will use for sampling:\n\nLast Used  -  Sample using the previously used GameLength. Uses \'Preferred Long\' when opening the Analyzer for the first time.\nAdaptive  -  Sample using the closest GameLength to the current amount of waves in the SpawnCycle\nPreferred Short  -  Sample using the Short GameLength if available. Defaults to Adaptive if this is not possible for any reason.\nPreferred Medium  -  Sample using the Medium GameLength if available. Defaults to Adaptive if this is not possible for any reason.\nPreferred Long  -  Sample using the Long GameLength if available. Defaults to Adaptive if this is not possible for any reason.',
+                    'analyze_vectorized': 'Use NumPy to speed up the difficulty calculations of the Analyze tool.\nResults are identical either way.\n\nHas no effect if NumPy is not installed.'}
 
 setting_nicenames = {'should_warn_zedset': 'Warn when using custom ZED sets',
                       'should_warn_gensettings': 'Warn when using custom Generator settings',
@@ -58,7 +59,8 @@ setting_nicenames = {'should_warn_zedset': 'Warn when using custom ZED sets',
                       'save_json_default_target': 'Default JSON Manual Save Length',
                       'save_default_filetype': 'Default Manual Save Filetype',
                       'new_squad_min_amount': 'New Squad Minimum ZED Amount',
-                      'analyze_default_length': 'Default Analyze Sample GameLength'}
+                      'analyze_default_length': 'Default Analyze Sample GameLength',
+                      'analyze_vectorized': 'Vectorized Analysis'}
 
 setting_nicenames_dropdown = {'save_json_default_target': ['Always Ask', 'Adaptive', 'Preferred Medium', 'Preferred Long'],
                               'save_default_filetype': ['Adaptive', 'Standard (.txt)', 'Custom (.json)'],
@@ -290,6 +292,10 @@ class SettingsDialog(object):
         analyze_default_length_frame, analyze_default_length_children = self.create_choice_field(f"{setting_nicenames['analyze_default_length']}   ", setting_nicenames_dropdown['analyze_default_length'], 'analyze_default_length', setting_tooltips['analyze_default_length'])
         analyze_default_length_children['ComboBox'].activated.connect(partial(self.commit_combobox, analyze_default_length_children['ComboBox'], 'analyze_default_length', None))
 
+        # Set up vectorized analysis
+        analyze_vectorized_frame, analyze_vectorized_children = self.create_checkbox_field(f"{setting_nicenames['analyze_vectorized']}   ", 'analyze_vectorized', setting_tooltips['analyze_vectorized'])
+        analyze_vectorized_children['Checkbox'].toggled.connect(partial(self.commit_checkbox, analyze_vectorized_children['Checkbox'], 'analyze_vectorized'))
+
         # Add to central layout
         self.scrollarea_layout.addWidget(general_settings_label)
         self.scrollarea_layout.addWidget(should_warn_zedset_frame)
@@ -302,6 +308,7 @@ class SettingsDialog(object):
         self.scrollarea_layout.addWidget(save_default_filetype_frame)
         self.scrollarea_layout.addWidget(new_squad_min_amount_frame)
         self.scrollarea_layout.addWidget(analyze_default_length_frame)
+        self.scrollarea_layout.addWidget(analyze_vectorized_frame)
 
     def setupUi(self, Dialog):
         # Set up main window
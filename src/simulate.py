@@ -0,0 +1,455 @@
+#
+#  simulate.py
+#
+#  Author: Tamari
+#  Date of creation: 10/18/2026
+#
+#  Headless simulation code for the 'Analyze' functionality.
+#  Does not depend on PyQt5, so it can be used from worker processes and batch jobs
+#
+
+
+##  LICENSE INFORMATION
+##  =======================================================================
+##  This program is free software: you can redistribute it and/or modify
+##  it under the terms of the GNU General Public License as published by
+##  the Free Software Foundation, either version 3 of the License, or
+##  (at your option) any later version.
+##
+##  This program is distributed in the hope that it will be useful,
+##  but WITHOUT ANY WARRANTY; without even the implied warranty of
+##  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+##  GNU General Public License for more details.
+##
+##  You should have received a copy of the GNU General Public License
+##  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+##  =======================================================================
+##
+##  © Tamari 2020-2022
+##  All rights reserved.
+
+
+from collections import deque, OrderedDict
+import threading
+import csv
+import zeds
+
+try: # NumPy is optional. It's only used to speed up the difficulty calculations
+    import numpy as np
+except ImportError:
+    np = None
+
+_WAVESIZE_DELTA = 0.2115384615384615 # The percentage each wave increases by for every +1 WSF
+_CACHE_SIZE = 256 # Max number of wave results kept by an AnalysisCache
+
+
+# Bounded LRU cache of per-wave analysis results
+# Keys are built by AnalysisEngine.get_cache_key, values are the (wave_stats, difficulty_data) from sample_wave
+# Cached results are shared between runs, so they must be treated as read-only
+# Safe to use from multiple workers at once
+class AnalysisCache(object):
+    def __init__(self, max_size=_CACHE_SIZE):
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.lock = threading.Lock()
+
+    # Returns the cached result for the given key, or None if there isn't one
+    def get(self, key):
+        with self.lock:
+            if key not in self.entries:
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key) # Mark as most recently used
+            self.hits += 1
+            return self.entries[key]
+
+    # Stores a result, evicting the least recently used one if the cache is full
+    def put(self, key, value):
+        with self.lock:
+            self.entries[key] = value
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+    # Removes all results and resets the counters
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+# Runs the analysis of a SpawnCycle
+# The cycle is a list of waves, each being a list of squads of the form {'Cyst': {'Count': 4, 'Raged': False}, ..}
+# GameLength is the index of the game length (0 = Short, 1 = Medium, 2 = Long), same as the Analyze dialog
+class AnalysisEngine(object):
+    def __init__(self, cycle, GameLength, Difficulty, WaveSizeFakes, MaxMonsters, vectorized=False, cache=None):
+        self.cycle = cycle
+        self.params = {'GameLength': GameLength, 'Difficulty': Difficulty, 'WaveSizeFakes': WaveSizeFakes, 'MaxMonsters': MaxMonsters}
+        self.vectorized = vectorized # Whether or not to use the NumPy version of the difficulty calculations
+        self.expanded_squads = {} # Wave ID -> expanded squads. These don't depend on the params, so they're only built once
+        self.squad_weights = {} # Wave ID -> weights of the expanded squads
+        self.cache = cache # Optional AnalysisCache shared between runs
+        self.cancelled = False
+
+    # Stops a run that's in progress (ie: from another thread). The run returns None once it notices
+    def cancel(self):
+        self.cancelled = True
+
+    # Analyzes the whole SpawnCycle
+    # Returns the per-wave stats and difficulty curves (padded out to the next 4/7/10 wave length),
+    # the stats of all waves combined, and the average difficulty of each wave
+    # If given, progress is called with (waves done, total waves) after each wave
+    def run(self, progress=None):
+        wave_stats = []
+        difficulty_data = []
+        for i in range(len(self.cycle)):
+            if self.cancelled:
+                return None
+
+            wave_sample, diff_sample = self.sample_wave(i)
+            wave_stats.append(wave_sample)
+            difficulty_data.append(diff_sample)
+
+            if progress is not None:
+                progress(i+1, len(self.cycle))
+
+        # Add missing data for missing waves
+        if len(self.cycle) not in [4, 7, 10]:
+            if len(self.cycle) < 4:
+                next_interval = 4
+            elif len(self.cycle) < 7:
+                next_interval = 7
+            else:
+                next_interval = 10
+
+            num_to_add = next_interval - len(self.cycle)
+            wave_stats += [None for j in range(num_to_add)]
+            difficulty_data += [[(0.0, 0.0)] for k in range(num_to_add)]
+
+        return {'Waves': wave_stats,
+                'Difficulty': difficulty_data,
+                'Merged': self.merge_wave_stats(wave_stats),
+                'Average Difficulty': self.average_difficulty(difficulty_data)}
+
+    # Combines the stats of every wave into one
+    def merge_wave_stats(self, wave_stats):
+        merged = {'Total': 0,
+                  'Category': {'Trash': 0, 'Medium': 0, 'Large': 0, 'Boss': 0, 'Total': 0}, 
+                  'Name': {'Cyst': 0, 'Alpha Clot': 0, 'Slasher': 0, 'Rioter': 0, 'Gorefast': 0, 'Gorefiend': 0, 'Crawler': 0, 'Elite Crawler': 0,
+                           'Stalker': 0, 'Bloat': 0, 'Husk': 0, 'Siren': 0, 'E.D.A.R Trapper': 0, 'E.D.A.R Blaster': 0, 'E.D.A.R Bomber': 0,
+                           'Quarter Pound': 0, 'Fleshpound': 0, 'Scrake': 0, 'Alpha Scrake': 0, 'Alpha Fleshpound': 0, 'Abomination Spawn': 0, 'King Fleshpound': 0,
+                           'Dr. Hans Volter': 0, 'Patriarch': 0, 'Abomination': 0, 'Matriarch': 0, 'Total': 0},
+                  'Group': {'Clots': 0, 'Gorefasts': 0, 'Crawlers / Stalkers': 0, 'Albino': 0, 'Robots': 0, 'Scrakes': 0, 'Fleshpounds': 0, 'SpawnRage': 0, 'Total': 0},
+                  'SpawnRage': {'Quarter Pound': 0, 'Fleshpound': 0, 'Alpha Fleshpound': 0, 'Total': 0}}
+        
+        for ws in wave_stats:
+            if ws is not None:
+                merged['Total'] += ws['Total']
+                merged['Category'] = self.merge_dicts(merged['Category'], ws['Category'])
+                merged['Name'] = self.merge_dicts(merged['Name'], ws['Name'])
+                merged['Group'] = self.merge_dicts(merged['Group'], ws['Group'])
+                merged['SpawnRage'] = self.merge_dicts(merged['SpawnRage'], ws['SpawnRage'])
+
+        return merged
+
+    # Returns the average difficulty of each wave as (wave number, difficulty) points
+    def average_difficulty(self, difficulty_data):
+        return [(0, 0.0)] + [(i+1, float(sum([y for _, y in difficulty_data[i]])) / float(len(difficulty_data[i]))) for i in range(0, len(difficulty_data))]
+
+    # Returns the WaveSizeMultiplier based on the current WSF
+    def get_wavesize_multiplier(self, wsf):
+        if wsf <= 6:
+            multis = [1.00, 1.00, 2.00, 2.75, 3.50, 4.00, 4.50]
+            return multis[wsf]
+        return 4.50 + ((wsf-6) * _WAVESIZE_DELTA) # WSF > 6
+
+    # Returns the BaseNumZEDs based on the current wave and gamelength
+    def get_base_num_zeds(self, wave_id, gamelength):
+        base_num_zeds = [[25, 32, 35, 42], # Short (4 Wave)
+                         [25, 28, 32, 32, 35, 40, 42], # Medium (7 Wave)
+                         [25, 28, 32, 32, 35, 35, 35, 40, 42, 42]] # Long (10 Wave)
+        return base_num_zeds[gamelength][wave_id]
+
+    # Returns the DifficultyMod
+    def get_difficulty_mod(self, difficulty):
+        multis = [0.85, 1.00, 1.30, 1.70]
+        return multis[difficulty]
+
+    # Returns the number of ZEDs that will spawn in the given wave
+    def get_wave_num_zeds(self, wave_id):
+        base_num_zeds = self.get_base_num_zeds(wave_id, self.params['GameLength'])
+        diffmod = self.get_difficulty_mod(self.params['Difficulty'])
+        wavesize_multi = self.get_wavesize_multiplier(self.params['WaveSizeFakes'])
+        return int((base_num_zeds * diffmod * wavesize_multi) // 1)
+
+    # Returns the cache key for the given wave
+    # The wave's position is part of the key since the wave size depends on it
+    # The vectorized flag isn't, since both paths give the same results
+    def get_cache_key(self, wave_id):
+        wave_key = tuple(tuple((zed_id, zed_data['Count'], zed_data['Raged']) for (zed_id, zed_data) in squad.items()) for squad in self.cycle[wave_id])
+        return (wave_key, wave_id, self.params['GameLength'], self.params['Difficulty'], self.params['WaveSizeFakes'], self.params['MaxMonsters'])
+
+    # Returns analysis data for the given wave, using the cache if there is one
+    def sample_wave(self, wave_id):
+        if self.cache is None:
+            return self.simulate_wave(wave_id)
+
+        key = self.get_cache_key(wave_id)
+        result = self.cache.get(key)
+        if result is None:
+            result = self.simulate_wave(wave_id)
+            self.cache.put(key, result)
+        return result
+
+    # Simulates the given wave and returns its analysis data
+    def simulate_wave(self, wave_id):
+        # Wave is empty!
+        if len(self.cycle[wave_id]) == 0:
+            return None, [(0.0, 0.0)]
+
+        # The number of ZEDs that will be in this wave
+        wave_num_zeds = self.get_wave_num_zeds(wave_id)
+
+        # Expand this wave's squads
+        expanded_squads = self.get_expanded_squads(wave_id)
+        
+        # Simulate the wave!
+        wave_stats = {'Total': wave_num_zeds,
+                      'Category': {'Trash': 0, 'Medium': 0, 'Large': 0, 'Boss': 0, 'Total': 0}, 
+                      'Name': {'Cyst': 0, 'Alpha Clot': 0, 'Slasher': 0, 'Slasher Omega': 0,  'Rioter': 0, 'Gorefast': 0, 'Gorefast Omega': 0, 'Gorefiend': 0, 'Crawler': 0, 'Elite Crawler': 0, 'Tiny Crawler': 0, 'Medium Crawler': 0, 'Big Crawler': 0,
+                               'Huge Crawler': 0, 'Ultra Crawler': 0, 'Stalker': 0, 'Stalker Omega': 0, 'Abomination Spawn': 0, 'Bloat': 0, 'Husk': 0, 'Husk Omega': 0, 'Tiny Husk': 0, 'Siren': 0,
+                               'Siren Omega': 0, 'E.D.A.R Trapper': 0, 'E.D.A.R Blaster': 0, 'E.D.A.R Bomber': 0, 'Quarter Pound': 0, 'Scrake': 0, 'Scrake Omega': 0, 'Tiny Scrake': 0,
+                               'Scrake Emperor': 0, 'Alpha Scrake': 0, 'Fleshpound': 0, 'Fleshpound Omega': 0, 'Alpha Fleshpound': 0, 'King Fleshpound': 0, 'Dr. Hans Volter': 0,
+                               'Patriarch': 0, 'Abomination': 0, 'Matriarch': 0, 'Total': 0},
+                      'Group': {'Clots': 0, 'Gorefasts': 0, 'Crawlers / Stalkers': 0, 'Robots': 0, 'Scrakes': 0, 'Fleshpounds': 0, 'Albino': 0, 'Omega': 0, 'SpawnRage': 0, 'Total': 0},
+                      'SpawnRage': {'Quarter Pound': 0, 'Fleshpound': 0, 'Alpha Fleshpound': 0, 'Total': 0}}
+
+        # The wave is just the expanded squads repeated until it's full, so rather than simulating every spawn
+        # we count each entry as (number of full passes) + (1 if it's within the leftover partial pass)
+        num_passes, num_leftover = divmod(wave_num_zeds, len(expanded_squads))
+        for (j, next_zed) in enumerate(expanded_squads):
+            count = num_passes + (1 if j < num_leftover else 0) # Number of times this ZED gets spawned
+            if count == 0: # Never reached
+                continue
+
+            if isinstance(next_zed, dict): # Special case for enraged ZEDs
+                next_zed = next_zed['Raged'] # This is messy but I honestly can't be bothered anymore
+                zed_info = zeds.zed_info[zeds.raged_variants[next_zed]]
+            else:
+                zed_info = zeds.zed_info[next_zed]
+            flags = zed_info['Flags']
+
+            # Add to category and group stats
+            wave_stats['Category'][zed_info['Category']] += count
+            if zed_info['Group'] is not None:
+                wave_stats['Group'][zed_info['Group']] += count
+            if flags & zeds.FLAG_ALBINO: # Check for albinos
+                wave_stats['Group']['Albino'] += count
+            if flags & zeds.FLAG_OMEGA: # Check for omegas
+                wave_stats['Group']['Omega'] += count
+            if flags & zeds.FLAG_RAGED: # Check for SpawnRage
+                wave_stats['Group']['SpawnRage'] += count
+                wave_stats['SpawnRage'][next_zed] += count
+                wave_stats['SpawnRage']['Total'] += count
+
+            # Add to totals
+            wave_stats['Category']['Total'] += count
+            wave_stats['Group']['Total'] += count
+            wave_stats['Name']['Total'] += count
+            wave_stats['Name'][next_zed] += count
+
+        # Now calculate the difficulty
+        if self.vectorized and np is not None:
+            difficulty_data = [tuple(x) for x in self.sample_difficulty_vectorized(wave_id, wave_num_zeds).tolist()]
+        else:
+            difficulty_data = self.sample_difficulty(wave_id, wave_num_zeds)
+
+        return wave_stats, difficulty_data
+
+    # Returns the modifiers the difficulty score of the given wave is scaled by
+    def get_score_mods(self, wave_id):
+        zed_diff_mod = 1.00 + (0.50 * self.params['Difficulty']) # ZED difficulty modifier: (harder difficulty = stronger attacks / more damage dealt)
+
+        # Wave modifier, based on how far into the game this is.
+        # Earlier waves tend to be harder due to less money/economy
+        # Difficulty also affects this since it changes how much dosh you earn per kill
+        max_wave = {0: 10, 1: 7, 2: 4}
+        doshmod = {0: 1.00, 1: 1.25, 2: 1.50, 3: 1.75}
+        wave_score_mod = doshmod[self.params['Difficulty']] + (float(wave_id+1) / float(max_wave[self.params['GameLength']]))
+
+        # Longer waves tend to be harder due to resources (ammo, etc) having to be further spread out 
+        wsf_mod = 1.50 + (float(self.params['WaveSizeFakes']) / 128.0)
+
+        return zed_diff_mod, wave_score_mod, wsf_mod
+
+    # Returns the difficulty curve for the given wave
+    # Keeps a running sum of the weights of the ZEDs currently alive, so each step is O(1) regardless of MaxMonsters
+    def sample_difficulty(self, wave_id, wave_num_zeds):
+        max_monsters = self.params['MaxMonsters']
+
+        # ZED composition modifier: ZEDs have varying weights
+        squad_weights = self.get_squad_weights(wave_id)
+        (zed_diff_mod, wave_score_mod, wsf_mod) = self.get_score_mods(wave_id)
+
+        j = 0
+        difficulty_data = [(0.0, 0.0)]
+        currently_spawned_weights = deque() # Weights of the ZEDs currently alive, in the order they spawned
+        zed_count = 0 # Running sum of currently_spawned_weights
+
+        # +MM is to account for the "wind down" (killing remaining ZEDs after ZED spawning stops)
+        # In reality we never make it that far though in most cases
+        for i in range(wave_num_zeds + max_monsters):
+            if j < wave_num_zeds: # Still ZEDs left to spawn
+                if len(currently_spawned_weights) == max_monsters: # We've reached MaxMonsters
+                    zed_count -= currently_spawned_weights.popleft() # Remove the first ZED and add the new one at the end
+                next_weight = squad_weights[j % len(squad_weights)] # The wave is the expanded squads repeated until it's full
+                currently_spawned_weights.append(next_weight)
+                zed_count += next_weight
+                j += 1
+            else:
+                if len(currently_spawned_weights) == 0: # We ran out of zeds to pop (because MM is high)
+                    break # Leave early. We had less ZEDs remaining than there were MaxMonsters
+                zed_count -= currently_spawned_weights.popleft() # Remove the first ZED
+
+            # Calculate the final score
+            zed_comp_mod = zed_diff_mod * zed_count
+            difficulty_score = wsf_mod * wave_score_mod * zed_comp_mod
+            if difficulty_score > 750000.0: # Cap Difficulty Score at 750K
+                difficulty_score = 750000.0
+            percent_thru_wave = (float(i+1) / float(wave_num_zeds)) * 100 # How far into the wave this is
+            
+            difficulty_data.append((percent_thru_wave, float(difficulty_score)))
+
+        return difficulty_data
+
+    # Returns the difficulty curve for the given wave as an (N, 2) array of (percent, score)
+    # Same results as sample_difficulty, but computes every step at once from prefix sums of the ZED weights
+    def sample_difficulty_vectorized(self, wave_id, wave_num_zeds):
+        max_monsters = self.params['MaxMonsters']
+
+        # ZED composition modifier: ZEDs have varying weights
+        squad_weights = np.array(self.get_squad_weights(wave_id), dtype=np.int64)
+        (zed_diff_mod, wave_score_mod, wsf_mod) = self.get_score_mods(wave_id)
+
+        # The wave is the expanded squads repeated until it's full, so the total weight of the first n spawns
+        # is (full passes * weight of one pass) + (weight of the leftover partial pass)
+        num_weights = len(squad_weights)
+        squad_prefix = np.concatenate(([0], np.cumsum(squad_weights)))
+        wave_prefix = lambda n: (n // num_weights) * squad_prefix[-1] + squad_prefix[n % num_weights]
+
+        # At step i the alive ZEDs are spawns [first, last). Spawning stops after wave_num_zeds steps,
+        # then one ZED dies per step until none are left (the "wind down")
+        window = min(wave_num_zeds, max_monsters)
+        steps = np.arange(wave_num_zeds + window, dtype=np.int64)
+        last = np.minimum(steps + 1, wave_num_zeds)
+        first = np.maximum(steps + 1 - window, 0)
+        zed_count = wave_prefix(last) - wave_prefix(first)
+
+        # Calculate the final scores
+        difficulty_scores = np.minimum(wsf_mod * wave_score_mod * (zed_diff_mod * zed_count), 750000.0) # Cap Difficulty Score at 750K
+        percent_thru_wave = ((steps + 1) / float(wave_num_zeds)) * 100 # How far into the wave this is
+
+        return np.vstack(([0.0, 0.0], np.column_stack((percent_thru_wave, difficulty_scores))))
+
+    # Analyzes the SpawnCycle for every combination of the given Difficulties, WaveSizeFakes and MaxMonsters
+    # Returns the grid along with the per-wave totals (indexed [difficulty][wsf][wave])
+    # and the per-wave average difficulties (indexed [difficulty][wsf][maxmonsters][wave]), or None if cancelled
+    # If given, progress is called with (grid cells done, total grid cells) after each Difficulty / WaveSizeFakes pair
+    def sweep(self, difficulties, wave_size_fakes, max_monsters, progress=None):
+        (difficulties, wave_size_fakes, max_monsters) = (list(difficulties), list(wave_size_fakes), list(max_monsters))
+        num_cells = len(difficulties) * len(wave_size_fakes)
+        old_params = dict(self.params)
+        totals = []
+        avg_difficulty = []
+        try:
+            for difficulty in difficulties:
+                difficulty_totals = []
+                difficulty_avgs = []
+                for wsf in wave_size_fakes:
+                    if self.cancelled:
+                        return None
+
+                    self.params.update({'Difficulty': difficulty, 'WaveSizeFakes': wsf})
+                    wave_num_zeds = [self.get_wave_num_zeds(i) if len(self.cycle[i]) > 0 else 0 for i in range(len(self.cycle))]
+                    difficulty_totals.append(wave_num_zeds)
+
+                    wsf_avgs = []
+                    for mm in max_monsters:
+                        self.params.update({'MaxMonsters': mm})
+                        wsf_avgs.append([self.sample_average_difficulty(i, wave_num_zeds[i]) for i in range(len(self.cycle))])
+                    difficulty_avgs.append(wsf_avgs)
+
+                    if progress is not None:
+                        progress(len(totals) * len(wave_size_fakes) + len(difficulty_totals), num_cells)
+                totals.append(difficulty_totals)
+                avg_difficulty.append(difficulty_avgs)
+        finally:
+            self.params = old_params # Put the params back however the sweep ends
+
+        return {'Difficulty': difficulties, 'WaveSizeFakes': wave_size_fakes, 'MaxMonsters': max_monsters,
+                'Totals': totals, 'Average Difficulty': avg_difficulty}
+
+    # Returns the average difficulty of the given wave. Same as what average_difficulty gives for the wave
+    def sample_average_difficulty(self, wave_id, wave_num_zeds):
+        if wave_num_zeds == 0: # Wave is empty!
+            return 0.0
+
+        if self.vectorized and np is not None:
+            difficulty_scores = self.sample_difficulty_vectorized(wave_id, wave_num_zeds)[:, 1].tolist()
+        else:
+            difficulty_scores = [y for _, y in self.sample_difficulty(wave_id, wave_num_zeds)]
+        return float(sum(difficulty_scores)) / float(len(difficulty_scores))
+
+    # Returns the expanded squads for the given wave
+    def get_expanded_squads(self, wave_id):
+        if wave_id not in self.expanded_squads:
+            self.expanded_squads[wave_id] = self.expand_squads(self.cycle[wave_id])
+        return self.expanded_squads[wave_id]
+
+    # Returns the difficulty weights of the given wave's expanded squads
+    def get_squad_weights(self, wave_id):
+        if wave_id not in self.squad_weights:
+            self.squad_weights[wave_id] = [zeds.zed_weights[(z if not isinstance(z, dict) else zeds.raged_variants[z['Raged']])] for z in self.get_expanded_squads(wave_id)]
+        return self.squad_weights[wave_id]
+
+    # Merges dict B into A and returns a new dict C
+    # Assumes all integer values
+    def merge_dicts(self, a, b):
+        merged = {}
+        for key in b:
+            if key in a:
+                merged[key] = a[key] + b[key]
+            else:
+                merged[key] = b[key]
+        return merged
+
+    # Expands a wave's Squads into a 1-dimensional list
+    def expand_squads(self, wave):
+        expanded = []
+        for squad in wave:
+            for (zed, data) in squad.items():
+                # Turn {'Clot': 4} into [Clot, Clot, Clot, Clot], etc
+                if 'Enraged' in zed:
+                    zed_name = zed.replace(' (Enraged)', '') # Kinda hacky. A dict entry means an enraged ZED
+                    squad_zeds = [{'Raged': zed_name} for i in range(data['Count'])]
+                else:
+                    squad_zeds = [zed for i in range(data['Count'])]
+                expanded += squad_zeds
+
+        return expanded
+
+
+# Writes the results of AnalysisEngine.sweep to a CSV file
+# One row per grid point and wave, which is easy to pivot into a heatmap
+def export_sweep(results, filename):
+    with open(filename, 'w', newline='') as f_out:
+        writer = csv.writer(f_out)
+        writer.writerow(['Difficulty', 'WaveSizeFakes', 'MaxMonsters', 'Wave', 'Total', 'Average Difficulty'])
+        for (i, difficulty) in enumerate(results['Difficulty']):
+            for (j, wsf) in enumerate(results['WaveSizeFakes']):
+                for (k, mm) in enumerate(results['MaxMonsters']):
+                    for (wave_id, avg) in enumerate(results['Average Difficulty'][i][j][k]):
+                        writer.writerow([difficulty, wsf, mm, wave_id+1, results['Totals'][i][j][wave_id], avg])
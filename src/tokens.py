@@ -0,0 +1,116 @@
+#
+#  tokens.py
+#
+#  Author: Tamari
+#  Date of creation: 10/18/2026
+#
+#  Contains the ZED identifier tokens accepted in SpawnCycle files, and resolves them to ZEDs.
+#  Every token is indexed once at import, so resolving a token is a single lookup
+#
+
+
+##  LICENSE INFORMATION
+##  =======================================================================
+##  This program is free software: you can redistribute it and/or modify
+##  it under the terms of the GNU General Public License as published by
+##  the Free Software Foundation, either version 3 of the License, or
+##  (at your option) any later version.
+##
+##  This program is distributed in the hope that it will be useful,
+##  but WITHOUT ANY WARRANTY; without even the implied warranty of
+##  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+##  GNU General Public License for more details.
+##
+##  You should have received a copy of the GNU General Public License
+##  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+##  =======================================================================
+##
+##  © Tamari 2020-2022
+##  All rights reserved.
+
+
+import zeds
+
+# ZED -> every token (lowercase, without its count or quantifiers) that identifies it
+zed_tokens = {'Cyst': ['cy', 'cys', 'cyst', 'cc', 'clotc'],
+              'Alpha Clot': ['al', 'alp', 'alph', 'alpha', 'ca', 'clota'],
+              'Slasher': ['sl', 'sla', 'slas', 'slash', 'slashe', 'slasher', 'cs', 'clots'],
+              'Crawler': ['cr', 'cra', 'craw', 'crawl', 'crawle', 'crawler'],
+              'Gorefast': ['g', 'go', 'gor', 'gore', 'goref', 'gorefa', 'gorefas', 'gorefast', 'gf'],
+              'Stalker': ['st', 'sta', 'stal', 'stalk', 'stalke', 'stalker'],
+              'Bloat': ['b', 'bl', 'blo', 'bloa', 'bloat'],
+              'Husk': ['h', 'hu', 'hus', 'husk'],
+              'Siren': ['si', 'sir', 'sire', 'siren'],
+              'E.D.A.R Trapper': ['edare', 'etr', 'ee', 'de'],
+              'E.D.A.R Blaster': ['edarl', 'ebl', 'el', 'dl'],
+              'E.D.A.R Bomber': ['edarr', 'ebo', 'er', 'dr'],
+              'Scrake': ['sc', 'scr', 'scra', 'scrak', 'scrake'],
+              'Quarter Pound': ['mi', 'min', 'mini', 'minif', 'minifl', 'minifle', 'minifles', 'miniflesh', 'minifleshp', 'minifleshpo', 'minifleshpou', 'minifleshpoun', 'minifleshpound', 'mf', 'mfp'],
+              'Fleshpound': ['f', 'fl', 'fle', 'fles', 'flesh', 'fleshp', 'fleshpo', 'fleshpou', 'fleshpoun', 'fleshpound', 'fp'],
+              'Alpha Scrake': ['alphasc', 'asc'],
+              'Alpha Fleshpound': ['alphafp', 'afp', 'af'],
+              'Dr. Hans Volter': ['hansvolter', 'hansv', 'hv'],
+              'Patriarch': ['patriarch', 'pat', 'pt'],
+              'Matriarch': ['matriarch', 'mat', 'mt'],
+              'King Fleshpound': ['ki', 'kin', 'king', 'kingf', 'kingfl', 'kingfle', 'kingfles', 'kingflesh', 'kingfleshp', 'kingfleshpo', 'kingfleshpou', 'kingfleshpoun', 'kingfleshpound', 'kf', 'kfp'],
+              'Abomination': ['abomination', 'abm', 'ab'],
+              'Abomination Spawn': ['as'],
+              'Slasher Omega': ['osl', 'omegasl', 'omegasla', 'omegaslas', 'omegaslash', 'omegaslasher'],
+              'Stalker Omega': ['ost', 'omegast', 'omegasta', 'omegastal', 'omegastalk', 'omegastalke', 'omegastalker'],
+              'Siren Omega': ['os', 'omegas', 'omegasi', 'omegasir', 'omegasire', 'omegasiren'],
+              'Fleshpound Omega': ['ofp', 'omegafp', 'omegaf', 'omegafl', 'omegafle', 'omegafles', 'omegaflesh', 'omegafleshp', 'omegafleshpo', 'omegafleshpou', 'omegafleshpoun', 'omegafleshpound'],
+              'Gorefast Omega': ['ogf', 'omegagf', 'omegag', 'omegago', 'omegagor', 'omegagore', 'omegagorf', 'omegagoref', 'omegagorefa', 'omegagorefas', 'omegagorefast'],
+              'Husk Omega': ['ohs', 'omegahs', 'omegah', 'omegahu', 'omegahus', 'omegahusk'],
+              'Tiny Husk': ['mhs', 'minihs', 'minih', 'minihu', 'minihus', 'minihusk'],
+              'Scrake Emperor': ['esc', 'empsc', 'e', 'em', 'emp', 'empe', 'emper', 'empero', 'emperor', 'emperors', 'emperorsc', 'emperorscr', 'emperorscra', 'emperorscrak', 'emperorscrake'],
+              'Scrake Omega': ['osc', 'omegasc', 'omegascr', 'omegascra', 'omegascrak', 'omegascrake'],
+              'Tiny Scrake': ['tsc', 'tinysc', 'tinys', 'tinyscr', 'tinyscra', 'tinyscrak', 'tinyscrake'],
+              'Tiny Crawler': ['crm', 'crawm', 'minic', 'minicr', 'minicra', 'minicraw', 'minicrawl', 'minicrawle', 'minicrawler'],
+              'Medium Crawler': ['mcr', 'crawlermed', 'mediumc', 'mediumcr', 'mediumcra', 'mediumcraw', 'mediumcrawl', 'mediumcrawle', 'mediumcrawler'],
+              'Big Crawler': ['bcr', 'crawlerbig', 'bigc', 'bigcr', 'bigcra', 'bigcraw', 'bigcrawl', 'bigcrawle', 'bigcrawler'],
+              'Huge Crawler': ['hcr', 'crawlerhuge', 'hugec', 'hugecr', 'hugecra', 'hugecraw', 'hugecrawl', 'hugecrawle', 'hugecrawler'],
+              'Ultra Crawler': ['ucr', 'crawlerult', 'ultrac', 'ultracr', 'ultracra', 'ultracraw', 'ultracrawl', 'ultracrawle', 'ultracrawler']}
+
+# ZED -> the ZED it turns into with the albino ('*') quantifier
+albino_variants = {'Alpha Clot': 'Rioter',
+                   'Gorefast': 'Gorefiend',
+                   'Crawler': 'Elite Crawler',
+                   'Scrake': 'Alpha Scrake',
+                   'Fleshpound': 'Alpha Fleshpound'}
+
+
+# Builds the reverse index of the given token table: token -> (ZED, albino-capable, rage-capable)
+# Raises ValueError if any token identifies more than one ZED (or is listed twice), since only one of them could ever be resolved
+def build_index(zed_tokens):
+    index = {}
+    for (zed_id, zed_token_list) in zed_tokens.items():
+        entry = (zed_id, zed_id in albino_variants, zed_id in zeds.raged_variants)
+        for token in zed_token_list:
+            if token in index:
+                raise ValueError(f"Token '{token}' is listed for both '{index[token][0]}' and '{zed_id}'")
+            index.update({token: entry})
+    return index
+
+
+# Returns the ZED identified by the given token (without its count or quantifiers), or None if there isn't one
+# Quantifiers that don't apply to the ZED are ignored
+def resolve(token, albino=False, raged=False):
+    entry = token_index.get(token.lower())
+    if entry is None:
+        return None
+
+    (zed_id, albino_capable, _) = entry
+    if albino and albino_capable:
+        zed_id = albino_variants[zed_id]
+    if raged and zed_id in zeds.raged_variants: # Checked after the albino swap so Alpha Fleshpounds can rage too
+        zed_id = zeds.raged_variants[zed_id]
+    return zed_id
+
+
+token_index = build_index(zed_tokens)
+
+# Every token 'Save' writes has to load back as the same ZED
+for (zed_id, info) in zeds.zed_info.items():
+    token = info['Token'].rstrip('*!')
+    if resolve(token, albino=('*' in info['Token']), raged=('!' in info['Token'])) != zed_id:
+        raise ValueError(f"Token '{info['Token']}' does not resolve to '{zed_id}'")
@@ -0,0 +1,184 @@
+#
+#  validate.py
+#
+#  Author: Tamari
+#  Date of creation: 10/18/2026
+#
+#  Headless batch validation of SpawnCycle libraries.
+#  Checks every SpawnCycle file in a directory tree with the same rules as opening it in the program, spread across all CPU cores.
+#  Does not depend on PyQt5, so it can be run from the command line on servers
+#
+
+
+##  LICENSE INFORMATION
+##  =======================================================================
+##  This program is free software: you can redistribute it and/or modify
+##  it under the terms of the GNU General Public License as published by
+##  the Free Software Foundation, either version 3 of the License, or
+##  (at your option) any later version.
+##
+##  This program is distributed in the hope that it will be useful,
+##  but WITHOUT ANY WARRANTY; without even the implied warranty of
+##  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+##  GNU General Public License for more details.
+##
+##  You should have received a copy of the GNU General Public License
+##  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+##  =======================================================================
+##
+##  © Tamari 2020-2022
+##  All rights reserved.
+
+
+import multiprocessing
+import argparse
+import json
+import time
+import sys
+import os
+import parse
+
+FILE_EXTS = ['.txt', '.json', '.jsonl'] # Files checked by the validator
+_CHUNK_SIZE = 16 # Number of files handed to a worker process at once
+_worker_state = {} # Per-process settings, set up once by init_worker
+
+
+# Returns the paths of every SpawnCycle file under the given directory, in a stable order
+def iter_files(root):
+    for (dirpath, dirnames, filenames) in os.walk(root):
+        dirnames.sort()
+        for filename in sorted(filenames):
+            if os.path.splitext(filename)[1].lower() in FILE_EXTS:
+                yield os.path.join(dirpath, filename)
+
+
+# Returns the SpawnCycles in the given file, the same way the program would open it
+# TXT files hold one SpawnCycle unless archives is set, in which case they can hold many separated by blank lines
+def iter_file_cycles(path, max_errors, archives):
+    if parse.get_stream_format(path) != 'txt' or archives:
+        yield from parse.iter_spawncycles(path, max_errors=max_errors)
+        return
+
+    with open(path, 'r') as f_in:
+        lines = f_in.readlines()
+    cycle = parse.make_cycle(1, None, None, *parse.parse_spawncycle(lines, max_errors=max_errors))
+    cycle.update({'Index': 1})
+    yield cycle
+
+
+# Sets up the settings used by validate_file. Called once in each worker process
+def init_worker(root, max_errors, archives):
+    _worker_state.update({'Root': root, 'Max Errors': max_errors, 'Archives': archives})
+
+
+# Checks every SpawnCycle in the given file and returns the file's part of the report
+def validate_file(path):
+    filename = os.path.relpath(path, _worker_state['Root'])
+    result = {'File': filename, 'Size': 0, 'Cycles': 0, 'Errors': 0, 'Truncated': False, 'Diagnostics': []}
+    try:
+        result.update({'Size': os.path.getsize(path)})
+        for cycle in iter_file_cycles(path, _worker_state['Max Errors'], _worker_state['Archives']):
+            result['Cycles'] += 1
+            result['Errors'] += len(cycle['Diagnostics'])
+            result['Truncated'] = result['Truncated'] or cycle['Diagnostics'].truncated
+            for d in cycle['Diagnostics']:
+                # The waves of FMX SpawnCycles are in a list, so their diagnostics are numbered by wave instead of by line of the file
+                (line_num, wave_num) = (cycle['Line'], d['Line']) if cycle['Slot'] is not None else (d['Line'] if d['Line'] is not None else cycle['Line'], None)
+                result['Diagnostics'].append({'Cycle': cycle['Index'], 'Slot': cycle['Slot'], 'Line': line_num, 'Wave': wave_num, 'Column': d['Column'],
+                                              'Code': d['Code'], 'Message': parse.format_diagnostic(d, filename)})
+    except (OSError, UnicodeDecodeError) as e: # Something went wrong!
+        add_file_error(result, 'unreadable', f"File '{filename}' could not be opened!\n{e}")
+    except Exception as e: # Anything the parser itself trips over. One bad file must never stop the whole scan
+        add_file_error(result, 'unreadable', f"File '{filename}' could not be checked!\n{type(e).__name__}: {e}")
+    result.update({'Valid': result['Errors'] == 0})
+    return result
+
+
+# Adds a problem with the file as a whole to the given file result
+def add_file_error(result, code, message):
+    result['Errors'] += 1
+    result['Diagnostics'].append({'Cycle': None, 'Slot': None, 'Line': None, 'Wave': None, 'Column': None, 'Code': code, 'Message': message})
+
+
+# Checks every SpawnCycle file under the given directory and returns the report:
+# {'Root', 'Files': [per-file results, sorted by name], 'Stats': {totals and throughput}}
+# If given, progress is called with (files done) after each file is checked
+def validate_directory(root, processes=None, max_errors=parse.DEFAULT_MAX_ERRORS, archives=False, progress=None):
+    start_time = time.perf_counter()
+    processes = processes if processes is not None else multiprocessing.cpu_count()
+    initargs = (root, max_errors, archives)
+    pool = multiprocessing.Pool(processes, initializer=init_worker, initargs=initargs) if processes > 1 else None
+    if pool is None:
+        init_worker(*initargs)
+
+    files = []
+    try:
+        results = pool.imap_unordered(validate_file, iter_files(root), chunksize=_CHUNK_SIZE) if pool is not None else map(validate_file, iter_files(root))
+        for result in results:
+            files.append(result)
+            if progress is not None:
+                progress(len(files))
+    finally:
+        if pool is not None:
+            pool.terminate()
+    files.sort(key=lambda result: result['File'])
+
+    elapsed = time.perf_counter() - start_time
+    stats = {'Files': len(files), 'Valid Files': len([f for f in files if f['Valid']]), 'Cycles': sum([f['Cycles'] for f in files]),
+             'Errors': sum([f['Errors'] for f in files]), 'Bytes': sum([f['Size'] for f in files]), 'Elapsed': elapsed}
+    stats.update({'Files/sec': stats['Files'] / elapsed if elapsed > 0.0 else 0.0,
+                  'Cycles/sec': stats['Cycles'] / elapsed if elapsed > 0.0 else 0.0,
+                  'MB/sec': stats['Bytes'] / 1048576 / elapsed if elapsed > 0.0 else 0.0})
+    return {'Root': root, 'Files': files, 'Stats': stats}
+
+
+# Returns the given report as human-readable text. Only files with errors are listed
+def format_report(report):
+    lines = []
+    for result in report['Files']:
+        if result['Valid']:
+            continue
+        errors = f"{result['Errors']}{'+' if result['Truncated'] else ''}"
+        lines.append(f"{result['File']}: {errors} error(s)")
+        for d in result['Diagnostics']:
+            where = []
+            if result['Cycles'] > 1: # Only worth saying which SpawnCycle when there's more than one
+                where.append(f"cycle {d['Cycle']}" + (f" ({d['Slot']})" if d['Slot'] is not None else ''))
+            if d['Line'] is not None:
+                where.append(f"line {d['Line']}")
+            if d['Wave'] is not None:
+                where.append(f"wave {d['Wave']}")
+            prefix = f"{', '.join(where)}: " if len(where) > 0 else ''
+            lines.append('    ' + (prefix + d['Message']).replace('\n', '\n      '))
+        lines.append('')
+
+    stats = report['Stats']
+    lines.append(f"Checked {stats['Files']} file(s) ({stats['Cycles']} SpawnCycles, {stats['Bytes'] / 1048576:.1f} MB) in {stats['Elapsed']:.1f}s "
+                 f"({stats['Files/sec']:.0f} files/sec, {stats['MB/sec']:.1f} MB/sec)")
+    lines.append(f"{stats['Valid Files']} valid, {stats['Files'] - stats['Valid Files']} with errors ({stats['Errors']} error(s) total)")
+    return '\n'.join(lines)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Checks every SpawnCycle file (.txt, .json, .jsonl) in a directory for errors.')
+    parser.add_argument('directory', help='Directory to check. Subdirectories are checked too')
+    parser.add_argument('--report', default=None, help='JSON file to write the full report to')
+    parser.add_argument('--processes', type=int, default=None, help='Number of worker processes (default: one per CPU)')
+    parser.add_argument('--max-errors', type=int, default=parse.DEFAULT_MAX_ERRORS, help=f"Most errors reported per SpawnCycle before moving on (default: {parse.DEFAULT_MAX_ERRORS})")
+    parser.add_argument('--archives', action='store_true', help='Allow TXT files to hold many SpawnCycles, separated by blank lines')
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.directory):
+        parser.error(f"'{args.directory}' is not a directory")
+
+    progress = (lambda done: print(f"{done} file(s) checked", end='\r')) if sys.stdout.isatty() else None # Don't fill up logs with progress lines
+    report = validate_directory(args.directory, processes=args.processes, max_errors=args.max_errors, archives=args.archives, progress=progress)
+    if progress is not None:
+        print(' ' * 40, end='\r')
+    print(format_report(report))
+
+    if args.report is not None:
+        with open(args.report, 'w') as f_out:
+            json.dump(report, f_out, indent=4)
+
+    sys.exit(0 if report['Stats']['Valid Files'] == report['Stats']['Files'] else 1)
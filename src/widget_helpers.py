@@ -31,58 +31,15 @@
 from PyQt5 import QtCore, QtGui, QtWidgets, QtChart
 from functools import partial
 import meta
+import zeds
 import random
 
 _DEF_FONT_FAMILY = 'Consolas'
+_CHART_MAX_POINTS = 1000 # Line charts with more points than this get downsampled
+_CHART_ANIMATION_THRESHOLD = 500 # Line charts with more points than this aren't animated
 
 used_ids = []
 
-# Maps ZED names to their icon path
-icon_mapping = {'Cyst' : 'img/icon_cyst.png',
-                'Slasher' : 'img/icon_slasher.png',
-                'Alpha Clot' : 'img/icon_alphaclot.png',
-                'Rioter' : 'img/icon_rioter.png',
-                'Gorefast' : 'img/icon_gorefast.png',
-                'Gorefiend' : 'img/icon_gorefiend.png',
-                'Crawler' : 'img/icon_crawler.png',
-                'Elite Crawler' : 'img/icon_elitecrawler.png',
-                'Stalker' : 'img/icon_stalker.png',
-                'Bloat' : 'img/icon_bloat.png',
-                'Husk' : 'img/icon_husk.png',
-                'Siren' : 'img/icon_siren.png',
-                'E.D.A.R Trapper' : 'img/icon_edar_emp.png',
-                'E.D.A.R Blaster' : 'img/icon_edar_laser.png',
-                'E.D.A.R Bomber' : 'img/icon_edar_rocket.png',
-                'Scrake' : 'img/icon_scrake.png',
-                'Alpha Scrake' : 'img/icon_alphascrake.png',
-                'Quarter Pound' : 'img/icon_quarterpound.png',
-                'Quarter Pound (Enraged)' : 'img/icon_quarterpound.png',
-                'Fleshpound' : 'img/icon_fleshpound.png',
-                'Fleshpound (Enraged)' : 'img/icon_fleshpound.png',
-                'Alpha Fleshpound' : 'img/icon_alphafleshpound.png',
-                'Alpha Fleshpound (Enraged)' : 'img/icon_alphafleshpound.png',
-                'Dr. Hans Volter' : 'img/icon_hans.png',
-                'Patriarch' : 'img/icon_patriarch.png',
-                'King Fleshpound' : 'img/icon_kingfleshpound.png',
-                'Abomination' : 'img/icon_abomination.png',
-                'Matriarch' : 'img/icon_matriarch.png',
-                'Abomination Spawn' : 'img/icon_abomspawn.png',
-                'Slasher Omega': 'img/icon_slasher_omega.png',
-                'Fleshpound Omega': 'img/icon_fleshpound_omega.png',
-                'Gorefast Omega': 'img/icon_gorefast_omega.png',
-                'Husk Omega': 'img/icon_husk_omega.png',
-                'Tiny Husk': 'img/icon_husk_tiny.png',
-                'Scrake Emperor': 'img/icon_scrake_emperor.png',
-                'Scrake Omega': 'img/icon_scrake_omega.png',
-                'Tiny Scrake': 'img/icon_scrake_tiny.png',
-                'Siren Omega': 'img/icon_siren_omega.png',
-                'Stalker Omega': 'img/icon_stalker_omega.png',
-                'Big Crawler': 'img/icon_crawler_big.png',
-                'Huge Crawler': 'img/icon_crawler_huge.png',
-                'Medium Crawler': 'img/icon_crawler_medium.png',
-                'Tiny Crawler': 'img/icon_crawler_tiny.png',
-                'Ultra Crawler': 'img/icon_crawler_ultra.png'}
-
 
 # Custom QDialog that calls an event when closed
 class CustomDialog(QtWidgets.QDialog):
@@ -106,7 +63,7 @@ class QZedPaneButton(QtWidgets.QPushButton):
         if e.buttons() != QtCore.Qt.LeftButton: # Ignore all except LMB press
             return
         # Change cursor to match the zed moved
-        pm = QtGui.QPixmap(icon_mapping[self.id]).scaled(48, 48)
+        pm = QtGui.QPixmap(get_icon_path(self.id)).scaled(48, 48)
         mimeData = QtCore.QMimeData()
         drag = QtGui.QDrag(self)
         drag.setPixmap(pm)
@@ -131,7 +88,7 @@ class QSquadButton(QtWidgets.QPushButton):
         if e.buttons() != QtCore.Qt.LeftButton: # Ignore all except LMB press
             return
         # Change cursor to match the zed moved
-        pm = QtGui.QPixmap(icon_mapping[self.zed_id]).scaled(48, 48)
+        pm = QtGui.QPixmap(get_icon_path(self.zed_id)).scaled(48, 48)
         mimeData = QtCore.QMimeData()
         drag = QtGui.QDrag(self)
         drag.setPixmap(pm)
@@ -155,21 +112,14 @@ class QSquadButton(QtWidgets.QPushButton):
         self.menu.addAction(remove_action)
 
         # Define Replacements menu
-        zeds = list(icon_mapping.keys())
-        zeds.remove(self.zed_id) # Remove this ZED so it doesn't appear in the menu
+        replacements = [z for z in zeds.zed_names if z != self.zed_id] # Remove this ZED so it doesn't appear in the menu
         replace_menu = QtWidgets.QMenu('Replace ZED with..', self)
         replace_menu.setStyleSheet("color: rgb(255, 255, 255); background-color: rgb(50, 50, 50)")
 
-        cz = ['E.D.A.R Trapper', 'E.D.A.R Blaster', 'E.D.A.R Bomber', 'Alpha Scrake', 'Alpha Fleshpound',
-              'Alpha Fleshpound (Enraged)', 'Dr. Hans Volter', 'Patriarch', 'Abomination', 'Matriarch',
-              'Slasher Omega', 'Gorefast Omega', 'Stalker Omega', 'Tiny Crawler', 'Medium Crawler',
-              'Big Crawler', 'Huge Crawler', 'Ultra Crawler', 'Siren Omega', 'Husk Omega', 'Tiny Husk',
-              'Tiny Scrake', 'Scrake Omega', 'Scrake Emperor', 'Fleshpound Omega', 'Stalker Omega']
-        
-        for z in zeds:
+        for z in replacements:
             action = QtWidgets.QAction(z, self)
             replace_menu.addAction(action)
-            action.triggered.connect(partial(self.replace_zeds, self.wave_id, self.squad_id, [self.zed_id], [z], z in cz))
+            action.triggered.connect(partial(self.replace_zeds, self.wave_id, self.squad_id, [self.zed_id], [z], zeds.is_nonstandard(z)))
 
         self.menu.addMenu(replace_menu)
 
@@ -411,7 +361,7 @@ def set_button_icon(button, icon_path, width, height):
 
 # Returns a ZED icon path
 def get_icon_path(zed_id):
-    return icon_mapping[zed_id]
+    return zeds.zed_info[zed_id]['Icon']
 
 
 # Creates and returns a QLineEdit
@@ -447,10 +397,47 @@ def create_textfield(default, font=None, size_policy=None, style=None, w=28, h=2
     return textfield
     
 
+# Downsamples a line series to at most max_points using Largest-Triangle-Three-Buckets
+# Keeps the first and last points, then picks the point from each bucket that forms the largest triangle
+# with the previously picked point and the average of the next bucket. This keeps the peaks and dips intact
+def downsample_series(data, max_points):
+    if max_points < 3 or len(data) <= max_points: # Nothing to do
+        return data
+
+    sampled = [data[0]]
+    bucket_size = float(len(data) - 2) / (max_points - 2)
+    prev = 0 # Index of the previously picked point
+    for i in range(max_points - 2):
+        # Average point of the next bucket
+        next_start = int((i+1) * bucket_size) + 1
+        next_end = min(int((i+2) * bucket_size) + 1, len(data))
+        next_bucket = data[next_start:next_end]
+        avg_x = sum([x for (x, _) in next_bucket]) / len(next_bucket)
+        avg_y = sum([y for (_, y) in next_bucket]) / len(next_bucket)
+
+        # Pick the point in this bucket with the largest triangle area
+        (prev_x, prev_y) = data[prev]
+        best_area = -1.0
+        best = next_start - 1
+        for j in range(int(i * bucket_size) + 1, next_start):
+            (x, y) = data[j]
+            area = abs((prev_x - avg_x) * (y - prev_y) - (prev_x - x) * (avg_y - prev_y))
+            if area > best_area:
+                best_area = area
+                best = j
+
+        sampled.append(data[best])
+        prev = best
+
+    sampled.append(data[-1])
+    return sampled
+
+
 # Creates and returns a chart of the given type, initialized with the given data
+# Line charts are downsampled to max_points and lose their animations if they're still large
 # Code adapted from https://codeloop.org/pyqtchart-how-to-create-piechart-in-pyqt5/
 # Originally written by Parwiz Forogh, modified by me
-def create_chart(parent, data, title, axis_data=None, chart_type='pie'):
+def create_chart(parent, data, title, axis_data=None, chart_type='pie', max_points=_CHART_MAX_POINTS):
     # Create Pie Chart
     if chart_type == 'pie':
         # Create the data series and initialize it
@@ -485,14 +472,17 @@ def create_chart(parent, data, title, axis_data=None, chart_type='pie'):
 
     # Line Chart
     else:
+        points = downsample_series(data, max_points)
         default_series = QtChart.QLineSeries()
-        for (x, y) in data:
-            sl = default_series.append(x, y)
+        default_series.replace([QtCore.QPointF(x, y) for (x, y) in points]) # Load all points at once
 
         # Create chart
         chart = QtChart.QChart()
         chart.addSeries(default_series)
-        chart.setAnimationOptions(QtChart.QChart.SeriesAnimations)
+        if len(points) > _CHART_ANIMATION_THRESHOLD: # Animating this many points makes scrolling sluggish
+            chart.setAnimationOptions(QtChart.QChart.NoAnimation)
+        else:
+            chart.setAnimationOptions(QtChart.QChart.SeriesAnimations)
         chart.setTitle(title)
         chart.legend().setVisible(False)
         chart.setBackgroundBrush(QtGui.QBrush(QtGui.QColor(225, 225, 225)))
@@ -769,7 +759,7 @@ def create_choice_dialog(parent, title, text, x, y, no=True, cancel_button=False
 
 
 # Creates and returns a simple dialog box with an OK button and checkbox (if specified)
-def create_simple_dialog(parent, title, text, x, y, button=True, button_target=None, checkbox=False):
+def create_simple_dialog(parent, title, text, x, y, button=True, button_target=None, checkbox=False, button_text='OK'):
     dialog = QtWidgets.QDialog()
     dialog.setWindowFlags(QtCore.Qt.CustomizeWindowHint|QtCore.Qt.WindowTitleHint) # Disable X and minimize
     hbox_master = QtWidgets.QHBoxLayout(dialog)
@@ -783,10 +773,11 @@ def create_simple_dialog(parent, title, text, x, y, button=True, button_target=N
     dialog_label.setAlignment(QtCore.Qt.AlignHCenter|QtCore.Qt.AlignTop)
     dialog_label.setStyleSheet("color: rgb(255, 255, 255);")
     dialog_label.setText(text)
+    dialog.label = dialog_label # Save a reference so the text can be updated later
 
     # Set up OK button
     if button:
-        ok_button = QtWidgets.QPushButton('OK')
+        ok_button = QtWidgets.QPushButton(button_text)
         ok_button.setStyleSheet("color: rgb(255, 255, 255);")
         
         sp = QtWidgets.QSizePolicy(QtWidgets.QSizePolicy.Fixed, QtWidgets.QSizePolicy.Fixed)
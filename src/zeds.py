@@ -0,0 +1,111 @@
+#
+#  zeds.py
+#
+#  Author: Tamari
+#  Date of creation: 10/18/2026
+#
+#  Registry of every ZED and its attributes
+#
+
+
+##  LICENSE INFORMATION
+##  =======================================================================
+##  This program is free software: you can redistribute it and/or modify
+##  it under the terms of the GNU General Public License as published by
+##  the Free Software Foundation, either version 3 of the License, or
+##  (at your option) any later version.
+##
+##  This program is distributed in the hope that it will be useful,
+##  but WITHOUT ANY WARRANTY; without even the implied warranty of
+##  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+##  GNU General Public License for more details.
+##
+##  You should have received a copy of the GNU General Public License
+##  along with this program.  If not, see <https://www.gnu.org/licenses/>.
+##  =======================================================================
+##
+##  © Tamari 2020-2022
+##  All rights reserved.
+
+
+# ZED flags. A ZED can have any combination of these
+FLAG_ALBINO = 1 << 0
+FLAG_OMEGA = 1 << 1
+FLAG_CUSTOM = 1 << 2 # Not part of the vanilla ZED set
+FLAG_RAGED = 1 << 3 # SpawnRaged variant of another ZED
+
+# Every ZED that SpawnCycler knows about. A ZED's integer ID is its position in this list
+# Name, Save Token, Category, Group, Flags, Difficulty Weight, Icon
+zed_table = [('Cyst', 'CY', 'Trash', 'Clots', 0, 300, 'img/icon_cyst.png'),
+             ('Alpha Clot', 'AL', 'Trash', 'Clots', 0, 335, 'img/icon_alphaclot.png'),
+             ('Slasher', 'SL', 'Trash', 'Clots', 0, 320, 'img/icon_slasher.png'),
+             ('Rioter', 'AL*', 'Trash', 'Clots', FLAG_ALBINO, 450, 'img/icon_rioter.png'),
+             ('Gorefast', 'GF', 'Trash', 'Gorefasts', 0, 350, 'img/icon_gorefast.png'),
+             ('Gorefiend', 'GF*', 'Trash', 'Gorefasts', FLAG_ALBINO, 400, 'img/icon_gorefiend.png'),
+             ('Crawler', 'CR', 'Trash', 'Crawlers / Stalkers', 0, 350, 'img/icon_crawler.png'),
+             ('Elite Crawler', 'CR*', 'Trash', 'Crawlers / Stalkers', FLAG_ALBINO, 400, 'img/icon_elitecrawler.png'),
+             ('Stalker', 'ST', 'Trash', 'Crawlers / Stalkers', 0, 375, 'img/icon_stalker.png'),
+             ('Bloat', 'BL', 'Medium', None, 0, 700, 'img/icon_bloat.png'),
+             ('Husk', 'HU', 'Medium', None, 0, 1000, 'img/icon_husk.png'),
+             ('Siren', 'SI', 'Medium', None, 0, 900, 'img/icon_siren.png'),
+             ('E.D.A.R Trapper', 'DE', 'Medium', 'Robots', FLAG_CUSTOM, 1100, 'img/icon_edar_emp.png'),
+             ('E.D.A.R Blaster', 'DL', 'Medium', 'Robots', FLAG_CUSTOM, 1200, 'img/icon_edar_laser.png'),
+             ('E.D.A.R Bomber', 'DR', 'Medium', 'Robots', FLAG_CUSTOM, 1100, 'img/icon_edar_rocket.png'),
+             ('Quarter Pound', 'MF', 'Large', 'Fleshpounds', 0, 3000, 'img/icon_quarterpound.png'),
+             ('Quarter Pound (Enraged)', 'MF!', 'Large', 'Fleshpounds', FLAG_RAGED, 4000, 'img/icon_quarterpound.png'),
+             ('Fleshpound', 'FP', 'Large', 'Fleshpounds', 0, 4000, 'img/icon_fleshpound.png'),
+             ('Fleshpound (Enraged)', 'FP!', 'Large', 'Fleshpounds', FLAG_RAGED, 5000, 'img/icon_fleshpound.png'),
+             ('Scrake', 'SC', 'Large', 'Scrakes', 0, 3000, 'img/icon_scrake.png'),
+             ('Alpha Scrake', 'SC*', 'Large', 'Scrakes', FLAG_ALBINO | FLAG_CUSTOM, 4000, 'img/icon_alphascrake.png'),
+             ('Alpha Fleshpound', 'FP*', 'Large', 'Fleshpounds', FLAG_ALBINO | FLAG_CUSTOM, 3000, 'img/icon_alphafleshpound.png'),
+             ('Alpha Fleshpound (Enraged)', 'FP*!', 'Large', 'Fleshpounds', FLAG_ALBINO | FLAG_CUSTOM | FLAG_RAGED, 4000, 'img/icon_alphafleshpound.png'),
+             ('Abomination Spawn', 'AS', 'Trash', None, 0, 200, 'img/icon_abomspawn.png'),
+             ('King Fleshpound', 'KF', 'Boss', None, 0, 8000, 'img/icon_kingfleshpound.png'),
+             ('Dr. Hans Volter', 'HV', 'Boss', None, FLAG_CUSTOM, 8000, 'img/icon_hans.png'),
+             ('Patriarch', 'PT', 'Boss', None, FLAG_CUSTOM, 7000, 'img/icon_patriarch.png'),
+             ('Abomination', 'AB', 'Boss', None, FLAG_CUSTOM, 8000, 'img/icon_abomination.png'),
+             ('Matriarch', 'MT', 'Boss', None, FLAG_CUSTOM, 10000, 'img/icon_matriarch.png'),
+             ('Slasher Omega', 'OSL', 'Trash', 'Clots', FLAG_OMEGA, 335, 'img/icon_slasher_omega.png'),
+             ('Gorefast Omega', 'OGF', 'Trash', 'Gorefasts', FLAG_OMEGA, 375, 'img/icon_gorefast_omega.png'),
+             ('Stalker Omega', 'OST', 'Trash', 'Crawlers / Stalkers', FLAG_OMEGA, 425, 'img/icon_stalker_omega.png'),
+             ('Tiny Crawler', 'CRM', 'Trash', 'Crawlers / Stalkers', FLAG_OMEGA, 325, 'img/icon_crawler_tiny.png'),
+             ('Medium Crawler', 'MCR', 'Trash', 'Crawlers / Stalkers', FLAG_OMEGA, 350, 'img/icon_crawler_medium.png'),
+             ('Big Crawler', 'BCR', 'Trash', 'Crawlers / Stalkers', FLAG_OMEGA, 375, 'img/icon_crawler_big.png'),
+             ('Huge Crawler', 'HCR', 'Trash', 'Crawlers / Stalkers', FLAG_OMEGA, 400, 'img/icon_crawler_huge.png'),
+             ('Ultra Crawler', 'UCR', 'Trash', 'Crawlers / Stalkers', FLAG_OMEGA, 450, 'img/icon_crawler_ultra.png'),
+             ('Siren Omega', 'OS', 'Medium', None, FLAG_OMEGA, 1000, 'img/icon_siren_omega.png'),
+             ('Husk Omega', 'OHS', 'Medium', None, FLAG_OMEGA, 1100, 'img/icon_husk_omega.png'),
+             ('Tiny Husk', 'MHS', 'Medium', None, FLAG_OMEGA, 700, 'img/icon_husk_tiny.png'),
+             ('Scrake Omega', 'OSC', 'Large', 'Scrakes', FLAG_OMEGA, 3500, 'img/icon_scrake_omega.png'),
+             ('Scrake Emperor', 'ESC', 'Large', 'Scrakes', FLAG_OMEGA, 4000, 'img/icon_scrake_emperor.png'),
+             ('Tiny Scrake', 'TSC', 'Large', 'Scrakes', FLAG_OMEGA, 2500, 'img/icon_scrake_tiny.png'),
+             ('Fleshpound Omega', 'OFP', 'Large', 'Fleshpounds', FLAG_OMEGA, 5000, 'img/icon_fleshpound_omega.png')]
+
+# Lookup tables built from the table above
+zed_names = [] # ID -> Name
+zed_info = {} # Name -> all attributes
+zed_flags = {} # Name -> flags. Used in the hot loops
+zed_weights = {} # Name -> difficulty weight
+raged_variants = {} # Name -> SpawnRaged version of the ZED (ie: 'Fleshpound' -> 'Fleshpound (Enraged)')
+for (zed_id, (name, token, category, group, flags, weight, icon)) in enumerate(zed_table):
+    zed_names.append(name)
+    zed_info.update({name: {'ID': zed_id, 'Token': token, 'Category': category, 'Group': group, 'Flags': flags, 'Weight': weight, 'Icon': icon}})
+    zed_flags.update({name: flags})
+    zed_weights.update({name: weight})
+    if flags & FLAG_RAGED:
+        raged_variants.update({name.replace(' (Enraged)', ''): name})
+
+
+# Returns True if the given ZED is an albino
+def is_albino(zed_id):
+    return bool(zed_flags.get(zed_id, 0) & FLAG_ALBINO)
+
+
+# Returns True if the given ZED is from the Omega ZED set
+def is_omega(zed_id):
+    return bool(zed_flags.get(zed_id, 0) & FLAG_OMEGA)
+
+
+# Returns True if the given ZED is from the Custom or Omega ZED sets (ie: not supported by most CD builds)
+def is_nonstandard(zed_id):
+    return bool(zed_flags.get(zed_id, 0) & (FLAG_CUSTOM | FLAG_OMEGA))